@@ -10,6 +10,7 @@ from datetime import datetime, timedelta
 import math
 import os
 from dotenv import load_dotenv
+from seeder_seats import SeatOccupancy
 
 # -------------------------------------------------------------------------------------
 # 1. 환경 설정 및 상수 정의
@@ -145,6 +146,7 @@ def generate_dummy_data(session, num_records):
 
     entities_to_add = []
     current_benefit_id = 100000
+    seat_index = SeatOccupancy(seat_ids)  # 스케줄별 좌석 점유 인덱스 (중복 예매 방지)
 
     print(f"--- {num_records}개의 트랜잭션 데이터 생성 시작 (배치 사이즈: {BATCH_SIZE}) ---")
 
@@ -173,13 +175,12 @@ def generate_dummy_data(session, num_records):
         session.flush()  # reservation_id 획득
 
         # ReservationSeat + TicketDiscount
-        used_seat_ids_in_schedule = set()
-        available_seat_ids = seat_ids.copy()
-        random.shuffle(available_seat_ids)
+        # 스케줄의 빈 좌석 num_seats개 (좌석 목록 전체를 복사/셔플하지 않음)
+        selected_seat_ids = seat_index.draw(schedule_id, num_seats)
 
         for s in range(num_seats):
             # 중복 방지
-            selected_seat_id = available_seat_ids.pop()
+            selected_seat_id = selected_seat_ids[s]
             seat = ReservationSeat(
                 schedule_id=schedule_id,
                 seat_id=selected_seat_id
@@ -1,15 +1,34 @@
 # data_seeder_reservation_only.py
 
-from sqlalchemy import create_engine, Column, Integer, String, DECIMAL, ForeignKey, DateTime, Time, Date, PrimaryKeyConstraint, text, BigInteger, UniqueConstraint
+from sqlalchemy import create_engine, Column, Integer, String, DECIMAL, DateTime, Time, PrimaryKeyConstraint, text, BigInteger, UniqueConstraint
 from sqlalchemy.dialects.mysql import TINYINT
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from faker import Faker
 import random
 from datetime import datetime, timedelta
-import math
 import os
+import argparse
+from functools import partial
+from contextlib import nullcontext
 from dotenv import load_dotenv
+from seeder_ids import IdBlockAllocator, next_benefit_id, current_high_water_marks
+from seeder_writer import WRITE_MODE_ORM, WRITE_MODE_CORE, WRITE_MODES, create_row_writer
+from seeder_batching import AdaptiveBatchController, add_batch_arguments
+from seeder_streaming import (DEFAULT_MEMORY_CEILING_MB, MemoryBoundedBatchController, add_streaming_arguments,
+                              freeze_reference_objects, unfreeze_reference_objects)
+from seeder_pricing import TicketPriceMatrix, count_age_types
+from seeder_money import to_cents
+from seeder_discounts import DiscountPolicyIndex
+from seeder_pii import PiiPool
+from seeder_seats import SeatOccupancy, partition_seat_ids, occupy_existing_seats
+from seeder_reference import load_reference
+from seeder_options import SeederOptions
+from seeder_sharding import add_base_time_argument, run_sharded, seed_base_time
+from seeder_sampling import WeightedSampler, hotspot_sampler
+from seeder_reset import RESET_TRUNCATE, RESET_SWAP, RESET_MODES, reset_tables, ShadowTableSwap
+from seeder_metrics import create_metrics, add_metrics_arguments
+from seeder_bulkload import bulk_load_mode
 
 # -------------------------------------------------------------------------------------
 # 1. 환경 설정 및 상수 정의
@@ -26,10 +45,10 @@ DB_PORT = os.getenv("DB_PORT", "3306")
 DATABASE_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}?charset=utf8mb4"
 
 Base = declarative_base()
-BATCH_SIZE = 500
 
-# ✅ 기본 티켓 가격
-BASE_TICKET_PRICE = 13000.00
+# ✅ 기본 티켓 가격 (금액은 모두 정수 센트로 계산하고 writer가 DECIMAL로 변환)
+BASE_TICKET_PRICE = 1300000   # 13,000.00원
+POINT_DISCOUNT = 1400000      # 포인트 할인 고정 14,000.00원
 
 # 할인/결제 코드 상수
 DISCOUNT_POINT_CODE = "01101"
@@ -45,6 +64,12 @@ AGE_TYPE_YOUTH = "00202"
 AGE_TYPE_SENIOR = "00203"
 AGE_TYPE_PRIME = "00204"
 AGE_TYPE_CODES = [AGE_TYPE_ADULT, AGE_TYPE_YOUTH, AGE_TYPE_SENIOR, AGE_TYPE_PRIME]
+AGE_TYPE_INDEXES = range(len(AGE_TYPE_CODES))  # 가격 행렬의 열 인덱스
+
+# 예매 관련 테이블만 삭제 (order 테이블은 제외, 역순이 INSERT 순서)
+TABLES_TO_DELETE = ['reservation_seat_list', 'payment_discount', 'ticket_discount', 
+                    'payment_card', 'payment_bank_transfer', 'payment_mobile', 
+                    'payment', 'reservation_count', 'reservation_seat', 'reservation']
 
 # -------------------------------------------------------------------------------------
 # 2. ORM 모델 정의 (데이터 삽입 및 조회에 필요한 모델만 정의)
@@ -146,148 +171,78 @@ class ScreenSchedule(Base):
 # -------------------------------------------------------------------------------------
 # 3. 데이터 생성 함수
 
-def apply_discount_policy(origin_amount, policy_id, policy_map):
-    """discount_policy 테이블의 정책을 적용하여 할인 금액을 계산합니다."""
-    policy = policy_map.get(policy_id)
-    if not policy or origin_amount < policy['min_price']:
-        return 0.0
-
-    discount = 0.0
-    
-    # 1. 고정 금액 할인
-    if policy['amount'] is not None:
-        discount = policy['amount']
-    # 2. 비율 할인
-    elif policy['percent'] is not None:
-        discount = origin_amount * policy['percent']
-    
-    # 3. 최대 할인 금액 제한 적용
-    if policy['max_benefit_amount'] is not None:
-        discount = min(discount, policy['max_benefit_amount'])
-        
-    return round(discount, 2)
-
-
-def generate_random_account_number():
-    """임의의 10~14자리 숫자 형태의 계좌 번호를 생성합니다."""
-    # 0으로 시작하지 않는 숫자 문자열 생성
-    # 계좌 번호가 길이를 초과하지 않도록 10~14자리로 지정
-    length = random.randint(10, 14)
-    if length > 0:
-        return str(random.randint(1, 9)) + ''.join(random.choices('0123456789', k=length - 1))
-    return '1234567890'
-
-
-def calculate_coupon_discount(ticket_price, coupon_id, coupon_map):
-    """쿠폰 정책에 따라 할인 금액을 계산합니다."""
-    coupon = coupon_map.get(coupon_id)
-    if not coupon:
-        return 0.0
-
-    # 최소 사용 금액 확인
-    if ticket_price < coupon['min_price']:
-        return 0.0
-
-    discount = 0.0
-    
-    if coupon['type'] == 0: # 0: 할인 금액 (고정값)
-        discount = coupon['value']
-    elif coupon['type'] == 1: # 1: 할인율 (비율)
-        discount = ticket_price * (coupon['value'] / 100.0) # discount_value를 %로 가정
-        
-        # 최대 할인 금액 제한 적용
-        if coupon['max_amount'] is not None:
-            discount = min(discount, coupon['max_amount'])
-            
-    return round(discount, 2)
-
-
-def calculate_final_ticket_price(schedule_id, age_type_code, 
-                                 schedule_map, screen_type_map, 
-                                 screen_time_map, age_type_map):
-    """모든 가격 변동 요소를 고려하여 최종 티켓 가격을 계산합니다."""
-    
-    screen_type, screen_time = schedule_map.get(schedule_id, (None, None))
-    if not screen_type or not screen_time:
-        return BASE_TICKET_PRICE
-
-    final_price = BASE_TICKET_PRICE 
-    
-    # 상영관 유형 가격 적용
-    screen_price = screen_type_map.get(screen_type, 0.00)
-    final_price += screen_price 
-
-    # 상영 시간 가감 가격 적용
-    time_adjustment = screen_time_map.get(screen_time, 0.00)
-    final_price += time_adjustment
-    
-    # 연령별 가감 가격 적용
-    age_adjustment = age_type_map.get(age_type_code, 0.00)
-    final_price += age_adjustment
-    
-    return max(0.0, final_price) 
-
-
-def generate_dummy_data(session, num_records):
+def apply_discount_policy(origin_amount, policy_index):
+    """결제 금액에 적용 가능한 discount_policy 정책 하나를 골라 (policy_id | None, 할인 금액)을 반환합니다 (정수 센트).
+
+    최소 금액 이상인 정책 중에서 고르고, 고정 금액 또는 비율 할인에 최대 할인 한도를 적용합니다.
+    """
+    positions, discounts = policy_index.discounts([None], [origin_amount])
+    position = positions[0]
+    return (None if position is None else policy_index.policy_ids[position]), discounts[0]
+
+
+def calculate_coupon_discounts(ticket_price, count, coupon_index):
+    """좌석 count개에 쿠폰을 하나씩 적용한 할인 금액 리스트를 한 번에 계산합니다 (금액은 정수 센트).
+
+    좌석 가격에 적용 가능한(최소 사용 금액 이상) 쿠폰 중에서 고르며, 없으면 0 입니다.
+    0: 고정 금액, 1: discount_value% 할인(최대 할인 금액 한도).
+    """
+    return coupon_index.discounts([None] * count, [ticket_price] * count)[1]
+
+
+def generate_dummy_data(session, num_records, options=None):
+    """예매 트랜잭션 더미 데이터를 num_records건 생성합니다.
+
+    options(SeederOptions)로 쓰기 방식, 시드, 샤드 범위, 배치/계측 설정을 받습니다 (생략 시 기본값).
+    vectorized, async_writer, checkpoint는 data_seeder_unified에만 있습니다.
+    preallocate_ids이면 reservation/reservation_seat/payment의 PK를 미리 예약한 블록에서 할당하고,
+    core/load_data 쓰기는 항상 PK를 사전 할당합니다. 모든 시각은 options.base_time(생략 시 seed에서 파생) 기준이라
+    같은 옵션이면 같은 데이터가 나옵니다. append이면 기존 reservation_seat의 좌석을 점유 처리한 뒤 생성합니다.
+    좌석은 스케줄별 점유 인덱스에서 빈 좌석만 뽑으므로 같은 스케줄의 좌석이 중복 예매되지 않습니다.
+    seat_partition=(샤드 번호, 샤드 수)이면 그 샤드 몫의 좌석만 사용합니다.
+    streaming이면 배치 버퍼만 RSS 상한 안에서 커밋합니다 (참조 데이터는 그대로 메모리에 있음).
+    """
+    options = options or SeederOptions()
+    if options.vectorized or options.async_writer or options.checkpoint:
+        raise ValueError("reservation_only 시더는 vectorized / async_writer / checkpoint 옵션을 지원하지 않습니다 (data_seeder_unified 사용).")
+    seed, write_mode, metrics = options.seed, options.write_mode, options.metrics
+    if options.streaming and write_mode == WRITE_MODE_ORM:
+        raise ValueError("스트리밍 모드는 core/load_data 쓰기 방식에서만 사용할 수 있습니다.")
     faker = Faker('ko_KR')
-    random.seed(42)
+    faker.seed_instance(seed)
+    random.seed(seed)
+    pii = PiiPool(faker, seed)
+    now = options.base_time or seed_base_time(seed)
     
     # ------------------ DB 참조 데이터 및 가격 정책 조회 ------------------
-
-    schedule_data = session.execute(
-       text( "SELECT schedule_id, screen_type, screen_time FROM screen_schedule")
-    ).fetchall()
-    schedule_map = {row[0]: (row[1], row[2]) for row in schedule_data}
-    schedule_ids = list(schedule_map.keys())
+    # 스케줄/좌석/회원/정책은 서버 사이드 커서로 array에 담고, 원본 테이블 지문이 같으면 디스크 캐시 사용
+    schedule_ids, screen_type_column, screen_time_column = load_reference(session, 'schedule')
 
     screen_type_prices = session.execute(text("SELECT screen_type, price FROM screen_type")).fetchall()
-    screen_type_map = {row[0]: float(row[1]) for row in screen_type_prices}
+    screen_type_map = {row[0]: to_cents(row[1]) for row in screen_type_prices}
 
     screen_time_adjustments = session.execute(text("SELECT screen_time, adjust_price FROM screen_time")).fetchall()
-    screen_time_map = {row[0]: float(row[1]) for row in screen_time_adjustments}
+    screen_time_map = {row[0]: to_cents(row[1]) for row in screen_time_adjustments}
 
     age_type_adjustments = session.execute(text("SELECT age_type, adjust_price FROM age_type")).fetchall()
-    age_type_map = {row[0]: float(row[1]) for row in age_type_adjustments}
-    
-    seat_ids = [row[0] for row in session.execute(text("SELECT seat_id FROM seat")).fetchall()]
-    user_ids = [row[0] for row in session.execute(text("SELECT user_id FROM user")).fetchall()]
-    policy_id = 1 
-
-    policy_data = session.execute(
-        text("SELECT policy_id, discount_amount, discount_percent, min_price, max_benefit_amount FROM discount_policy")
-    ).fetchall()
-
-    policy_map = {
-        row[0]: {
-            'amount': float(row[1]) if row[1] else None,
-            'percent': float(row[2]) if row[2] else None,
-            'min_price': float(row[3]),
-            'max_benefit_amount': float(row[4]) if row[4] else None,
-        }
-        for row in policy_data
-    }
-    policy_ids = list(policy_map.keys())
-    policy_id = random.choice(policy_ids) if policy_ids else 1 # 사용할 정책 ID 랜덤 선택
-
-    # 쿠폰 정책 데이터 조회
-    coupon_data = session.execute(
-        text("SELECT coupon_id, discount_type, discount_value, max_discount_amount, min_price FROM coupon")
-    ).fetchall()
+    age_type_map = {row[0]: to_cents(row[1]) for row in age_type_adjustments}
+
+    # (schedule_id, 연령) 별 최종 티켓 가격을 한 번만 계산
+    price_matrix = TicketPriceMatrix(schedule_ids, screen_type_column, screen_time_column,
+                                     screen_type_map, screen_time_map, age_type_map, BASE_TICKET_PRICE, AGE_TYPE_CODES)
     
-    # coupon_id를 키로 하는 딕셔너리로 저장
-    coupon_map = {
-        row[0]: {
-            'type': row[1], # 0: 금액, 1: 비율
-            'value': float(row[2]) if row[2] else 0.0,
-            'max_amount': float(row[3]) if row[3] else None,
-            'min_price': float(row[4]),
-        }
-        for row in coupon_data
-    }
-    coupon_ids = list(coupon_map.keys())
+    seat_ids = partition_seat_ids(load_reference(session, 'seat')[0], options.seat_partition)
+    user_ids = load_reference(session, 'user')[0]
+
+    # 정책 인덱스 (이 시더는 discount_percent 값을 그대로 배율로 쓰고, 제휴사와 관계없이 정책을 고름)
+    policy_index = DiscountPolicyIndex.from_policy_columns(load_reference(session, 'discount_policy'),
+                                                           percent_rate=1.0, group_by_partner=False)
+
+    # 쿠폰 인덱스 (discount_type 0: 금액, 1: 비율)
+    coupon_index = DiscountPolicyIndex.from_coupon_columns(load_reference(session, 'coupon'))
     
-    if not coupon_ids:
-        # 쿠폰 데이터가 없으면 쿠폰 할인을 비활성화하기 위해 임의의 ID를 설정
+    if not len(coupon_index):
+        # 쿠폰 데이터가 없으면 쿠폰 할인은 항상 0
         print("경고: coupon 테이블에 데이터가 없어 쿠폰 할인이 적용되지 않습니다.")
 
 
@@ -295,127 +250,124 @@ def generate_dummy_data(session, num_records):
     if not schedule_ids or not seat_ids or not user_ids:
         raise Exception("필수 데이터(schedule, seat, user)가 없습니다. 먼저 기본 데이터를 생성하세요.")
 
-    entities_to_add = []
-    current_benefit_id = 100000
-
-    print(f"--- {num_records}개의 예매 트랜잭션 데이터 생성 시작 (배치 사이즈: {BATCH_SIZE}) ---")
+    # 핫스팟 분포: 인기 회원/스케줄에 선택이 몰리도록 (hotspot_skew=0 이면 균등 random.choice)
+    draw_user = hotspot_sampler(user_ids, options.hotspot_skew).draw if options.hotspot_skew else partial(random.choice, user_ids)
+    draw_schedule = hotspot_sampler(schedule_ids, options.hotspot_skew).draw if options.hotspot_skew else partial(random.choice, schedule_ids)
+
+    if options.id_ranges:
+        current_benefit_id = options.id_ranges['ticket_discount'].start
+        id_allocator = IdBlockAllocator.from_ranges(options.id_ranges)
+    else:
+        current_benefit_id = next_benefit_id(session)
+        id_allocator = None
+        if options.preallocate_ids or write_mode != WRITE_MODE_ORM:
+            id_allocator = IdBlockAllocator.from_session(session, ['reservation', 'reservation_seat', 'payment'])
+    if metrics:
+        metrics.lap('reference_load')
+    writer = create_row_writer(session, write_mode, id_allocator, reversed(TABLES_TO_DELETE), metrics, options.writer_threads)
+    if options.batch_controller:
+        batcher = options.batch_controller
+    elif options.streaming:
+        batcher = MemoryBoundedBatchController(ceiling_mb=DEFAULT_MEMORY_CEILING_MB)
+    else:
+        batcher = AdaptiveBatchController()
+    # 가중치 분포 (루프 밖에서 한 번만 생성)
+    user_type_sampler = WeightedSampler([True, False], [80, 20])
+    age_type_sampler = WeightedSampler(AGE_TYPE_INDEXES, [60, 25, 10, 5])   # 성인, 청소년, 경로, 우대
+    payment_method_sampler = WeightedSampler(['CARD', 'BANK', 'MOBILE'], [70, 10, 20])
+    # 스케줄별 좌석 점유 인덱스 (중복 예매 방지)
+    seat_index = SeatOccupancy(seat_ids)
+    # 기존 데이터에 이어 붙일 때(--append) 이미 팔린 좌석은 점유 처리
+    if options.append:
+        occupy_existing_seats(session, seat_index)
+    if options.streaming:
+        # 참조 데이터와 정책 인덱스는 실행 내내 살아 있으므로 GC 추적 대상에서 뺌
+        freeze_reference_objects()
+        if isinstance(batcher, MemoryBoundedBatchController):
+            # 참조 데이터만으로 RSS 상한을 넘으면 시작하지 않고 중단
+            batcher.check_floor()
+
+    print(f"--- {num_records}개의 예매 트랜잭션 데이터 생성 시작 (배치: {batcher}, 쓰기 모드: {write_mode}) ---")
 
     for i in range(1, num_records+1):
         
         # ------------------ ✅ 회원/비회원 비율 설정 ------------------
         # 회원 80%, 비회원 20%
-        is_user = random.choices([True, False], weights=[80, 20], k=1)[0]
-        user_id = random.choice(user_ids) if is_user and user_ids else None
+        is_user = user_type_sampler.draw()
+        user_id = draw_user() if is_user else None
         non_user_id = random.randint(1, 1000) if not is_user else None
         
         # ------------------ ✅ 예매 트랜잭션 고정 설정 ------------------
         payment_type_choice = 0 # 0: 영화 예매로 고정
-        total_discount_amount = 0.0
+        total_discount_amount = 0
         reservation_id = None
         
         # ------------------ 0. 예매 데이터 생성 ------------------
         
         num_seats = random.randint(1, 4)
-        schedule_id = random.choice(schedule_ids)
-        
-        final_reservation_price = 0.0
-        age_count_map = {}
+        schedule_id = draw_schedule()
+        # 매진된 스케줄이면 (핫스팟 분포에서 인기 스케줄) 좌석이 남은 스케줄로 대체
+        schedule_id = seat_index.first_available(schedule_ids, schedule_id, num_seats)
         
         # 연령 비율 (성인 60, 청소년 25, 경로 10, 우대 5)
-        age_types_for_seats = random.choices(
-            AGE_TYPE_CODES, 
-            weights=[60, 25, 10, 5], 
-            k=num_seats
-        )
+        age_indexes = age_type_sampler.draws(num_seats)
 
-        for age_type in age_types_for_seats:
-            # 동적 가격 계산
-            ticket_price = calculate_final_ticket_price(
-                schedule_id, age_type, 
-                schedule_map, screen_type_map, 
-                screen_time_map, age_type_map
-            )
-            final_reservation_price += ticket_price
-            
-            if age_type not in age_count_map:
-                age_count_map[age_type] = {'count': 0, 'price': ticket_price}
-            age_count_map[age_type]['count'] += 1
+        # 가격 행렬에서 스케줄의 연령별 가격 조회
+        price_row = price_matrix.row(schedule_id)
+        final_reservation_price = 0
+        for k in age_indexes:
+            final_reservation_price += price_row[k]
 
-        # Reservation 테이블 생성
-        reservation = Reservation(
+        # Reservation 테이블 생성 (좌석/좌석 할인 row도 같은 시각, DB 기본값 datetime.now를 쓰지 않음)
+        reserved_at = now - timedelta(hours=random.randint(1,500))
+        reservation_id = writer.add(Reservation,
             schedule_id=schedule_id,
             user_id=user_id,
             non_user_id=non_user_id,
             price=final_reservation_price,
             status=1,
-            created_at=datetime.now() - timedelta(hours=random.randint(1,500))
+            created_at=reserved_at
         )
-        session.add(reservation)
-        session.flush()
-        reservation_id = reservation.reservation_id
 
         # ReservationSeat + TicketDiscount 생성
-        available_seat_ids = seat_ids.copy()
-        random.shuffle(available_seat_ids)
-        
-        base_ticket_price = final_reservation_price / num_seats if num_seats > 0 else 0
+        # 스케줄의 빈 좌석 num_seats개 (좌석 목록 전체를 복사/셔플하지 않음)
+        selected_seat_ids = seat_index.draw(schedule_id, num_seats)
         
+        base_ticket_price = final_reservation_price // num_seats if num_seats > 0 else 0
+
+        # 좌석별 할인 수단 (0: 포인트, 1: 쿠폰, 2: 관람권, 3: 할인 없음), 쿠폰 좌석 할인은 한 번에 계산
+        discount_choices = [random.randint(0, 3) for _ in range(num_seats)]
+        coupon_discounts = iter(calculate_coupon_discounts(base_ticket_price, discount_choices.count(1), coupon_index))
         
         for s in range(num_seats):
-            selected_seat_id = available_seat_ids.pop()
-            seat = ReservationSeat(
+            selected_seat_id = selected_seat_ids[s]
+            # 👈 ORM 모드(PK 미할당)에서는 즉시 DB에 삽입하고 reservation_seat_id 할당
+            reservation_seat_id = writer.add(ReservationSeat,
                 schedule_id=schedule_id,
-                seat_id=selected_seat_id
+                seat_id=selected_seat_id,
+                created_at=reserved_at
             )
 
-            session.add(seat)
-            session.flush() # 👈 즉시 DB에 삽입하고 seat.reservation_seat_id 할당
-
-            # entities_to_add.append(seat)
-            # session.flush()
-
-            # entities_to_add.append(ReservationSeatList(
-            #     reservation_id=reservation_id,
-            #     reservation_seat_id=seat.reservation_seat_id
-            # ))
-            reservation_seat_list_entry = ReservationSeatList(
+            writer.add(ReservationSeatList,
                 reservation_id=reservation_id,
-                reservation_seat_id=seat.reservation_seat_id
+                reservation_seat_id=reservation_seat_id
             )
-            entities_to_add.append(reservation_seat_list_entry)
 
 
-            # # 좌석별 할인
-            # discount_choice = random.randint(0, 3) 
-            # discount_amount = 0.0
-            # max_discount = base_ticket_price * 0.5 
-            
-            # if discount_choice == 0: 
-            #     discount_amount = round(random.uniform(500, max_discount), 2)
-            #     benefit_code = DISCOUNT_POINT_CODE
-            # elif discount_choice == 1: 
-            #     discount_amount = 2000
-            #     benefit_code = DISCOUNT_COUPON_CODE
-            # elif discount_choice == 2: 
-            #     discount_amount = base_ticket_price if random.random() < 0.2 else round(random.uniform(1000, max_discount), 2)
-            #     benefit_code = DISCOUNT_VOUCHER_CODE
-
-            # discount_amount = min(discount_amount, max_discount)
-            discount_choice = random.randint(0, 3) 
-            discount_amount = 0.0    
+            discount_choice = discount_choices[s]
+            discount_amount = 0
 
             current_ticket_price = base_ticket_price
             max_discount = current_ticket_price # 최대 할인은 티켓 가격을 넘을 수 없음
 
             if discount_choice == 0: 
                 # 수정: 포인트 할인 14,000원 고정 (티켓 가격을 넘지 않도록 min으로 제한)
-                discount_amount = min(14000.00, current_ticket_price) 
+                discount_amount = min(POINT_DISCOUNT, current_ticket_price)
                 benefit_code = DISCOUNT_POINT_CODE
 
-            elif discount_choice == 1 and coupon_ids: 
+            elif discount_choice == 1: 
             # 수정: 쿠폰 정책을 참조하여 할인 금액 계산
-                random_coupon_id = random.choice(coupon_ids)
-                discount_amount = calculate_coupon_discount(current_ticket_price, random_coupon_id, coupon_map)
+                discount_amount = next(coupon_discounts)
                 benefit_code = DISCOUNT_COUPON_CODE
 
             elif discount_choice == 2: #  수정: 상품권 사용 = 무료 관람 (전액 할인)
@@ -426,113 +378,102 @@ def generate_dummy_data(session, num_records):
 
             if discount_amount > 0:
                 total_discount_amount += discount_amount
-                entities_to_add.append(TicketDiscount(
+                writer.add(TicketDiscount,
                     benefit_id=current_benefit_id,
-                    reservation_seat_id=seat.reservation_seat_id,
+                    reservation_seat_id=reservation_seat_id,
                     benefit_code=benefit_code,
-                    applied_amount=discount_amount
-                ))
+                    applied_amount=discount_amount,
+                    created_at=reserved_at
+                )
                 current_benefit_id += 1
 
         # ReservationCount 생성
-        for age_type, data in age_count_map.items():
-            entities_to_add.append(ReservationCount(
+        for k, count in count_age_types(age_indexes):
+            writer.add(ReservationCount,
                 reservation_id=reservation_id,
-                age_type=age_type,
-                count=data['count'],
-                price=data['price']
-            ))
+                age_type=AGE_TYPE_CODES[k],
+                count=count,
+                price=price_row[k]
+            )
         
         origin_amount = final_reservation_price
             
 
         # ------------------ 1. Payment 생성 ------------------
         
-        final_amount = max(0.0, origin_amount - total_discount_amount)
-        completed_date = datetime.now() - timedelta(hours=random.randint(1,10))
+        final_amount = max(0, origin_amount - total_discount_amount)
+        completed_date = now - timedelta(hours=random.randint(1,10))
 
         # 결제 수단 비율 (카드 70%, 은행 10%, 모바일 20%)
-        payment_method_choice = random.choices(['CARD','BANK','MOBILE'], weights=[70, 10, 20], k=1)[0]
+        payment_method_choice = payment_method_sampler.draw()
+
+        # 정책 할인 금액은 Payment row를 만들기 전에 미리 계산 (row 생성 후 수정 불가)
+        payment_policy_id, payment_level_discount = apply_discount_policy(origin_amount, policy_index)
         
-        payment = Payment(
+        payment_id = writer.add(Payment,
             payment_type=0, # 예매로 고정
             type_id=reservation_id, # reservation_id 사용
             origin_amount=origin_amount,
-            discount_total=total_discount_amount,
-            amount=final_amount,
+            # 최종 금액 반영: Payment.discount_total에 정책 할인 금액 추가
+            discount_total=total_discount_amount + payment_level_discount,
+            amount=final_amount - payment_level_discount,
             status=1,
             created_at=completed_date - timedelta(minutes=random.randint(1, 5)),
             completed_at=completed_date
         )
-        session.add(payment)
-        session.flush()
 
         # ------------------ 2. PaymentDetail 생성 ------------------
         
         if payment_method_choice == 'CARD':
-            entities_to_add.append(PaymentCard(
-                payment_id=payment.payment_id,
+            writer.add(PaymentCard,
+                payment_id=payment_id,
                 card_company_code=CARD_COMPANY_CODE,
-                card_number=faker.numerify('####'),
+                card_number=pii.card_number(),
                 installment_months=random.choice([0,3,6]),
-                card_approval_number=faker.numerify('##########')
-            ))
+                card_approval_number=pii.approval_number()
+            )
         elif payment_method_choice == 'BANK':
-            entities_to_add.append(PaymentBankTransfer(
-                payment_id=payment.payment_id,
+            writer.add(PaymentBankTransfer,
+                payment_id=payment_id,
                 bank_code=BANK_CODE,
-                account_number=generate_random_account_number(),
-                account_holder_name=faker.name()[:12]
-            ))
+                account_number=pii.account_number(),
+                account_holder_name=pii.name()
+            )
         else:
-            mobile_number = "010-" + faker.numerify('####') + "-" + faker.numerify('####')
-            entities_to_add.append(PaymentMobile(
-                payment_id=payment.payment_id,
+            writer.add(PaymentMobile,
+                payment_id=payment_id,
                 carrier_code=CARRIER_CODE,
-                phone_number=mobile_number,
-                approval_code=faker.numerify('##########')
-            ))
+                phone_number=pii.phone_number(),
+                approval_code=pii.approval_number()
+            )
 
         # ------------------ 3. PaymentDiscount 생성 ------------------
         
-        # payment_level_discount = math.ceil(total_discount_amount * 0.05) # 테스트용 랜덤적용방법
-        # entities_to_add.append(PaymentDiscount(
-        #     payment_id=payment.payment_id,
-        #     policy_id=policy_id,
-        #     applied_amount=payment_level_discount
-        # ))
-        payment_level_discount = apply_discount_policy(
-            origin_amount, 
-            policy_id, 
-            policy_map
-        )
-
         if payment_level_discount > 0:
-            entities_to_add.append(PaymentDiscount(
-                payment_id=payment.payment_id,
-                policy_id=policy_id,
-                applied_amount=payment_level_discount
-            ))
-            
-            # 최종 금액 업데이트: Payment.discount_total에 정책 할인 금액 추가
-            payment.discount_total += payment_level_discount 
-            payment.amount -= payment_level_discount 
-
-            # 정책 ID를 랜덤하게 다시 선택
-            policy_id = random.choice(policy_ids) if policy_ids else 1
+            writer.add(PaymentDiscount,
+                payment_id=payment_id,
+                policy_id=payment_policy_id,
+                applied_amount=payment_level_discount,
+                created_at=completed_date
+            )
 
 
 
         # 배치 커밋
-        if i % BATCH_SIZE == 0:
-            session.add_all(entities_to_add)
-            session.commit()
-            entities_to_add = []
+        if batcher.should_commit(writer):
+            batcher.commit(writer)
             print(f"--- {i}건 커밋 완료 ---")
-
-    if entities_to_add:
-        session.add_all(entities_to_add)
-        session.commit()
+            if metrics:
+                metrics.report(i)
+
+    # 남은 row 커밋 및 AUTO_INCREMENT 보정
+    writer.close()
+    if options.streaming:
+        unfreeze_reference_objects()
+        if hasattr(batcher, 'rss_summary'):
+            print(f"--- RSS(첫 배치/최대/마지막 배치, MB): {batcher.rss_summary()} ---")
+    if metrics:
+        metrics.finish(num_records, writer.row_counts)
 
     print(f"--- 최종 {num_records}개 예매 데이터 생성 완료 ---")
 
@@ -540,24 +481,69 @@ def generate_dummy_data(session, num_records):
 # 4. 실행 진입점
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="예매 트랜잭션 더미 데이터 생성")
+    parser.add_argument("--records", type=int, default=100, help="생성할 예매 트랜잭션 수")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="샤드별로 나눠 생성할 프로세스 수 (좌석 분할과 샤드 시드가 달라지므로 같은 --seed라도 워커 수마다 데이터가 다름)")
+    parser.add_argument("--write-mode", choices=WRITE_MODES, default=WRITE_MODE_CORE, help="쓰기 방식")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드 (샤드별 시드는 이 값에서 파생)")
+    add_base_time_argument(parser)
+    parser.add_argument("--reset", choices=RESET_MODES, default=RESET_TRUNCATE,
+                        help="기존 데이터 초기화 방식 (swap: 섀도 테이블에 적재 후 RENAME TABLE 한 번으로 교체)")
+    add_metrics_arguments(parser)
+    add_batch_arguments(parser)
+    parser.add_argument("--writer-threads", type=int, default=0,
+                        help="생성과 DB 쓰기를 겹쳐 실행할 writer 스레드 수 (core/load_data, 0이면 순차 실행)")
+    parser.add_argument("--hotspot-skew", type=float, default=0.0,
+                        help="회원/스케줄 id를 Zipf 분포로 뽑는 기울기 (0이면 균등, 1.0이면 상위 1%% id에 약 70%%)")
+    parser.add_argument("--append", action="store_true",
+                        help="기존 데이터를 지우지 않고 현재 최대 키 다음부터 --records건을 추가")
+    parser.add_argument("--bulk-load", action="store_true",
+                        help="적재 동안 보조 인덱스 삭제, foreign_key_checks/unique_checks=0, 적재 후 인덱스 재생성/ANALYZE/검증 (MySQL)")
+    add_streaming_arguments(parser)
+    args = parser.parse_args()
+    if args.streaming and args.write_mode == WRITE_MODE_ORM:
+        parser.error("--streaming은 core/load_data 쓰기 방식에서만 사용할 수 있습니다.")
+    if args.append and args.reset == RESET_SWAP:
+        parser.error("--append는 기존 데이터에 이어 붙이므로 --reset swap 과 함께 쓸 수 없습니다.")
+    if args.bulk_load and args.reset == RESET_SWAP:
+        parser.error("--bulk-load는 라이브 테이블에 적재할 때만 사용할 수 있습니다 (--reset swap 불가).")
+
     try:
-        engine = create_engine(DATABASE_URL, echo=False)
+        # local_infile: load_data 쓰기 모드(LOAD DATA LOCAL INFILE) 사용 시 필요
+        engine = create_engine(DATABASE_URL, echo=False, connect_args={"local_infile": True})
         Session = sessionmaker(bind=engine)
         session = Session()
 
-        print("기존 예매 관련 데이터 삭제 및 초기화 중...")
-        # 예매 관련 테이블만 삭제 (order 테이블은 제외)
-        tables_to_delete = ['reservation_seat_list', 'payment_discount', 'ticket_discount', 
-                            'payment_card', 'payment_bank_transfer', 'payment_mobile', 
-                            'payment', 'reservation_count', 'reservation_seat', 'reservation']
-        
-        for table_name in tables_to_delete:
-            session.execute(text(f"DELETE FROM {table_name}"))
-        session.commit()
+        swap = None
+        target_session = session
+        if args.append:
+            print(f"기존 데이터에 이어서 추가합니다 (현재 최대 키: {current_high_water_marks(session)})...")
+        elif args.reset == RESET_SWAP:
+            print("섀도 테이블 준비 중 (적재 후 라이브 테이블과 교체)...")
+            swap = ShadowTableSwap(session, TABLES_TO_DELETE)
+            swap.prepare()
+            target_session = Session(bind=engine.execution_options(**swap.execution_options))
+        else:
+            print(f"기존 예매 관련 데이터 삭제 및 초기화 중 ({args.reset})...")
+            # 예매 관련 테이블만 삭제 (order 테이블은 제외), FK 체크를 끈 세션에서 자식 → 부모 순서로
+            reset_tables(session, TABLES_TO_DELETE, args.reset)
 
         # 데이터 생성 
-        generate_dummy_data(session, 100)
-
+        options = SeederOptions.from_args(args, metrics=create_metrics('data_seeder_reservation_only', args))
+        # --bulk-load: 보조 인덱스/FK·UNIQUE 검사를 미루고 적재 후 재생성, ANALYZE, 검증
+        with bulk_load_mode(session, TABLES_TO_DELETE) if args.bulk_load else nullcontext():
+            if args.workers > 1:
+                run_sharded('data_seeder_reservation_only', DATABASE_URL, args.records, args.workers, options,
+                            execution_options=swap.execution_options if swap else None, bulk_load=args.bulk_load)
+            else:
+                generate_dummy_data(target_session, args.records, options)
+
+        if swap:
+            swap.swap()
+            print("섀도 테이블 교체 완료")
+        if target_session is not session:
+            target_session.close()
         session.close()
 
     except Exception as e:
@@ -9,7 +9,15 @@ import random
 from datetime import datetime, timedelta
 import math
 import os
+import argparse
 from dotenv import load_dotenv
+from seeder_ids import IdBlockAllocator, current_high_water_marks
+from seeder_writer import WRITE_MODE_ORM, WRITE_MODE_CORE, create_row_writer
+from seeder_batching import AdaptiveBatchController
+from seeder_pii import PiiPool
+from seeder_sampling import WeightedSampler
+from seeder_money import to_cents
+from seeder_reset import delete_payments_in_chunks
 
 # -------------------------------------------------------------------------------------
 # 1. 환경 설정 및 상수 정의 (기존 파일과 동일)
@@ -25,13 +33,15 @@ DB_PORT = os.getenv("DB_PORT", "3307")
 DATABASE_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}?charset=utf8mb4"
 
 Base = declarative_base()
-BATCH_SIZE = 500
 
 # 코드 상수 (결제 상세 정보 생성을 위해 필요)
 CARD_COMPANY_CODE = "00501"
 BANK_CODE = "01201"
 CARRIER_CODE = "00901"
 
+# 스토어 결제 관련 테이블 (자식 → 부모 순서, 역순이 INSERT 순서)
+TABLES_TO_DELETE = ['payment_discount', 'payment_card', 'payment_bank_transfer', 'payment_mobile', 'payment']
+
 # -------------------------------------------------------------------------------------
 # 2. ORM 모델 정의 (Payment 및 Order 모델만 필요)
 
@@ -86,16 +96,18 @@ class Order(Base):
 # -------------------------------------------------------------------------------------
 # 3. 스토어 결제 더미 데이터 생성 함수
 
-def generate_random_account_number():
-    """임의의 10~14자리 숫자 형태의 계좌 번호를 생성합니다."""
-    length = random.randint(10, 14)
-    if length > 0:
-        return str(random.randint(1, 9)) + ''.join(random.choices('0123456789', k=length - 1))
-    return '1234567890'
-
+def generate_store_payments(session, num_payments, preallocate_ids=False, write_mode=WRITE_MODE_ORM, metrics=None,
+                            batch_controller=None):
+    """기존 order를 참조하는 스토어 결제 더미 데이터를 생성합니다.
 
-def generate_store_payments(session, num_payments):
+    preallocate_ids=True 이면 payment PK를 미리 예약한 블록에서 할당하여 row마다 flush하지 않습니다.
+    write_mode='core' 이면 ORM 객체 대신 튜플을 모아 Core executemany로 전송하고,
+    write_mode='load_data' 이면 테이블별 TSV 청크를 LOAD DATA LOCAL INFILE로 적재합니다 (둘 다 PK 사전 할당).
+    metrics(SeederMetrics)를 주면 단계별 소요 시간, 테이블별 row 수, 진행률을 기록합니다.
+    batch_controller(AdaptiveBatchController)로 트랜잭션당 row 수를 정합니다 (생략 시 커밋 시간 기준 자동 조절).
+    """
     faker = Faker('ko_KR')
+    pii = PiiPool(faker, 43)
     random.seed(43) # 예매와 다른 시드 사용
     
     # 1. 존재하는 Order 데이터 조회
@@ -115,24 +127,32 @@ def generate_store_payments(session, num_payments):
         payment_orders = random.sample(order_data, num_payments)
 
     policy_id = 1 
-    entities_to_add = []
-
-    print(f"--- {num_payments}개의 스토어 결제 데이터 생성 시작 (배치 사이즈: {BATCH_SIZE}) ---")
+    id_allocator = None
+    if preallocate_ids or write_mode != WRITE_MODE_ORM:
+        id_allocator = IdBlockAllocator.from_session(session, ['payment'])
+    if metrics:
+        metrics.lap('reference_load')
+    writer = create_row_writer(session, write_mode, id_allocator, reversed(TABLES_TO_DELETE), metrics)
+    batcher = batch_controller or AdaptiveBatchController()
+    # 결제 수단 분포
+    payment_method_sampler = WeightedSampler(['CARD', 'BANK', 'MOBILE'], [70, 10, 20])
+
+    print(f"--- {num_payments}개의 스토어 결제 데이터 생성 시작 (배치: {batcher}, 쓰기 모드: {write_mode}) ---")
 
     for i, (order_id, origin_amount) in enumerate(payment_orders):
         
         # 1. 할인 금액 설정 -> 스토어는 할인 X
-        origin_amount = float(origin_amount)
-        total_discount_amount = 0.0
+        origin_amount = to_cents(origin_amount)   # 정수 센트 (writer가 DECIMAL로 변환)
+        total_discount_amount = 0
         
         final_amount = origin_amount
         completed_date = datetime.now() - timedelta(hours=random.randint(1,10))
         
         # 2. 결제 수단 랜덤 선택 (카드 70%, 은행 10%, 모바일 20%)
-        payment_method_choice = random.choices(['CARD','BANK','MOBILE'], weights=[70, 10, 20], k=1)[0]
+        payment_method_choice = payment_method_sampler.draw()
         
         # 3. Payment 레코드 생성
-        payment = Payment(
+        payment_id = writer.add(Payment,
             payment_type=1, # 스토어 결제로 고정
             type_id=order_id, # order_id 참조
             origin_amount=origin_amount,
@@ -142,33 +162,30 @@ def generate_store_payments(session, num_payments):
             created_at=completed_date - timedelta(minutes=random.randint(1, 5)),
             completed_at=completed_date
         )
-        session.add(payment)
-        session.flush()
 
         # 4. PaymentDetail 생성
         if payment_method_choice == 'CARD':
-            entities_to_add.append(PaymentCard(
-                payment_id=payment.payment_id,
+            writer.add(PaymentCard,
+                payment_id=payment_id,
                 card_company_code=CARD_COMPANY_CODE,
-                card_number=faker.numerify('####'),
+                card_number=pii.card_number(),
                 installment_months=random.choice([0,3,6]),
-                card_approval_number=faker.numerify('##########')
-            ))
+                card_approval_number=pii.approval_number()
+            )
         elif payment_method_choice == 'BANK':
-            entities_to_add.append(PaymentBankTransfer(
-                payment_id=payment.payment_id,
+            writer.add(PaymentBankTransfer,
+                payment_id=payment_id,
                 bank_code=BANK_CODE,
-                account_number=generate_random_account_number(),
-                account_holder_name=faker.name()[:12]
-            ))
+                account_number=pii.account_number(),
+                account_holder_name=pii.name()
+            )
         else:
-            mobile_number = "010-" + faker.numerify('####') + "-" + faker.numerify('####')
-            entities_to_add.append(PaymentMobile(
-                payment_id=payment.payment_id,
+            writer.add(PaymentMobile,
+                payment_id=payment_id,
                 carrier_code=CARRIER_CODE,
-                phone_number=mobile_number,
-                approval_code=faker.numerify('##########')
-            ))
+                phone_number=pii.phone_number(),
+                approval_code=pii.approval_number()
+            )
 
         # # 5. PaymentDiscount 생성 필요 없음 --> 스토어는 할인 적용 X
         # payment_level_discount = math.ceil(total_discount_amount * 0.05)
@@ -179,15 +196,16 @@ def generate_store_payments(session, num_payments):
         # ))
 
         # 배치 커밋
-        if (i + 1) % BATCH_SIZE == 0:
-            session.add_all(entities_to_add)
-            session.commit()
-            entities_to_add = []
+        if batcher.should_commit(writer):
+            batcher.commit(writer)
             print(f"--- {i + 1}건 커밋 완료 ---")
+            if metrics:
+                metrics.report(i + 1)
 
-    if entities_to_add:
-        session.add_all(entities_to_add)
-        session.commit()
+    # 남은 row 커밋 및 AUTO_INCREMENT 보정
+    writer.close()
+    if metrics:
+        metrics.finish(num_payments, writer.row_counts)
 
     print(f"--- 최종 {num_payments}개 스토어 결제 데이터 생성 완료 ---")
 
@@ -196,43 +214,36 @@ def generate_store_payments(session, num_payments):
 # 4. 실행 진입점
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="스토어 결제 더미 데이터 생성")
+    parser.add_argument("--records", type=int, default=100, help="생성할 스토어 결제 수")
+    parser.add_argument("--append", action="store_true",
+                        help="기존 결제를 지우지 않고 현재 최대 payment_id 다음부터 --records건을 추가")
+    args = parser.parse_args()
+
     try:
-        engine = create_engine(DATABASE_URL, echo=False)
+        # local_infile: load_data 쓰기 모드(LOAD DATA LOCAL INFILE) 사용 시 필요
+        engine = create_engine(DATABASE_URL, echo=False, connect_args={"local_infile": True})
         Session = sessionmaker(bind=engine)
         session = Session()
 
-        print("기존 스토어 관련 결제 데이터 삭제 및 초기화 중...")
-        # 스토어 결제와 관련된 테이블만 삭제 (FK 제약조건을 피하기 위함)
-        
-        # Payment 테이블에서 payment_type=1인 레코드의 payment_id를 조회
-        payment_ids_to_delete = [
-            row[0] for row in session.execute(
-                text("SELECT payment_id FROM payment WHERE payment_type = 1")
-            ).fetchall()
-        ]
-        
-        if payment_ids_to_delete:
-            print(f"{len(payment_ids_to_delete)}건의 기존 스토어 결제 레코드를 삭제합니다.")
-            
-            # 관련된 PaymentDetail 및 PaymentDiscount 레코드 삭제
-            for table_name in ['payment_discount', 'payment_card', 'payment_bank_transfer', 'payment_mobile']:
-                session.execute(
-                    text(f"DELETE FROM {table_name} WHERE payment_id IN :ids"), 
-                    {"ids": payment_ids_to_delete}
-                )
-                
-            # 최종 Payment 레코드 삭제
-            session.execute(
-                text("DELETE FROM payment WHERE payment_type = 1")
-            )
-            session.commit()
+        if args.append:
+            print(f"기존 데이터에 이어서 추가합니다 (현재 최대 payment_id: {current_high_water_marks(session)['payment']})...")
         else:
-             print("기존 스토어 결제 데이터가 없어 삭제를 건너뜁니다.")
+            print("기존 스토어 관련 결제 데이터 삭제 및 초기화 중...")
+            # 스토어 결제와 관련된 테이블만 삭제 (FK 제약조건을 피하기 위함)
+
+            # payment_type=1 결제를 payment_id 범위 청크로 나눠 PaymentDetail/PaymentDiscount → Payment 순서로 삭제
+            # (중단되어도 다시 실행하면 남은 범위부터 이어서 삭제)
+            deleted = delete_payments_in_chunks(session, 1, TABLES_TO_DELETE[:-1])
+            if deleted:
+                print(f"{deleted}건의 기존 스토어 결제 레코드를 삭제했습니다.")
+            else:
+                print("기존 스토어 결제 데이터가 없어 삭제를 건너뜁니다.")
         
 
         # 데이터 생성 (예: 2만 건의 스토어 결제 데이터 생성)
         # ✅ 생성할 결제 건수는 order 테이블의 데이터 수에 맞춰 조정해야 합니다.
-        generate_store_payments(session, 100) 
+        generate_store_payments(session, args.records, write_mode=WRITE_MODE_CORE) 
 
         session.close()
 
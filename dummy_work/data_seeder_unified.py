@@ -1,15 +1,38 @@
 # data_seeder_unified.py
 
 from sqlalchemy import create_engine, Column, Integer, String, DECIMAL, DateTime, Time, Date
-from sqlalchemy import PrimaryKeyConstraint, text, BigInteger, TINYINT
+from sqlalchemy import PrimaryKeyConstraint, text, BigInteger, UniqueConstraint
+from sqlalchemy.dialects.mysql import TINYINT
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from faker import Faker
 import random
 from datetime import datetime, timedelta
-import math
 import os
+import argparse
+from functools import partial
+from contextlib import nullcontext
 from dotenv import load_dotenv
+from seeder_ids import IdBlockAllocator, next_benefit_id, current_high_water_marks
+from seeder_writer import WRITE_MODE_ORM, WRITE_MODE_CORE, WRITE_MODES, create_row_writer
+from seeder_batching import AdaptiveBatchController, add_batch_arguments
+from seeder_streaming import (DEFAULT_MEMORY_CEILING_MB, MemoryBoundedBatchController, add_streaming_arguments,
+                              freeze_reference_objects, unfreeze_reference_objects)
+from seeder_options import SeederOptions
+from seeder_sharding import add_base_time_argument, run_sharded, seed_base_time
+from seeder_blocks import (VECTOR_BLOCK_SIZE, MAX_SEATS, PAYMENT_TYPE_WEIGHTS, USER_WEIGHTS, AGE_TYPE_WEIGHTS, PAYMENT_METHODS,
+                           PAYMENT_METHOD_WEIGHTS, iter_record_blocks)
+from seeder_sampling import WeightedSampler, hotspot_sampler
+from seeder_pricing import TicketPriceMatrix, count_age_types
+from seeder_money import ceil_percent_to_won, to_cents
+from seeder_pii import PiiPool
+from seeder_seats import SeatOccupancy, partition_seat_ids, occupy_existing_seats
+from seeder_reference import load_reference
+from seeder_reset import RESET_TRUNCATE, RESET_SWAP, RESET_MODES, reset_tables, ShadowTableSwap
+from seeder_metrics import create_metrics, add_metrics_arguments
+from seeder_checkpoint import SeederCheckpoint
+from seeder_bulkload import bulk_load_mode
+import numpy as np
 
 # -------------------------------------------------------------------------------------
 # 1. 환경 설정 및 상수 정의
@@ -25,10 +48,10 @@ DB_PORT = os.getenv("DB_PORT", "3307")
 DATABASE_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}?charset=utf8mb4"
 
 Base = declarative_base()
-BATCH_SIZE = 500
 
-# 기본 티켓 가격
-BASE_TICKET_PRICE = 13000.00
+# 기본 티켓 가격 (금액은 모두 정수 센트로 계산하고 writer가 DECIMAL로 변환)
+BASE_TICKET_PRICE = 1300000   # 13,000.00원
+MIN_SEAT_DISCOUNT = 100000    # 좌석 할인 하한 1,000.00원
 
 # 할인/결제 코드 상수
 DISCOUNT_POINT_CODE = "01101"
@@ -44,6 +67,13 @@ AGE_TYPE_YOUTH = "00202"
 AGE_TYPE_SENIOR = "00203"
 AGE_TYPE_PRIME = "00204"
 AGE_TYPE_CODES = [AGE_TYPE_ADULT, AGE_TYPE_YOUTH, AGE_TYPE_SENIOR, AGE_TYPE_PRIME]
+AGE_TYPE_INDEXES = range(len(AGE_TYPE_CODES))  # 가격 행렬의 열 인덱스
+
+# 역순 삭제 대상 테이블 (자식 → 부모 순서, 역순이 INSERT 순서)
+TABLES_TO_DELETE = ['reservation_seat_list', 'payment_discount', 'ticket_discount', 
+                    'payment_card', 'payment_bank_transfer', 'payment_mobile', 
+                    'payment', 'reservation_count', 'reservation_seat', 'reservation', 
+                    'order'] 
 
 # -------------------------------------------------------------------------------------
 # 2. ORM 모델 정의 (모든 관련 테이블 포함)
@@ -98,7 +128,7 @@ class TicketDiscount(Base):
     benefit_code = Column(String(7))
     __table_args__ = (
         PrimaryKeyConstraint('benefit_id','reservation_seat_id','benefit_code'),
-        text('UNIQUE KEY uk_seat_discount (reservation_seat_id)')
+        UniqueConstraint('reservation_seat_id', name='uk_seat_discount'),
     )
     applied_amount = Column(DECIMAL(10,2))
     created_at = Column(DateTime, default=datetime.now)
@@ -161,220 +191,341 @@ class Order(Base):
 # -------------------------------------------------------------------------------------
 # 3. 데이터 생성 함수
 
-def calculate_final_ticket_price(schedule_id, age_type_code, 
-                                 schedule_map, screen_type_map, 
-                                 screen_time_map, age_type_map):
-    """모든 가격 변동 요소를 고려하여 최종 티켓 가격을 계산합니다."""
-    
-    screen_type, screen_time = schedule_map.get(schedule_id, (None, None))
-    if not screen_type or not screen_time:
-        return BASE_TICKET_PRICE
-
-    final_price = BASE_TICKET_PRICE 
-    screen_price = screen_type_map.get(screen_type, 0.00)
-    final_price += screen_price 
-
-    time_adjustment = screen_time_map.get(screen_time, 0.00)
-    final_price += time_adjustment
-    
-    age_adjustment = age_type_map.get(age_type_code, 0.00)
-    final_price += age_adjustment
-    
-    return max(0.0, final_price) 
-
-
-def generate_dummy_data(session, num_records):
+def generate_dummy_data(session, num_records, options=None):
+    """통합 트랜잭션(예매 80%, 스토어 20%) 더미 데이터를 num_records건 생성합니다.
+
+    options(SeederOptions)로 쓰기 방식, 시드, 샤드 범위, 배치/계측/체크포인트 등을 받습니다 (생략 시 기본값).
+    모든 시각은 options.base_time(생략 시 seed에서 파생) 기준이라 같은 옵션이면 같은 데이터가 나옵니다.
+    좌석은 스케줄별 점유 인덱스에서 빈 좌석만 뽑으므로 같은 스케줄의 좌석이 중복 예매되지 않고,
+    기존 데이터가 있으면 (--append) 이미 팔린 좌석과 현재 최대 PK/benefit_id 다음부터 이어서 생성합니다.
+    체크포인트를 주면 배치 커밋마다 생성기 상태를 같은 트랜잭션으로 저장하고, resume이면 저장된
+    지점부터 중단 없이 실행한 것과 같은 데이터를 이어서 생성합니다.
+    streaming이면 배치 버퍼만 RSS 상한 안에서 커밋합니다. 참조 데이터(좌석/회원/스케줄 배열, 가격표)는
+    실행 내내 메모리에 있으므로 전체 메모리가 일정하지는 않고, 레코드 수에 따라 늘지 않을 뿐입니다.
+    """
+    options = options or SeederOptions()
+    # 루프에서 자주 쓰는 옵션
+    seed, vectorized, metrics, checkpoint = options.seed, options.vectorized, options.metrics, options.checkpoint
+    if options.streaming and options.write_mode == WRITE_MODE_ORM:
+        raise ValueError("스트리밍 모드는 ORM 세션(identity map)에 객체를 쌓지 않는 core/load_data 쓰기 방식에서만 사용할 수 있습니다.")
     faker = Faker('ko_KR')
-    random.seed(42)
+    faker.seed_instance(seed)
+    random.seed(seed)
+    pii = PiiPool(faker, seed)
+    now = options.base_time or seed_base_time(seed)
     
     # ------------------ DB 참조 데이터 및 가격 정책 조회 ------------------
-    schedule_data = session.execute(text("SELECT schedule_id, screen_type, screen_time FROM screen_schedule")).fetchall()
-    schedule_map = {row[0]: (row[1], row[2]) for row in schedule_data}
-    schedule_ids = list(schedule_map.keys())
+    # 큰 참조 테이블은 서버 사이드 커서로 int64/float64 array에 담고, 원본 테이블 지문(row 수, PK 범위)이 같으면 디스크 캐시 사용
+    schedule_ids, screen_type_column, screen_time_column = load_reference(session, 'schedule')
 
     screen_type_prices = session.execute(text("SELECT screen_type, price FROM screen_type")).fetchall()
-    screen_type_map = {row[0]: float(row[1]) for row in screen_type_prices}
+    screen_type_map = {row[0]: to_cents(row[1]) for row in screen_type_prices}
 
     screen_time_adjustments = session.execute(text("SELECT screen_time, adjust_price FROM screen_time")).fetchall()
-    screen_time_map = {row[0]: float(row[1]) for row in screen_time_adjustments}
+    screen_time_map = {row[0]: to_cents(row[1]) for row in screen_time_adjustments}
 
     age_type_adjustments = session.execute(text("SELECT age_type, adjust_price FROM age_type")).fetchall()
-    age_type_map = {row[0]: float(row[1]) for row in age_type_adjustments}
+    age_type_map = {row[0]: to_cents(row[1]) for row in age_type_adjustments}
+
+    # (schedule_id, 연령) 별 최종 티켓 가격을 한 번만 계산
+    price_matrix = TicketPriceMatrix(schedule_ids, screen_type_column, screen_time_column,
+                                     screen_type_map, screen_time_map, age_type_map, BASE_TICKET_PRICE, AGE_TYPE_CODES)
     
-    seat_ids = [row[0] for row in session.execute(text("SELECT seat_id FROM seat")).fetchall()]
-    user_ids = [row[0] for row in session.execute(text("SELECT user_id FROM user")).fetchall()]
+    seat_ids = partition_seat_ids(load_reference(session, 'seat')[0], options.seat_partition)
+    user_ids = load_reference(session, 'user')[0]
     policy_id = 1 
     
     # 스토어 상품 ID 조회 및 맵 생성: {store_item_id: price}
-    store_items_data = session.execute(text("SELECT store_item_id, price FROM store_item")).fetchall()
-    store_item_map = {row[0]: float(row[1]) for row in store_items_data}
-    store_item_ids = list(store_item_map.keys())
+    store_item_ids, store_item_prices = load_reference(session, 'store_item')
+    store_item_map = dict(zip(store_item_ids, store_item_prices))
     
     if not schedule_ids or not seat_ids or not user_ids or not store_item_ids:
         raise Exception("필수 데이터(schedule, seat, user, store_item)가 없습니다. 먼저 기본 데이터를 생성하세요.")
 
-    entities_to_add = []
-    current_benefit_id = 100000
-
-    print(f"--- {num_records}개의 통합 트랜잭션 데이터 생성 시작 (예매:80%, 스토어:20%, 배치 사이즈: {BATCH_SIZE}) ---")
-
-    for i in range(1, num_records+1):
+    # 분포별 누적 가중치 표는 한 번만 만들어 둠 (random.choices(weights=...)와 같은 값)
+    payment_type_sampler = WeightedSampler([0, 1], PAYMENT_TYPE_WEIGHTS)
+    user_type_sampler = WeightedSampler([True, False], USER_WEIGHTS)
+    age_type_sampler = WeightedSampler(AGE_TYPE_INDEXES, AGE_TYPE_WEIGHTS)
+    payment_method_sampler = WeightedSampler(PAYMENT_METHODS, PAYMENT_METHOD_WEIGHTS)
+    # 핫스팟 분포: 인기 회원/스케줄/상품에 선택이 몰리도록 (hotspot_skew=0 이면 균등 random.choice)
+    hotspots = {name: hotspot_sampler(ids, options.hotspot_skew) for name, ids in
+                (('user', user_ids), ('schedule', schedule_ids), ('store_item', store_item_ids))} if options.hotspot_skew else None
+    draw_user = hotspots['user'].draw if hotspots else partial(random.choice, user_ids)
+    draw_schedule = hotspots['schedule'].draw if hotspots else partial(random.choice, schedule_ids)
+    draw_store_item = hotspots['store_item'].draw if hotspots else partial(random.choice, store_item_ids)
+
+    if options.id_ranges:
+        current_benefit_id = options.id_ranges['ticket_discount'].start
+        id_allocator = IdBlockAllocator.from_ranges(options.id_ranges)
+    else:
+        current_benefit_id = next_benefit_id(session)
+        id_allocator = (IdBlockAllocator.from_session(session)
+                        if options.preallocate_ids or checkpoint or options.write_mode != WRITE_MODE_ORM else None)
+    if metrics:
+        metrics.lap('reference_load')
+    writer = create_row_writer(session, options.write_mode, id_allocator, reversed(TABLES_TO_DELETE), metrics,
+                               options.writer_threads, options.async_writer)
+    if options.batch_controller:
+        batcher = options.batch_controller
+    elif options.streaming:
+        batcher = MemoryBoundedBatchController(ceiling_mb=DEFAULT_MEMORY_CEILING_MB)
+    else:
+        batcher = AdaptiveBatchController()
+
+    # 블록 단위 난수 결정 (vectorized 모드)
+    record_blocks = None
+    block = None
+    if vectorized:
+        block_rng = np.random.default_rng(seed)
+        block_rng_state, block_start = None, 0   # 현재 블록을 만들기 직전의 rng 상태와 시작 위치 (체크포인트용)
+        record_blocks = iter_record_blocks(block_rng, num_records, user_ids, schedule_ids, store_item_ids,
+                                           hotspots=hotspots)
+    # 스케줄별 좌석 점유 인덱스 (중복 예매 방지)
+    seat_index = SeatOccupancy(seat_ids)
+
+    # 체크포인트: 배치 커밋마다 저장할 생성기 상태
+    def checkpoint_state():
+        state = {'now': now, 'random': random.getstate(), 'pii': pii.getstate(),
+                 'ids': id_allocator.getstate(), 'benefit_id': current_benefit_id, 'seat_mark': seat_mark}
+        if vectorized:
+            state.update(block_rng=block_rng_state, block_start=block_start)
+        return state
+
+    saved = None
+    if checkpoint:
+        if options.writer_threads or options.async_writer or options.id_ranges:
+            raise ValueError("체크포인트는 단일 프로세스의 orm/core/load_data 쓰기 방식에서만 사용할 수 있습니다.")
+        saved = checkpoint.begin(session, {'records': num_records, 'seed': seed, 'vectorized': vectorized,
+                                          'hotspot_skew': options.hotspot_skew})
+        if saved and saved['records_done'] >= num_records:
+            print(f"--- 이미 완료된 실행입니다 ({num_records}건) ---")
+            return
+
+    # 기존 데이터가 이미 점유한 좌석 반영 (--append만, resume이면 처음 실행 시작 시점까지의 좌석만)
+    if saved:
+        seat_mark = occupy_existing_seats(session, seat_index, saved['seat_mark'])
+    else:
+        seat_mark = occupy_existing_seats(session, seat_index) if options.append else 0
+
+    start_record = 1
+    if saved:
+        start_record = saved['records_done'] + 1
+        now = saved['now']
+        random.setstate(saved['random'])
+        pii.setstate(saved['pii'])
+        id_allocator.setstate(saved['ids'])
+        current_benefit_id = saved['benefit_id']
+        seat_index.replay(checkpoint.seat_journal(session))
+        if vectorized:
+            # 중단된 블록을 처음부터 다시 만들고 그 안의 위치부터 이어감
+            block_rng.bit_generator.state = block_rng_state = saved['block_rng']
+            block_start = saved['block_start']
+            record_blocks = iter_record_blocks(block_rng, num_records - block_start,
+                                               user_ids, schedule_ids, store_item_ids, hotspots=hotspots)
+            block = next(record_blocks)
+            block_reservation_prices = block.reservation_prices(price_matrix)
+        print(f"--- 체크포인트에서 이어서 실행: {start_record}번째 레코드부터 ---")
+    if checkpoint:
+        seat_index.journal = []
+    if options.streaming:
+        # 여기까지 만든 참조 데이터/매핑은 실행 내내 살아 있으므로 full GC 때마다 다시 훑지 않게 함
+        freeze_reference_objects()
+        if isinstance(batcher, MemoryBoundedBatchController):
+            # 참조 데이터만으로 RSS 상한을 넘으면 시작하지 않고 중단
+            batcher.check_floor()
+
+    print(f"--- {num_records}개의 통합 트랜잭션 데이터 생성 시작 (예매:80%, 스토어:20%, 배치: {batcher}, 쓰기 모드: {options.write_mode}) ---")
+
+    for i in range(start_record, num_records+1):
+        if record_blocks is not None:
+            j = (i - 1) % VECTOR_BLOCK_SIZE
+            if j == 0:
+                block_rng_state, block_start = block_rng.bit_generator.state, i - 1
+                block = next(record_blocks)
+                block_reservation_prices = block.reservation_prices(price_matrix)
         
         # ------------------ 1. 트랜잭션 타입 결정 (8:2 비율) ------------------
         # 0: 예매 (80%), 1: 스토어 (20%)
-        payment_type_choice = random.choices([0, 1], weights=[80, 20], k=1)[0]
+        payment_type_choice = block.payment_type[j] if block else payment_type_sampler.draw()
         
         # ------------------ 2. 사용자 타입 결정 ------------------
-        is_user = random.choices([True, False], weights=[80, 20], k=1)[0]
-        user_id = random.choice(user_ids) if is_user and user_ids else None
-        non_user_id = random.randint(1, 1000) if not is_user else None
+        if block:
+            is_user = block.is_user[j]
+            user_id = block.user_id[j] if is_user else None
+            non_user_id = block.non_user_id[j] if not is_user else None
+        else:
+            is_user = user_type_sampler.draw()
+            user_id = draw_user() if is_user and user_ids else None
+            non_user_id = random.randint(1, 1000) if not is_user else None
         
         # 스토어 주문(1)은 user_id가 필수 (FK 제약조건)
         if payment_type_choice == 1 and user_id is None:
-            user_id = random.choice(user_ids)
+            user_id = block.user_id[j] if block else draw_user()
             non_user_id = None
         
-        total_discount_amount = 0.0
+        total_discount_amount = 0
         reservation_id = None
         order_id = None 
         
         # ------------------ 3. 데이터 생성 (예매 vs 스토어) ------------------
         
         if payment_type_choice == 0: # 🎬 영화 예매 트랜잭션 (80%)
-            num_seats = random.randint(1, 4)
-            schedule_id = random.choice(schedule_ids)
-            final_reservation_price = 0.0
-            age_count_map = {}
-            
-            age_types_for_seats = random.choices(AGE_TYPE_CODES, weights=[60, 25, 10, 5], k=num_seats)
-
-            # 티켓 가격 및 할인 계산
-            for age_type in age_types_for_seats:
-                ticket_price = calculate_final_ticket_price(schedule_id, age_type, schedule_map, screen_type_map, screen_time_map, age_type_map)
-                final_reservation_price += ticket_price
-                if age_type not in age_count_map:
-                    age_count_map[age_type] = {'count': 0, 'price': ticket_price}
-                age_count_map[age_type]['count'] += 1
-
-            # Reservation 생성
-            reservation = Reservation(
-                schedule_id=schedule_id, user_id=user_id, non_user_id=non_user_id, price=final_reservation_price, status=1, created_at=datetime.now() - timedelta(hours=random.randint(1,500))
+            if block:
+                num_seats = block.num_seats[j]
+                drawn_schedule_id = block.schedule_id[j]
+                k0 = j * MAX_SEATS   # 좌석 단위 컬럼에서 이 레코드의 시작 위치
+                age_indexes = block.age_type_index[k0:k0 + num_seats]
+            else:
+                num_seats = random.randint(1, 4)
+                drawn_schedule_id = draw_schedule()
+                age_indexes = age_type_sampler.draws(num_seats)
+            # 매진된 스케줄이면 (핫스팟 분포에서 인기 스케줄) 좌석이 남은 스케줄로 대체
+            schedule_id = seat_index.first_available(schedule_ids, drawn_schedule_id, num_seats)
+
+            # 티켓 가격 (가격 행렬 조회, 블록에서 미리 계산한 총액은 스케줄이 바뀌지 않았을 때만 사용)
+            price_row = price_matrix.row(schedule_id)
+            if block and schedule_id == drawn_schedule_id:
+                final_reservation_price = block_reservation_prices[j]
+            else:
+                final_reservation_price = 0
+                for k in age_indexes:
+                    final_reservation_price += price_row[k]
+
+            # Reservation 생성 (좌석/좌석 할인 row도 같은 시각, DB 기본값 datetime.now를 쓰지 않음)
+            reserved_at = now - timedelta(hours=block.reservation_hours[j] if block else random.randint(1,500))
+            reservation_id = writer.add(Reservation,
+                schedule_id=schedule_id, user_id=user_id, non_user_id=non_user_id, price=final_reservation_price, status=1, created_at=reserved_at
             )
-            session.add(reservation)
-            session.flush()
-            reservation_id = reservation.reservation_id
 
             # ReservationSeat & TicketDiscount 생성
-            base_ticket_price = final_reservation_price / num_seats if num_seats > 0 else 0
+            base_ticket_price = final_reservation_price // num_seats if num_seats > 0 else 0
+            if block:
+                # 좌석 num_seats개를 한 번에 (좌석마다 draw(.., 1)를 부르는 것과 같은 좌석, 같은 journal)
+                block_seat_ids = seat_index.draw(schedule_id, num_seats, block.seat_ratio[k0:k0 + num_seats])
             for s in range(num_seats):
-                seat = ReservationSeat(schedule_id=schedule_id, seat_id=random.choice(seat_ids))
-                entities_to_add.append(seat)
-                session.flush()
+                if block:
+                    seat_id = block_seat_ids[s]
+                else:
+                    seat_id = seat_index.draw(schedule_id, 1)[0]
+                reservation_seat_id = writer.add(ReservationSeat, schedule_id=schedule_id, seat_id=seat_id, created_at=reserved_at)
 
-                entities_to_add.append(ReservationSeatList(reservation_id=reservation_id, reservation_seat_id=seat.reservation_seat_id))
+                writer.add(ReservationSeatList, reservation_id=reservation_id, reservation_seat_id=reservation_seat_id)
                 
                 # 좌석별 할인 적용
-                discount_choice = random.randint(0, 3) 
-                discount_amount = 0.0
-                max_discount = base_ticket_price * 0.5 
+                discount_choice = block.discount_choice[k0 + s] if block else random.randint(0, 3) 
+                discount_amount = 0
+                max_discount = base_ticket_price // 2
                 
                 if discount_choice in [0, 1, 2]: # 포인트, 쿠폰, 바우처
-                    discount_amount = round(random.uniform(1000, max_discount), 2)
+                    if block:
+                        discount_amount = round(MIN_SEAT_DISCOUNT + (max_discount - MIN_SEAT_DISCOUNT) * block.discount_ratio[k0 + s])
+                    else:
+                        discount_amount = round(random.uniform(MIN_SEAT_DISCOUNT, max_discount))
                     benefit_code = DISCOUNT_POINT_CODE if discount_choice == 0 else DISCOUNT_COUPON_CODE if discount_choice == 1 else DISCOUNT_VOUCHER_CODE
 
                 discount_amount = min(discount_amount, max_discount)
 
                 if discount_amount > 0:
                     total_discount_amount += discount_amount
-                    entities_to_add.append(TicketDiscount(benefit_id=current_benefit_id, reservation_seat_id=seat.reservation_seat_id, benefit_code=benefit_code, applied_amount=discount_amount))
+                    writer.add(TicketDiscount, benefit_id=current_benefit_id, reservation_seat_id=reservation_seat_id, benefit_code=benefit_code, applied_amount=discount_amount,
+                               created_at=reserved_at)
                     current_benefit_id += 1
 
             # ReservationCount 생성
-            for age_type, data in age_count_map.items():
-                entities_to_add.append(ReservationCount(reservation_id=reservation_id, age_type=age_type, count=data['count'], price=data['price']))
+            for k, count in count_age_types(age_indexes):
+                writer.add(ReservationCount, reservation_id=reservation_id, age_type=AGE_TYPE_CODES[k], count=count, price=price_row[k])
             
             origin_amount = final_reservation_price
             
         else: # 🛒 스토어 구매 트랜잭션 (20%)
             
-            selected_item_id = random.choice(store_item_ids)
+            selected_item_id = block.store_item_id[j] if block else draw_store_item()
             unit_price = store_item_map[selected_item_id]
-            quantity = random.randint(1, 3)
-            total_price = round(unit_price * quantity, 2)
+            quantity = block.quantity[j] if block else random.randint(1, 3)
+            total_price = unit_price * quantity
             
             # 1. Order 테이블 생성 (FK 제약조건 충족을 위해 필수)
-            order = Order(
+            order_id = writer.add(Order,
                 user_id=user_id, 
                 store_item_id=selected_item_id,
                 quantity=quantity,
                 unit_price=unit_price,
                 price=total_price, 
                 status=0,
-                created_at=datetime.now() - timedelta(hours=random.randint(1,500))
+                created_at=now - timedelta(hours=block.order_hours[j] if block else random.randint(1,500))
             )
-            session.add(order)
-            session.flush()
-            order_id = order.order_id 
 
             # 2. Payment 금액 설정
             origin_amount = total_price
             
             # 스토어 할인 (총 금액의 5% ~ 15% 랜덤)
-            discount_percentage = random.uniform(0.05, 0.15)
-            total_discount_amount = round(origin_amount * discount_percentage, 2)
+            discount_percentage = block.store_discount_percentage[j] if block else random.uniform(0.05, 0.15)
+            total_discount_amount = round(origin_amount * discount_percentage)
 
         # ------------------ 4. 공통 Payment 생성 ------------------
         
-        final_amount = max(0.0, origin_amount - total_discount_amount)
-        completed_date = datetime.now() - timedelta(hours=random.randint(1,10))
-
-        payment_method_choice = random.choices(['CARD','BANK','MOBILE'], weights=[70, 10, 20], k=1)[0]
+        final_amount = max(0, origin_amount - total_discount_amount)
+        if block:
+            completed_date = now - timedelta(hours=block.completed_hours[j])
+            payment_method_choice = block.payment_method[j]
+        else:
+            completed_date = now - timedelta(hours=random.randint(1,10))
+            payment_method_choice = payment_method_sampler.draw()
         
-        payment = Payment(
+        payment_id = writer.add(Payment,
             payment_type=payment_type_choice, 
             type_id=reservation_id if payment_type_choice == 0 else order_id, # 타입에 따라 ID 참조
             origin_amount=origin_amount,
             discount_total=total_discount_amount,
             amount=final_amount,
             status=1,
-            created_at=completed_date - timedelta(minutes=random.randint(1, 5)),
+            created_at=completed_date - timedelta(minutes=block.created_minutes[j] if block else random.randint(1, 5)),
             completed_at=completed_date
         )
-        session.add(payment)
-        session.flush()
 
         # ------------------ 5. PaymentDetail 생성 ------------------
         
         if payment_method_choice == 'CARD':
-            entities_to_add.append(PaymentCard(
-                payment_id=payment.payment_id, card_company_code=CARD_COMPANY_CODE, card_number=faker.numerify('####'), installment_months=random.choice([0,3,6]), card_approval_number=faker.numerify('##########')
-            ))
+            writer.add(PaymentCard,
+                payment_id=payment_id, card_company_code=CARD_COMPANY_CODE, card_number=pii.card_number(), installment_months=block.installment_months[j] if block else random.choice([0,3,6]), card_approval_number=pii.approval_number()
+            )
         elif payment_method_choice == 'BANK':
-            entities_to_add.append(PaymentBankTransfer(
-                payment_id=payment.payment_id, bank_code=BANK_CODE, account_number=faker.bank_account_number(), account_holder_name=faker.name()[:12]
-            ))
+            writer.add(PaymentBankTransfer,
+                payment_id=payment_id, bank_code=BANK_CODE, account_number=pii.account_number(), account_holder_name=pii.name()
+            )
         else:
-            entities_to_add.append(PaymentMobile(
-                payment_id=payment.payment_id, carrier_code=CARRIER_CODE, phone_number=faker.phone_number()[:13], approval_code=faker.numerify('##########')
-            ))
+            writer.add(PaymentMobile,
+                payment_id=payment_id, carrier_code=CARRIER_CODE, phone_number=pii.phone_number(), approval_code=pii.approval_number()
+            )
 
         # ------------------ 6. PaymentDiscount 생성 ------------------
         
-        payment_level_discount = math.ceil(total_discount_amount * 0.05)
-        entities_to_add.append(PaymentDiscount(
-            payment_id=payment.payment_id, policy_id=policy_id, applied_amount=payment_level_discount
-        ))
+        payment_level_discount = ceil_percent_to_won(total_discount_amount, 5)
+        writer.add(PaymentDiscount,
+            payment_id=payment_id, policy_id=policy_id, applied_amount=payment_level_discount, created_at=completed_date
+        )
 
         # 배치 커밋
-        if i % BATCH_SIZE == 0:
-            session.add_all(entities_to_add)
-            session.commit()
-            entities_to_add = []
+        if batcher.should_commit(writer):
+            if checkpoint:
+                checkpoint.stage(session, i, checkpoint_state(), seat_index.take_journal())
+            batcher.commit(writer)
             print(f"--- {i}건 커밋 완료 ---")
-
-    if entities_to_add:
-        session.add_all(entities_to_add)
+            if metrics:
+                metrics.report(i)
+
+    # 남은 row 커밋 및 AUTO_INCREMENT 보정 (샤드 실행이면 부모 프로세스가 마지막에 보정)
+    if checkpoint:
+        checkpoint.stage(session, num_records, checkpoint_state(), seat_index.take_journal())
+    writer.close(sync_auto_increment=options.id_ranges is None)
+    if checkpoint:
         session.commit()
+    if options.streaming:
+        unfreeze_reference_objects()
+        if hasattr(batcher, 'rss_summary'):
+            print(f"--- RSS(첫 배치/최대/마지막 배치, MB): {batcher.rss_summary()} ---")
+    if metrics:
+        metrics.finish(num_records, writer.row_counts)
 
     print(f"--- 최종 {num_records}개 통합 트랜잭션 데이터 생성 완료 ---")
 
@@ -382,27 +533,81 @@ def generate_dummy_data(session, num_records):
 # 4. 실행 진입점
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="통합 트랜잭션(예매/스토어) 더미 데이터 생성")
+    parser.add_argument("--records", type=int, default=100000, help="생성할 트랜잭션 수")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="샤드별로 나눠 생성할 프로세스 수 (좌석/회원 분할과 샤드 시드가 달라지므로 같은 --seed라도 워커 수마다 데이터가 다름)")
+    parser.add_argument("--write-mode", choices=WRITE_MODES, default=WRITE_MODE_CORE, help="쓰기 방식")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드 (샤드별 시드는 이 값에서 파생)")
+    add_base_time_argument(parser)
+    parser.add_argument("--vectorized", action="store_true", help="레코드별 난수 결정을 NumPy 블록으로 생성")
+    parser.add_argument("--reset", choices=RESET_MODES, default=RESET_TRUNCATE,
+                        help="기존 데이터 초기화 방식 (swap: 섀도 테이블에 적재 후 RENAME TABLE 한 번으로 교체)")
+    add_metrics_arguments(parser)
+    add_batch_arguments(parser)
+    parser.add_argument("--writer-threads", type=int, default=0,
+                        help="생성과 DB 쓰기를 겹쳐 실행할 writer 스레드 수 (core/load_data, 0이면 순차 실행)")
+    parser.add_argument("--resume", action="store_true",
+                        help="초기화 없이 마지막 체크포인트부터 이어서 실행 (같은 --records/--seed/--vectorized 필요)")
+    parser.add_argument("--hotspot-skew", type=float, default=0.0,
+                        help="회원/스케줄/상품 id를 Zipf 분포로 뽑는 기울기 (0이면 균등, 1.0이면 상위 1%% id에 약 70%%)")
+    parser.add_argument("--append", action="store_true",
+                        help="기존 데이터를 지우지 않고 현재 최대 키 다음부터 --records건을 추가")
+    parser.add_argument("--bulk-load", action="store_true",
+                        help="적재 동안 보조 인덱스 삭제, foreign_key_checks/unique_checks=0, 적재 후 인덱스 재생성/ANALYZE/검증 (MySQL)")
+    add_streaming_arguments(parser)
+    args = parser.parse_args()
+    # 체크포인트는 배치가 시더 session에서 커밋되는 단일 프로세스 실행에서만 기록
+    use_checkpoint = args.workers == 1 and not args.writer_threads
+    if args.resume and (not use_checkpoint or args.reset == RESET_SWAP):
+        parser.error("--resume은 --workers 1, --writer-threads 0, swap 이외의 --reset 에서만 사용할 수 있습니다.")
+    if args.append and args.reset == RESET_SWAP:
+        parser.error("--append는 기존 데이터에 이어 붙이므로 --reset swap 과 함께 쓸 수 없습니다.")
+    if args.bulk_load and args.reset == RESET_SWAP:
+        parser.error("--bulk-load는 라이브 테이블에 적재할 때만 사용할 수 있습니다 (--reset swap 불가).")
+    if args.streaming and args.write_mode == WRITE_MODE_ORM:
+        parser.error("--streaming은 core/load_data 쓰기 방식에서만 사용할 수 있습니다.")
+
     try:
-        engine = create_engine(DATABASE_URL, echo=False)
+        # local_infile: load_data 쓰기 모드(LOAD DATA LOCAL INFILE) 사용 시 필요
+        engine = create_engine(DATABASE_URL, echo=False, connect_args={"local_infile": True})
         Session = sessionmaker(bind=engine)
         session = Session()
 
-        print("기존 데이터 삭제 및 초기화 중...")
-        # 역순 삭제 (FK 제약조건을 피하기 위해 모든 관련 테이블 삭제)
-        tables_to_delete = ['reservation_seat_list', 'payment_discount', 'ticket_discount', 
-                            'payment_card', 'payment_bank_transfer', 'payment_mobile', 
-                            'payment', 'reservation_count', 'reservation_seat', 'reservation', 
-                            'order'] 
-        
-        for table_name in tables_to_delete:
-            # 안전하게 삭제
-            session.execute(text(f"DELETE FROM {table_name}"))
-        session.commit()
+        swap = None
+        target_session = session
+        if args.resume:
+            print("체크포인트에서 이어서 실행합니다 (초기화 생략)...")
+        elif args.append:
+            print(f"기존 데이터에 이어서 추가합니다 (현재 최대 키: {current_high_water_marks(session)})...")
+        elif args.reset == RESET_SWAP:
+            print("섀도 테이블 준비 중 (적재 후 라이브 테이블과 교체)...")
+            swap = ShadowTableSwap(session, TABLES_TO_DELETE)
+            swap.prepare()
+            target_session = Session(bind=engine.execution_options(**swap.execution_options))
+        else:
+            print(f"기존 데이터 삭제 및 초기화 중 ({args.reset})...")
+            # 자식 → 부모 순서 (FK 제약조건을 피하기 위해 모든 관련 테이블 삭제)
+            reset_tables(session, TABLES_TO_DELETE, args.reset)
 
         # 데이터 생성 
         # 80%는 예매  20%는 스토어 
-        generate_dummy_data(session, 100000)
-
+        options = SeederOptions.from_args(
+            args, metrics=create_metrics('data_seeder_unified', args),
+            checkpoint=SeederCheckpoint('data_seeder_unified', args.resume) if use_checkpoint else None)
+        # --bulk-load: 보조 인덱스/FK·UNIQUE 검사를 미루고 적재 후 재생성, ANALYZE, 검증
+        with bulk_load_mode(session, TABLES_TO_DELETE) if args.bulk_load else nullcontext():
+            if args.workers > 1:
+                run_sharded('data_seeder_unified', DATABASE_URL, args.records, args.workers, options,
+                            execution_options=swap.execution_options if swap else None, bulk_load=args.bulk_load)
+            else:
+                generate_dummy_data(target_session, args.records, options)
+
+        if swap:
+            swap.swap()
+            print("섀도 테이블 교체 완료")
+        if target_session is not session:
+            target_session.close()
         session.close()
 
     except Exception as e:
@@ -1,15 +1,37 @@
-# data_seeder_unified_final.py
+# fin.py
 
-from sqlalchemy import create_engine, Column, Integer, String, DECIMAL, ForeignKey, DateTime, Time, Date
-from sqlalchemy import PrimaryKeyConstraint, text, BigInteger, TINYINT
+from sqlalchemy import create_engine, Column, Integer, String, DECIMAL, DateTime
+from sqlalchemy import PrimaryKeyConstraint, text, BigInteger, UniqueConstraint
+from sqlalchemy.dialects.mysql import TINYINT
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from faker import Faker
 import random
 from datetime import datetime, timedelta
-import math
 import os
+import argparse
+from functools import partial
+from contextlib import nullcontext
 from dotenv import load_dotenv
+from seeder_ids import IdBlockAllocator, current_high_water_marks
+from seeder_writer import WRITE_MODE_ORM, WRITE_MODE_CORE, WRITE_MODES, create_row_writer
+from seeder_batching import AdaptiveBatchController, add_batch_arguments
+from seeder_streaming import (DEFAULT_MEMORY_CEILING_MB, MemoryBoundedBatchController, add_streaming_arguments,
+                              freeze_reference_objects, unfreeze_reference_objects)
+from seeder_options import SeederOptions
+from seeder_sharding import add_base_time_argument, run_sharded, seed_base_time
+from seeder_pricing import TicketPriceMatrix, count_age_types
+from seeder_money import to_cents
+from seeder_discounts import DiscountPolicyIndex
+from seeder_pii import PiiPool
+from seeder_pending import PendingChildren
+from seeder_seats import SeatOccupancy, partition_seat_ids, occupy_existing_seats
+from seeder_reference import load_reference
+from seeder_ledger import BenefitLedger, INITIAL_COUPONS, INITIAL_VOUCHERS, partition_users
+from seeder_sampling import WeightedSampler, hotspot_sampler
+from seeder_reset import RESET_TRUNCATE, RESET_SWAP, RESET_MODES, reset_tables, ShadowTableSwap
+from seeder_metrics import create_metrics, add_metrics_arguments
+from seeder_bulkload import bulk_load_mode
 
 # -------------------------------------------------------------------------------------
 # 1. 환경 설정 및 상수 정의
@@ -25,10 +47,11 @@ DB_PORT = os.getenv("DB_PORT", "3307")
 DATABASE_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}?charset=utf8mb4"
 
 Base = declarative_base()
-BATCH_SIZE = 500
 
-# 기본 티켓 가격
-BASE_TICKET_PRICE = 15000.00
+# 기본 티켓 가격 (금액은 모두 정수 센트로 계산하고 writer가 DECIMAL로 변환)
+BASE_TICKET_PRICE = 1500000   # 15,000.00원
+MIN_SEAT_DISCOUNT = 50000     # 좌석 할인 하한 500.00원
+MIN_POINT_BALANCE = 100000    # 포인트 사용을 시도할 수 있는 잔액 1,000.00원
 
 # 할인/결제 코드 상수
 DISCOUNT_POINT_CODE = "01101"   # 포인트
@@ -42,6 +65,13 @@ AGE_TYPE_YOUTH = "00202"
 AGE_TYPE_SENIOR = "00203"
 AGE_TYPE_PRIME = "00204"
 AGE_TYPE_CODES = [AGE_TYPE_ADULT, AGE_TYPE_YOUTH, AGE_TYPE_SENIOR, AGE_TYPE_PRIME]
+AGE_TYPE_INDEXES = range(len(AGE_TYPE_CODES))  # 가격 행렬의 열 인덱스
+
+# 초기화 대상 트랜잭션 테이블 (자식 → 부모 순서)
+TABLES_TO_DELETE = ['reservation_seat_list', 'payment_discount', 'ticket_discount', 
+                    'payment_card', 'payment_bank_transfer', 'payment_mobile', 
+                    'payment', 'reservation_count', 'reservation_seat', 'reservation', 
+                    'order'] 
 
 # -------------------------------------------------------------------------------------
 # 2. ORM 모델 정의 (모든 관련 테이블 포함)
@@ -107,7 +137,7 @@ class TicketDiscount(Base):
     reservation_seat_id = Column(BigInteger)
     benefit_code = Column(String(7))
     __table_args__ = (
-        text('UNIQUE KEY uk_seat_discount (reservation_seat_id)')
+        UniqueConstraint('reservation_seat_id', name='uk_seat_discount'),
     )
     applied_amount = Column(DECIMAL(10,2))
     created_at = Column(DateTime, default=datetime.now)
@@ -148,6 +178,8 @@ class Order(Base):
     order_id = Column(BigInteger, primary_key=True)
     user_id = Column(BigInteger)
     price = Column(DECIMAL(10,2))
+    status = Column(TINYINT)
+    created_at = Column(DateTime, default=datetime.now)
     # 필요한 필드만 정의
 
 class StoreItem(Base):
@@ -158,96 +190,130 @@ class StoreItem(Base):
 # -------------------------------------------------------------------------------------
 # 3. 데이터 생성 함수
 
-def calculate_final_ticket_price(schedule_id, age_type_code, 
-                                 schedule_map, screen_type_map, 
-                                 screen_time_map, age_type_map):
-    """모든 가격 변동 요소를 고려하여 최종 티켓 가격을 계산합니다."""
-    screen_type, screen_time = schedule_map.get(schedule_id, (None, None))
-    if not screen_type or not screen_time: return BASE_TICKET_PRICE
-    final_price = BASE_TICKET_PRICE 
-    final_price += screen_type_map.get(screen_type, 0.00) 
-    final_price += screen_time_map.get(screen_time, 0.00)
-    final_price += age_type_map.get(age_type_code, 0.00)
-    return max(0.0, final_price) 
-
-
-def generate_dummy_data(session, num_records):
+def generate_dummy_data(session, num_records, options=None):
+    """통합 트랜잭션(예매 80%, 스토어 20%) 더미 데이터를 num_records건 생성합니다 (회원 포인트/쿠폰/관람권 사용 포함).
+
+    options(SeederOptions)로 쓰기 방식, 시드, 샤드 범위, 배치/계측 설정을 받습니다 (생략 시 기본값).
+    vectorized, async_writer, checkpoint는 data_seeder_unified에만 있습니다.
+    모든 시각은 options.base_time(생략 시 seed에서 파생) 기준이라 같은 옵션이면 같은 데이터가 나옵니다.
+    좌석은 스케줄별 점유 인덱스에서 빈 좌석만 뽑으므로 같은 스케줄의 좌석이 중복 예매되지 않습니다.
+    seat_partition=(샤드 번호, 샤드 수)이면 그 샤드 몫의 좌석과 회원만 사용합니다 (회원별 포인트/쿠폰 장부가 샤드끼리 겹치지 않음).
+    streaming이면 배치 버퍼만 RSS 상한 안에서 커밋합니다 (참조 데이터는 그대로 메모리에 있음).
+    """
+    options = options or SeederOptions()
+    if options.vectorized or options.async_writer or options.checkpoint:
+        raise ValueError("fin 시더는 vectorized / async_writer / checkpoint 옵션을 지원하지 않습니다 (data_seeder_unified 사용).")
+    seed, metrics = options.seed, options.metrics
+    if options.streaming and options.write_mode == WRITE_MODE_ORM:
+        raise ValueError("스트리밍 모드는 core/load_data 쓰기 방식에서만 사용할 수 있습니다.")
     faker = Faker('ko_KR')
-    random.seed(42)
+    faker.seed_instance(seed)
+    random.seed(seed)
+    pii = PiiPool(faker, seed)
+    now = options.base_time or seed_base_time(seed)
     
     # ------------------ 1. DB 참조 데이터 및 정책 조회 ------------------
     
     # 스케줄, 좌석 ID 조회
-    schedule_data = session.execute(text("SELECT schedule_id, screen_type, screen_time FROM screen_schedule")).fetchall()
-    schedule_map = {row[0]: (row[1], row[2]) for row in schedule_data}
-    schedule_ids = list(schedule_map.keys())
-    seat_ids = [row[0] for row in session.execute(text("SELECT seat_id FROM seat")).fetchall()]
+    # 큰 참조 테이블은 서버 사이드 커서로 int64/float64 array에 담고, 원본 테이블 지문(row 수, PK 범위)이 같으면 디스크 캐시 사용
+    schedule_ids, screen_type_column, screen_time_column = load_reference(session, 'schedule')
+    seat_ids = partition_seat_ids(load_reference(session, 'seat')[0], options.seat_partition)
     
-    # ✅ 회원/비회원 정보 및 포인트 조회
-    user_data = session.execute(text("SELECT user_id, point FROM user")).fetchall()
-    user_point_map = {row[0]: float(row[1]) for row in user_data}
-    user_ids = list(user_point_map.keys())
-    non_user_ids = [row[0] for row in session.execute(text("SELECT non_user_id FROM non_user")).fetchall()]
+    # ✅ 회원/비회원 정보 및 포인트 조회 (user_ids는 PK 순)
+    # 포인트는 이 시더가 실행마다 차감해 user 테이블에 반영하는데, 캐시 지문(row 수/PK 범위)은 잔액이 바뀌어도
+    # 그대로라 캐시를 쓰면 이전 실행 시작 시점의 잔액으로 장부를 만들게 됨 → 디스크 캐시 없이 항상 DB에서 읽음
+    user_ids, user_points = partition_users(*load_reference(session, 'user_point', cache_dir=''), options.seat_partition)
+    non_user_ids = load_reference(session, 'non_user')[0]
     
     # 가격 정책 조회
     screen_type_prices = session.execute(text("SELECT screen_type, price FROM screen_type")).fetchall()
-    screen_type_map = {row[0]: float(row[1]) for row in screen_type_prices}
+    screen_type_map = {row[0]: to_cents(row[1]) for row in screen_type_prices}
     screen_time_adjustments = session.execute(text("SELECT screen_time, adjust_price FROM screen_time")).fetchall()
-    screen_time_map = {row[0]: float(row[1]) for row in screen_time_adjustments}
+    screen_time_map = {row[0]: to_cents(row[1]) for row in screen_time_adjustments}
     age_type_adjustments = session.execute(text("SELECT age_type, adjust_price FROM age_type")).fetchall()
-    age_type_map = {row[0]: float(row[1]) for row in age_type_adjustments}
+    age_type_map = {row[0]: to_cents(row[1]) for row in age_type_adjustments}
+    # (schedule_id, 연령) 별 최종 티켓 가격을 한 번만 계산
+    price_matrix = TicketPriceMatrix(schedule_ids, screen_type_column, screen_time_column,
+                                     screen_type_map, screen_time_map, age_type_map, BASE_TICKET_PRICE, AGE_TYPE_CODES)
     
     # 스토어 상품 ID 조회 및 맵 생성: {store_item_id: price}
-    store_items_data = session.execute(text("SELECT store_item_id, price FROM store_item")).fetchall()
-    store_item_map = {row[0]: float(row[1]) for row in store_items_data}
-    store_item_ids = list(store_item_map.keys())
+    store_item_ids, store_item_prices = load_reference(session, 'store_item')
+    store_item_map = dict(zip(store_item_ids, store_item_prices))
 
-    # ✅ 할인 정책 조회 및 가공
+    # ✅ 할인 정책 조회 및 가공 (제휴사별, 최소 사용 금액 순으로 정렬한 배열 인덱스)
     policy_data = session.execute(
         text("SELECT policy_id, partner_id, discount_amount, discount_percent, min_price, max_benefit_amount FROM discount_policy WHERE end_date >= CURDATE()")
     ).fetchall()
     
-    discount_policy_map = {}
-    for row in policy_data:
-        policy_id, partner_id, amount, percent, min_price, max_benefit = row
-        if partner_id not in discount_policy_map:
-            discount_policy_map[partner_id] = []
-        discount_policy_map[partner_id].append({
-            'id': policy_id, 'amount': float(amount) if amount else None,
-            'percent': float(percent) if percent else None,
-            'min_price': float(min_price), 'max_benefit': float(max_benefit) if max_benefit else float('inf')
-        })
-    available_partner_ids = [k for k in discount_policy_map.keys() if k.startswith(CARD_COMPANY_CODE_PREFIX)]
+    policy_index = DiscountPolicyIndex.from_discount_policies(policy_data)
+    available_partner_ids = [k for k in policy_index.groups if k.startswith(CARD_COMPANY_CODE_PREFIX)]
 
     if not schedule_ids or not seat_ids or not user_ids or not non_user_ids or not store_item_ids:
         raise Exception("필수 데이터(schedule, seat, user, non_user, store_item)가 없습니다. 먼저 기본 데이터를 생성하세요.")
 
-    # ✅ 혜택 소유 시뮬레이션 (인메모리)
+    # ✅ 회원 혜택 장부 (포인트 잔액, 쿠폰/관람권 보유 수를 회원 위치 배열로 관리하고 사용할 때 차감)
     # 30%의 유저가 쿠폰 소유, 15%가 관람권 소유
-    coupon_users = set(random.sample(user_ids, int(len(user_ids) * 0.3)))
-    voucher_users = set(random.sample(user_ids, int(len(user_ids) * 0.15)))
-
-    entities_to_add = []
-
-    print(f"--- {num_records}개의 통합 트랜잭션 데이터 생성 시작 (예매:80%, 스토어:20%, 배치 사이즈: {BATCH_SIZE}) ---")
+    ledger = BenefitLedger(user_ids, user_points)
+    ledger.grant(ledger.coupons, random.sample(user_ids, int(len(user_ids) * 0.3)), INITIAL_COUPONS)
+    ledger.grant(ledger.vouchers, random.sample(user_ids, int(len(user_ids) * 0.15)), INITIAL_VOUCHERS)
+
+    # 분포별 누적 가중치 표는 한 번만 만들어 둠 (random.choices(weights=...)와 같은 값)
+    payment_type_sampler = WeightedSampler([0, 1], [80, 20])
+    user_type_sampler = WeightedSampler([True, False], [80, 20])
+    age_type_sampler = WeightedSampler(AGE_TYPE_INDEXES, [60, 25, 10, 5])
+    payment_method_sampler = WeightedSampler(['CARD', 'BANK', 'MOBILE'], [70, 10, 20])
+    # 핫스팟 분포: 인기 회원/스케줄/상품에 선택이 몰리도록 (hotspot_skew=0 이면 균등 random.choice)
+    draw_user = hotspot_sampler(user_ids, options.hotspot_skew).draw if options.hotspot_skew else partial(random.choice, user_ids)
+    draw_schedule = hotspot_sampler(schedule_ids, options.hotspot_skew).draw if options.hotspot_skew else partial(random.choice, schedule_ids)
+    draw_store_item = (hotspot_sampler(store_item_ids, options.hotspot_skew).draw if options.hotspot_skew
+                       else partial(random.choice, store_item_ids))
+
+    if options.id_ranges:
+        id_allocator = IdBlockAllocator.from_ranges(options.id_ranges)
+    else:
+        id_allocator = IdBlockAllocator.from_session(session) if options.preallocate_ids or options.write_mode != WRITE_MODE_ORM else None
+    if metrics:
+        metrics.lap('reference_load')
+    writer = create_row_writer(session, options.write_mode, id_allocator, reversed(TABLES_TO_DELETE), metrics, options.writer_threads)
+    if options.batch_controller:
+        batcher = options.batch_controller
+    elif options.streaming:
+        batcher = MemoryBoundedBatchController(ceiling_mb=DEFAULT_MEMORY_CEILING_MB)
+    else:
+        batcher = AdaptiveBatchController()
+    # Payment 생성 전에 결정되는 결제 단위 자식 row (PaymentDiscount), 트랜잭션마다 payment_id에 연결
+    payment_children = PendingChildren('payment_id')
+    # 스케줄별 좌석 점유 인덱스 (중복 예매 방지)
+    seat_index = SeatOccupancy(seat_ids)
+    # 기존 데이터에 이어 붙일 때(--append) 이미 팔린 좌석은 점유 처리
+    if options.append:
+        occupy_existing_seats(session, seat_index)
+    if options.streaming:
+        # 참조 데이터, 혜택 장부, 정책 인덱스는 실행 내내 살아 있으므로 GC 추적 대상에서 뺌
+        freeze_reference_objects()
+        if isinstance(batcher, MemoryBoundedBatchController):
+            # 참조 데이터만으로 RSS 상한을 넘으면 시작하지 않고 중단
+            batcher.check_floor()
+
+    print(f"--- {num_records}개의 통합 트랜잭션 데이터 생성 시작 (예매:80%, 스토어:20%, 배치: {batcher}, 쓰기 모드: {options.write_mode}) ---")
 
     for i in range(1, num_records+1):
         
         # ------------------ 2. 트랜잭션 타입 결정 (8:2 비율) ------------------
-        payment_type_choice = random.choices([0, 1], weights=[80, 20], k=1)[0] # 0: 예매, 1: 스토어
+        payment_type_choice = payment_type_sampler.draw() # 0: 예매, 1: 스토어
         
         # ------------------ 3. 사용자 타입 결정 ------------------
         # 스토어(1)는 회원 필수, 예매(0)는 회원/비회원 가능
         if payment_type_choice == 1:
             is_user = True
-            user_id = random.choice(user_ids)
+            user_id = draw_user()
             non_user_id = None
         else:
-            is_user = random.choices([True, False], weights=[80, 20], k=1)[0]
-            user_id = random.choice(user_ids) if is_user else None
+            is_user = user_type_sampler.draw()
+            user_id = draw_user() if is_user else None
             non_user_id = random.choice(non_user_ids) if not is_user else None
         
-        total_discount_amount = 0.0
+        total_discount_amount = 0
         reservation_id = None
         order_id = None 
         
@@ -255,111 +321,105 @@ def generate_dummy_data(session, num_records):
         
         if payment_type_choice == 0: # 영화 예매 트랜잭션
             num_seats = random.randint(1, 4)
-            schedule_id = random.choice(schedule_ids)
-            final_reservation_price = 0.0
-            age_count_map = {}
-            
-            age_types_for_seats = random.choices(AGE_TYPE_CODES, weights=[60, 25, 10, 5], k=num_seats)
-
-            # 티켓 가격 및 할인 계산
-            for age_type in age_types_for_seats:
-                ticket_price = calculate_final_ticket_price(schedule_id, age_type, schedule_map, screen_type_map, screen_time_map, age_type_map)
-                final_reservation_price += ticket_price
-                if age_type not in age_count_map:
-                    age_count_map[age_type] = {'count': 0, 'price': ticket_price}
-                age_count_map[age_type]['count'] += 1
-
-            # Reservation 생성
-            reservation = Reservation(
-                schedule_id=schedule_id, user_id=user_id, non_user_id=non_user_id, price=final_reservation_price, status=1, created_at=datetime.now() - timedelta(hours=random.randint(1,500))
+            schedule_id = draw_schedule()
+            age_indexes = age_type_sampler.draws(num_seats)
+            # 매진된 스케줄이면 (핫스팟 분포에서 인기 스케줄) 좌석이 남은 스케줄로 대체
+            schedule_id = seat_index.first_available(schedule_ids, schedule_id, num_seats)
+
+            # 티켓 가격 (가격 행렬 조회)
+            price_row = price_matrix.row(schedule_id)
+            final_reservation_price = 0
+            for k in age_indexes:
+                final_reservation_price += price_row[k]
+
+            # Reservation 생성 (좌석/좌석 할인 row도 같은 시각, DB 기본값 datetime.now를 쓰지 않음)
+            reserved_at = now - timedelta(hours=random.randint(1,500))
+            reservation_id = writer.add(Reservation,
+                schedule_id=schedule_id, user_id=user_id, non_user_id=non_user_id, price=final_reservation_price, status=1, created_at=reserved_at
             )
-            session.add(reservation)
-            session.flush()
-            reservation_id = reservation.reservation_id
 
             # ReservationSeat & TicketDiscount 생성
-            base_ticket_price = final_reservation_price / num_seats if num_seats > 0 else 0
+            base_ticket_price = final_reservation_price // num_seats if num_seats > 0 else 0
             
             for s in range(num_seats):
-                seat = ReservationSeat(schedule_id=schedule_id, seat_id=random.choice(seat_ids))
-                entities_to_add.append(seat)
-                session.flush()
+                reservation_seat_id = writer.add(ReservationSeat, schedule_id=schedule_id, seat_id=seat_index.draw(schedule_id, 1)[0],
+                                                 created_at=reserved_at)
 
-                entities_to_add.append(ReservationSeatList(reservation_id=reservation_id, reservation_seat_id=seat.reservation_seat_id))
+                writer.add(ReservationSeatList, reservation_id=reservation_id, reservation_seat_id=reservation_seat_id)
                 
                 # 좌석별 할인 적용 (회원만 혜택 가능, 50% 확률로 사용 시도)
                 if is_user and random.random() < 0.5:
                     
                     possible_benefits = []
                     # 1. 포인트 사용 가능
-                    if user_point_map.get(user_id, 0.0) > 1000: # 포인트 잔액이 1000원 이상일 때 시도 가능
+                    if ledger.point_balance(user_id) > MIN_POINT_BALANCE: # 포인트 잔액이 1000원 이상일 때 시도 가능
                         possible_benefits.append(DISCOUNT_POINT_CODE)
-                    # 2. 쿠폰 소유
-                    if user_id in coupon_users:
+                    # 2. 쿠폰 보유
+                    if ledger.coupons_left(user_id):
                         possible_benefits.append(DISCOUNT_COUPON_CODE)
-                    # 3. 관람권 소유
-                    if user_id in voucher_users:
+                    # 3. 관람권 보유
+                    if ledger.vouchers_left(user_id):
                         possible_benefits.append(DISCOUNT_VOUCHER_CODE)
                         
                     if possible_benefits:
                         benefit_code = random.choice(possible_benefits)
-                        max_discount = base_ticket_price * 0.5 
-                        discount_amount = round(random.uniform(500, max_discount), 2)
+                        max_discount = base_ticket_price // 2
+                        discount_amount = round(random.uniform(MIN_SEAT_DISCOUNT, max_discount))
                         
                         if benefit_code == DISCOUNT_POINT_CODE:
-                            # 포인트는 보유 포인트 이상 할인 불가 (시뮬레이션)
-                            available_point = user_point_map.get(user_id, 0.0)
-                            discount_amount = min(discount_amount, available_point)
-                            # 포인트 사용 후 잔액 감소 로직은 not yet 
+                            # 포인트는 보유 포인트 이상 할인 불가, 사용한 만큼 잔액 차감
+                            discount_amount = ledger.use_points(user_id, discount_amount)
+                        elif benefit_code == DISCOUNT_COUPON_CODE:
+                            ledger.use_coupon(user_id)
+                        else:
+                            ledger.use_voucher(user_id)
 
                         if discount_amount > 0:
                             total_discount_amount += discount_amount
-                            entities_to_add.append(TicketDiscount(
-                                reservation_seat_id=seat.reservation_seat_id, 
+                            writer.add(TicketDiscount,
+                                reservation_seat_id=reservation_seat_id, 
                                 benefit_code=benefit_code,
-                                applied_amount=discount_amount
-                            ))
+                                applied_amount=discount_amount,
+                                created_at=reserved_at
+                            )
 
             # ReservationCount 생성
-            for age_type, data in age_count_map.items():
-                entities_to_add.append(ReservationCount(reservation_id=reservation_id, age_type=age_type, count=data['count'], price=data['price']))
+            for k, count in count_age_types(age_indexes):
+                writer.add(ReservationCount, reservation_id=reservation_id, age_type=AGE_TYPE_CODES[k], count=count, price=price_row[k])
             
             origin_amount = final_reservation_price
             
         else: # 스토어 구매 트랜잭션 
             # 스토어 로직은 TicketDiscount 로직은 없음
             
-            selected_item_id = random.choice(store_item_ids)
+            selected_item_id = draw_store_item()
             unit_price = store_item_map[selected_item_id]
             quantity = random.randint(1, 3)
-            total_price = round(unit_price * quantity, 2)
+            total_price = unit_price * quantity
             
             # Order 테이블 생성 (FK 제약조건 충족을 위해 필수)
-            order = Order(
+            order_id = writer.add(Order,
                 user_id=user_id, 
                 price=total_price, 
                 status=0,
-                created_at=datetime.now() - timedelta(hours=random.randint(1,500))
+                created_at=now - timedelta(hours=random.randint(1,500))
             )
-            session.add(order)
-            session.flush()
-            order_id = order.order_id 
 
             # Payment 금액 설정
             origin_amount = total_price
             
             # 스토어 할인 (총 금액의 5% ~ 15% 랜덤)
             discount_percentage = random.uniform(0.05, 0.15)
-            total_discount_amount = round(origin_amount * discount_percentage, 2)
+            total_discount_amount = round(origin_amount * discount_percentage)
 
         # ------------------ 5. 공통 Payment 생성 및 결제 할인 적용 ------------------
         
-        final_amount_before_payment_discount = max(0.0, origin_amount - total_discount_amount)
+        final_amount_before_payment_discount = max(0, origin_amount - total_discount_amount)
         final_amount = final_amount_before_payment_discount
-        payment_discount_amount = 0.0
+        payment_discount_amount = 0
         
-        completed_date = datetime.now() - timedelta(hours=random.randint(1,10))
-        payment_method_choice = random.choices(['CARD','BANK','MOBILE'], weights=[70, 10, 20], k=1)[0]
+        completed_date = now - timedelta(hours=random.randint(1,10))
+        payment_method_choice = payment_method_sampler.draw()
         selected_card_company_code = None
         
         if payment_method_choice == 'CARD':
@@ -368,36 +428,26 @@ def generate_dummy_data(session, num_records):
             
             # ✅ PAYMENT_DISCOUNT 시나리오: 카드 결제 시 60% 확률로 할인 시도
             if random.random() < 0.6: 
-                policies = discount_policy_map.get(selected_card_company_code, [])
-                
-                if policies:
-                    policy = random.choice(policies)
-                    
-                    if final_amount_before_payment_discount >= policy['min_price']:
-                        
-                        discount = 0.0
-                        if policy['amount'] is not None:
-                            discount = policy['amount']
-                        elif policy['percent'] is not None:
-                            discount = final_amount_before_payment_discount * (policy['percent'] / 100)
-                            
-                        payment_discount_amount = round(min(discount, policy['max_benefit']), 2)
-                        
-                        if payment_discount_amount > 0:
-                            # PaymentDiscount 레코드 추가 준비 (나중에 payment_id 채움)
-                            entities_to_add.append(PaymentDiscount(
-                                payment_id='placeholder', 
-                                policy_id=policy['id'],
-                                applied_amount=payment_discount_amount
-                            ))
-                            final_amount = final_amount_before_payment_discount - payment_discount_amount
+                # 결제 금액에 적용 가능한(최소 사용 금액 이상) 카드사 정책 중 하나를 골라 적용
+                # (결제 금액이 레코드 끝에서야 정해지므로 결제 한 건씩 조회)
+                positions, discounts = policy_index.discounts([selected_card_company_code], [final_amount_before_payment_discount])
+                payment_discount_amount = discounts[0]
+
+                if payment_discount_amount > 0:
+                    # PaymentDiscount 레코드 보류 (Payment 생성 후 payment_id 연결)
+                    payment_children.add(PaymentDiscount,
+                        policy_id=policy_index.policy_ids[positions[0]],
+                        applied_amount=payment_discount_amount,
+                        created_at=completed_date
+                    )
+                    final_amount = final_amount_before_payment_discount - payment_discount_amount
 
         # 최종 할인 금액 업데이트
         total_discount_amount += payment_discount_amount
-        final_amount = max(0.0, final_amount)
+        final_amount = max(0, final_amount)
         
         # Payment 테이블 생성
-        payment = Payment(
+        payment_id = writer.add(Payment,
             payment_type=payment_type_choice, 
             type_id=reservation_id if payment_type_choice == 0 else order_id,
             origin_amount=origin_amount,
@@ -407,49 +457,61 @@ def generate_dummy_data(session, num_records):
             created_at=completed_date - timedelta(minutes=random.randint(1, 5)),
             completed_at=completed_date
         )
-        session.add(payment)
-        session.flush()
 
-        # PaymentDiscount의 payment_id 업데이트 (PaymentDiscount 객체가 생성되었다면)
-        for entity in entities_to_add:
-            if isinstance(entity, PaymentDiscount) and entity.payment_id == 'placeholder':
-                entity.payment_id = payment.payment_id
+        # 보류해 둔 PaymentDiscount에 payment_id 연결 (이번 트랜잭션 것만)
+        payment_children.attach(writer, payment_id)
 
         # PaymentDetail 생성
         if payment_method_choice == 'CARD':
-            entities_to_add.append(PaymentCard(
-                payment_id=payment.payment_id,
+            writer.add(PaymentCard,
+                payment_id=payment_id,
                 card_company_code=selected_card_company_code,
-                card_number=faker.numerify('####'),
+                card_number=pii.card_number(),
                 installment_months=random.choice([0,3,6]),
-                card_approval_number=faker.numerify('##########')
-            ))
+                card_approval_number=pii.approval_number()
+            )
         elif payment_method_choice == 'BANK':
-            entities_to_add.append(PaymentBankTransfer(
-                payment_id=payment.payment_id,
+            writer.add(PaymentBankTransfer,
+                payment_id=payment_id,
                 bank_code='01201', # 임의의 은행 코드
-                account_number=faker.bank_account_number(),
-                account_holder_name=faker.name()[:12]
-            ))
+                account_number=pii.account_number(),
+                account_holder_name=pii.name()
+            )
         else:
-            entities_to_add.append(PaymentMobile(
-                payment_id=payment.payment_id,
+            writer.add(PaymentMobile,
+                payment_id=payment_id,
                 carrier_code='00901', # 임의의 통신사 코드
-                phone_number=faker.phone_number()[:13],
-                approval_code=faker.numerify('##########')
-            ))
+                phone_number=pii.phone_number(),
+                approval_code=pii.approval_number()
+            )
 
 
         # 배치 커밋
-        if i % BATCH_SIZE == 0:
-            session.add_all(entities_to_add)
-            session.commit()
-            entities_to_add = []
+        if batcher.should_commit(writer):
+            # 이번 배치에서 사용한 포인트를 user 테이블에 반영 (ORM/Core writer는 배치와 같은 트랜잭션으로 커밋)
+            if options.writer_threads:
+                # 파이프라인 writer는 다른 커넥션에서 커밋하므로 잔액 반영은 짧은 트랜잭션으로 따로 커밋
+                session.commit()
+                ledger.write_back(session)
+                session.commit()
+            else:
+                ledger.write_back(session)
+            batcher.commit(writer)
             print(f"--- {i}건 커밋 완료 ---")
-
-    if entities_to_add:
-        session.add_all(entities_to_add)
-        session.commit()
+            if metrics:
+                metrics.report(i)
+
+    # 클라이언트에서 할당한 마지막 ID 기준으로 AUTO_INCREMENT 보정 (샤드 실행이면 부모 프로세스가 보정)
+    # 남은 포인트 차감은 모든 배치가 커밋된 뒤 짧은 트랜잭션으로 반영
+    writer.close(sync_auto_increment=options.id_ranges is None)
+    ledger.write_back(session)
+    session.commit()
+    if options.streaming:
+        unfreeze_reference_objects()
+        if hasattr(batcher, 'rss_summary'):
+            print(f"--- RSS(첫 배치/최대/마지막 배치, MB): {batcher.rss_summary()} ---")
+    if metrics:
+        metrics.finish(num_records, writer.row_counts)
 
     print(f"--- 최종 {num_records}개 통합 데이터 생성 완료 ---")
 
@@ -457,26 +519,70 @@ def generate_dummy_data(session, num_records):
 # 6. 실행 진입점
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="통합 트랜잭션(예매/스토어) 더미 데이터 생성")
+    parser.add_argument("--records", type=int, default=100000, help="생성할 트랜잭션 수")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="샤드별로 나눠 생성할 프로세스 수 (좌석/회원 분할과 샤드 시드가 달라지므로 같은 --seed라도 워커 수마다 데이터가 다름)")
+    parser.add_argument("--write-mode", choices=WRITE_MODES, default=WRITE_MODE_CORE, help="쓰기 방식")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드 (샤드별 시드는 이 값에서 파생)")
+    add_base_time_argument(parser)
+    parser.add_argument("--reset", choices=RESET_MODES, default=RESET_TRUNCATE,
+                        help="기존 데이터 초기화 방식 (swap: 섀도 테이블에 적재 후 RENAME TABLE 한 번으로 교체)")
+    add_metrics_arguments(parser)
+    add_batch_arguments(parser)
+    parser.add_argument("--writer-threads", type=int, default=0,
+                        help="생성과 DB 쓰기를 겹쳐 실행할 writer 스레드 수 (core/load_data, 0이면 순차 실행)")
+    parser.add_argument("--hotspot-skew", type=float, default=0.0,
+                        help="회원/스케줄/상품 id를 Zipf 분포로 뽑는 기울기 (0이면 균등, 1.0이면 상위 1%% id에 약 70%%)")
+    parser.add_argument("--append", action="store_true",
+                        help="기존 데이터를 지우지 않고 현재 최대 키 다음부터 --records건을 추가")
+    parser.add_argument("--bulk-load", action="store_true",
+                        help="적재 동안 보조 인덱스 삭제, foreign_key_checks/unique_checks=0, 적재 후 인덱스 재생성/ANALYZE/검증 (MySQL)")
+    add_streaming_arguments(parser)
+    args = parser.parse_args()
+    if args.streaming and args.write_mode == WRITE_MODE_ORM:
+        parser.error("--streaming은 core/load_data 쓰기 방식에서만 사용할 수 있습니다.")
+    if args.append and args.reset == RESET_SWAP:
+        parser.error("--append는 기존 데이터에 이어 붙이므로 --reset swap 과 함께 쓸 수 없습니다.")
+    if args.bulk_load and args.reset == RESET_SWAP:
+        parser.error("--bulk-load는 라이브 테이블에 적재할 때만 사용할 수 있습니다 (--reset swap 불가).")
+
     try:
-        engine = create_engine(DATABASE_URL, echo=False)
+        # local_infile: load_data 쓰기 모드(LOAD DATA LOCAL INFILE) 사용 시 필요
+        engine = create_engine(DATABASE_URL, echo=False, connect_args={"local_infile": True})
         Session = sessionmaker(bind=engine)
         session = Session()
 
-        print("기존 트랜잭션 데이터(예매, 스토어) 삭제 및 초기화 중...")
-        # 역순 삭제 (FK 제약조건을 피하기 위해 모든 관련 테이블 삭제)
-        tables_to_delete = ['reservation_seat_list', 'payment_discount', 'ticket_discount', 
-                            'payment_card', 'payment_bank_transfer', 'payment_mobile', 
-                            'payment', 'reservation_count', 'reservation_seat', 'reservation', 
-                            'order'] 
-        
-        for table_name in tables_to_delete:
-            session.execute(text(f"TRUNCATE TABLE {table_name}"))
-        session.commit()
+        swap = None
+        target_session = session
+        if args.append:
+            print(f"기존 데이터에 이어서 추가합니다 (현재 최대 키: {current_high_water_marks(session)})...")
+        elif args.reset == RESET_SWAP:
+            print("섀도 테이블 준비 중 (적재 후 라이브 테이블과 교체)...")
+            swap = ShadowTableSwap(session, TABLES_TO_DELETE)
+            swap.prepare()
+            target_session = Session(bind=engine.execution_options(**swap.execution_options))
+        else:
+            print(f"기존 트랜잭션 데이터(예매, 스토어) 삭제 및 초기화 중 ({args.reset})...")
+            # FK 체크를 끈 세션에서 자식 → 부모 순서로 TRUNCATE
+            reset_tables(session, TABLES_TO_DELETE, args.reset)
 
         # 데이터 생성 (예: 10만 건)
         # 80%는 예매 , 20%는 스토어 
-        generate_dummy_data(session, 100000)
-
+        options = SeederOptions.from_args(args, metrics=create_metrics('fin', args))
+        # --bulk-load: 보조 인덱스/FK·UNIQUE 검사를 미루고 적재 후 재생성, ANALYZE, 검증
+        with bulk_load_mode(session, TABLES_TO_DELETE) if args.bulk_load else nullcontext():
+            if args.workers > 1:
+                run_sharded('fin', DATABASE_URL, args.records, args.workers, options,
+                            execution_options=swap.execution_options if swap else None, bulk_load=args.bulk_load)
+            else:
+                generate_dummy_data(target_session, args.records, options)
+
+        if swap:
+            swap.swap()
+            print("섀도 테이블 교체 완료")
+        if target_session is not session:
+            target_session.close()
         session.close()
 
     except Exception as e:
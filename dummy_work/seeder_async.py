@@ -0,0 +1,221 @@
+# seeder_async.py
+
+from sqlalchemy import create_engine, delete, event, insert
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import sessionmaker
+from contextlib import nullcontext
+import argparse
+import asyncio
+import importlib.util
+import time
+from seeder_ids import PK_COLUMNS
+from seeder_money import decimal_rows, money_columns
+from seeder_writer import WRITE_MODE_CORE, CoreRowWriter
+from seeder_reset import RESET_DELETE, RESET_TRUNCATE, reset_tables
+from seeder_bulkload import bulk_load_mode, disable_checks_on_connect
+from seeder_batching import add_batch_arguments, create_batch_controller
+from seeder_metrics import add_metrics_arguments, create_metrics
+from seeder_options import SeederOptions
+
+# -------------------------------------------------------------------------------------
+# 1. 상수 정의
+
+ASYNC_CONNECTIONS = 4   # 동시에 쓰는 async 커넥션 수
+
+# 동기 드라이버 → (async 드라이버, 필요한 패키지)
+ASYNC_DRIVERS = {
+    'mysql': ('mysql+aiomysql', 'aiomysql'),
+    'sqlite': ('sqlite+aiosqlite', 'aiosqlite'),
+}
+
+# -------------------------------------------------------------------------------------
+# 2. async 테이블 writer
+
+def to_async_url(database_url):
+    """mysql+pymysql:// 등 동기 URL을 같은 DB의 async 드라이버 URL로 바꿉니다.
+
+    async 드라이버 패키지는 이 경로에서만 필요하므로 여기서 설치 여부를 확인합니다.
+    """
+    url = make_url(database_url)
+    driver = ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise ValueError(f"async 드라이버가 없는 DB입니다: {url.get_backend_name()} (사용 가능: {list(ASYNC_DRIVERS)})")
+    drivername, package = driver
+    if importlib.util.find_spec(package) is None:
+        raise ImportError(f"async 쓰기에는 {package} 패키지가 필요합니다 (pip install {package}).")
+    return url.set(drivername=drivername)
+
+
+def _cleanup_key(model, columns, rows):
+    """배치 row를 지울 때 쓸 (컬럼, 최소값, 최대값). 부모는 자기 PK, 자식은 참조하는 부모 PK 컬럼.
+
+    PK는 IdBlockAllocator가 이 프로세스에 예약한 블록에서 오름차순으로 할당되므로 범위로 지울 수 있습니다.
+    """
+    for k, name in enumerate(columns):
+        if name in PK_COLUMNS.values():
+            values = [row[k] for row in rows]
+            return model.__table__.c[name], min(values), max(values)
+    return None
+
+
+def inject_latency(engine, seconds):
+    """테스트용: 동기 엔진의 쿼리와 커밋마다 네트워크 왕복 지연을 흉내 냅니다."""
+    @event.listens_for(engine, "before_cursor_execute")
+    def _sleep_before_execute(conn, cursor, statement, parameters, context, executemany):
+        time.sleep(seconds)
+
+    @event.listens_for(engine, "commit")
+    def _sleep_before_commit(conn):
+        time.sleep(seconds)
+    return engine
+
+
+class AsyncTableWriter:
+    """배치 하나를 부모 테이블 → 자식 테이블 순서로, 자식 테이블은 여러 async 커넥션에서 동시에 씁니다.
+
+    부모 테이블(PK_COLUMNS: reservation, reservation_seat, order, payment)은 한 트랜잭션에서
+    순서대로 INSERT 하고 커밋합니다. 그 뒤에는 자식 테이블(payment_card, payment_bank_transfer,
+    payment_mobile, payment_discount, ticket_discount, reservation_count, reservation_seat_list)이
+    서로 의존하지 않으므로 테이블마다 별도 커넥션/트랜잭션으로 동시에 보냅니다.
+    RTT가 큰 네트워크에서는 왕복 대기가 겹쳐 배치 하나의 쓰기 시간이 줄어듭니다.
+
+    그래서 배치 하나가 한 트랜잭션이 아닙니다. 자식 테이블 쓰기 하나가 실패하면 나머지 자식 쓰기를
+    취소하고, 이미 커밋된 이 배치의 자식/부모 row를 PK 범위로 지운 뒤 예외를 다시 올립니다
+    (시더는 그 배치에서 멈춤). 지우기까지 실패하면 그 배치의 ID 범위를 담은 메시지로 알립니다.
+
+    injected_latency(초)를 주면 쿼리와 커밋마다 그만큼 기다려 원격 DB를 흉내 냅니다 (로컬 테스트용).
+    bulk_load면 --bulk-load의 foreign_key_checks/unique_checks=0을 async 커넥션에도 겁니다.
+    """
+
+    def __init__(self, database_url, connections=ASYNC_CONNECTIONS, injected_latency=0.0, execution_options=None,
+                 bulk_load=False):
+        self.connections = connections
+        self.injected_latency = injected_latency
+        self.loop = asyncio.new_event_loop()
+        self.engine = create_async_engine(to_async_url(database_url), pool_size=connections, max_overflow=0,
+                                          execution_options=execution_options or {})
+        if bulk_load:
+            disable_checks_on_connect(self.engine)
+
+    def row_writer(self, session, id_allocator, table_order):
+        """이 writer로 배치를 보내는 row writer (create_row_writer에서 사용)."""
+        return AsyncRowWriter(session, id_allocator, table_order, self)
+
+    async def _round_trip(self):
+        if self.injected_latency:
+            await asyncio.sleep(self.injected_latency)
+
+    async def _write_tables(self, tables):
+        """[(model, 컬럼명, rows), ...]를 커넥션 하나, 트랜잭션 하나로 씁니다."""
+        async with self.engine.begin() as conn:
+            for model, columns, rows in tables:
+                await self._round_trip()
+                await conn.execute(insert(model.__table__), decimal_rows(columns, rows, money_columns(model.__table__)))
+            await self._round_trip()   # COMMIT
+
+    async def _write_batch(self, batch):
+        parents = [table for table in batch if table[0].__tablename__ in PK_COLUMNS]
+        children = [table for table in batch if table[0].__tablename__ not in PK_COLUMNS]
+        if parents:
+            await self._write_tables(parents)   # 실패하면 이 트랜잭션만 롤백되고 자식은 쓰지 않음
+        # 커넥션 풀 크기(connections)가 동시 실행 수의 상한
+        tasks = [asyncio.ensure_future(self._write_tables([table])) for table in children]
+        if not tasks:
+            return
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        failed = next((task.exception() for task in done if task.exception()), None)
+        if failed is None:
+            return
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        try:
+            await self._delete_batch(batch)
+        except Exception as cleanup_error:
+            ranges = {model.__tablename__: key[1:] for model, columns, rows in parents
+                      if (key := _cleanup_key(model, columns, rows))}
+            raise RuntimeError(f"자식 테이블 쓰기 실패 후 배치 정리도 실패했습니다. 부모 ID 범위 {ranges}의 row를 "
+                               f"직접 지워야 합니다: {cleanup_error}") from failed
+        raise failed
+
+    async def _delete_batch(self, batch):
+        """이 배치가 커밋한 row를 자식 → 부모 순서로 한 트랜잭션에서 지웁니다."""
+        async with self.engine.begin() as conn:
+            for model, columns, rows in reversed(batch):
+                key = _cleanup_key(model, columns, rows)
+                if key:
+                    column, low, high = key
+                    await conn.execute(delete(model.__table__).where(column.between(low, high)))
+
+    def write_batch(self, batch):
+        """take_batch()로 꺼낸 배치를 쓰고 커밋이 모두 끝날 때까지 기다립니다."""
+        self.loop.run_until_complete(self._write_batch(batch))
+
+    def close(self):
+        self.loop.run_until_complete(self.engine.dispose())
+        self.loop.close()
+
+
+class AsyncRowWriter(CoreRowWriter):
+    """Core writer와 같이 튜플을 모으고, 배치 쓰기와 커밋은 AsyncTableWriter에 맡깁니다.
+
+    동기 session은 참조 데이터 조회와 AUTO_INCREMENT 보정에만 사용합니다.
+    """
+
+    def __init__(self, session, id_allocator, table_order, table_writer):
+        super().__init__(session, id_allocator, table_order)
+        self.table_writer = table_writer
+
+    def write_batch(self, session, batch):
+        self.table_writer.write_batch(batch)
+
+    def commit_batch(self):
+        """테이블별 커밋은 async 커넥션에서 끝나므로 배치를 보내기만 합니다."""
+        self.flush_batch()
+
+# -------------------------------------------------------------------------------------
+# 3. 실행 진입점 (통합 시더 async 버전)
+
+if __name__ == '__main__':
+    import data_seeder_unified
+
+    parser = argparse.ArgumentParser(description="통합 트랜잭션 더미 데이터 생성 (async 드라이버, 자식 테이블 동시 쓰기)")
+    parser.add_argument("--records", type=int, default=100000, help="생성할 트랜잭션 수")
+    parser.add_argument("--connections", type=int, default=ASYNC_CONNECTIONS, help="동시에 쓰는 async 커넥션 수")
+    parser.add_argument("--seed", type=int, default=42, help="난수 시드")
+    parser.add_argument("--database-url", default=data_seeder_unified.DATABASE_URL,
+                        help="대상 DB (mysql+pymysql:// 는 mysql+aiomysql:// 로 바꿔 사용)")
+    parser.add_argument("--injected-latency-ms", type=float, default=0.0,
+                        help="테스트용: 쿼리마다 추가할 왕복 지연(ms), 로컬 DB로 원격 DB를 흉내 낼 때 사용")
+    parser.add_argument("--reset", choices=[RESET_DELETE, RESET_TRUNCATE], default=RESET_TRUNCATE,
+                        help="기존 데이터 초기화 방식")
+    parser.add_argument("--bulk-load", action="store_true",
+                        help="적재 동안 보조 인덱스 삭제, foreign_key_checks/unique_checks=0, 적재 후 인덱스 재생성/ANALYZE/검증 (MySQL)")
+    add_metrics_arguments(parser)
+    add_batch_arguments(parser)
+    args = parser.parse_args()
+
+    latency = args.injected_latency_ms / 1000
+    table_writer = None
+    try:
+        engine = create_engine(args.database_url, echo=False)
+        if latency:
+            inject_latency(engine, latency)
+        session = sessionmaker(bind=engine)()
+
+        print(f"기존 데이터 삭제 및 초기화 중 ({args.reset})...")
+        reset_tables(session, data_seeder_unified.TABLES_TO_DELETE, args.reset)
+
+        table_writer = AsyncTableWriter(args.database_url, args.connections, latency, bulk_load=args.bulk_load)
+        options = SeederOptions(seed=args.seed, write_mode=WRITE_MODE_CORE, batch_controller=create_batch_controller(args),
+                                async_writer=table_writer, metrics=create_metrics('data_seeder_unified_async', args))
+        with bulk_load_mode(session, data_seeder_unified.TABLES_TO_DELETE) if args.bulk_load else nullcontext():
+            data_seeder_unified.generate_dummy_data(session, args.records, options)
+        session.close()
+
+    except Exception as e:
+        print(f"\n[오류 발생]: {e}")
+    finally:
+        if table_writer:
+            table_writer.close()
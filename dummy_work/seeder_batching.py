@@ -0,0 +1,89 @@
+# seeder_batching.py
+
+import time
+
+# -------------------------------------------------------------------------------------
+# 1. 상수 정의
+
+TARGET_COMMIT_SECONDS = 0.5   # 트랜잭션 하나(배치 전송 + 커밋)의 목표 소요 시간
+INITIAL_BATCH_ROWS = 5000     # 첫 배치의 row 수 (레코드가 아니라 모든 테이블 row 합계)
+MIN_BATCH_ROWS = 500
+MAX_BATCH_ROWS = 50000        # writer 버퍼 메모리 상한
+CONTENTION_FACTOR = 2.0       # 목표의 이 배수 이상 걸리면 락 대기/경합으로 보고 배치를 절반으로
+
+# -------------------------------------------------------------------------------------
+# 2. 배치 크기 조절
+
+class AdaptiveBatchController:
+    """writer에 쌓인 row 수로 커밋 시점을 정하고, 측정한 커밋 소요 시간으로 배치 크기를 조절합니다.
+
+    커밋마다 (row 수 / 소요 시간)으로 목표 시간에 맞는 row 수를 추정해 현재 크기와 절반씩 섞고,
+    한 번에 2배 넘게 키우지 않습니다. 소요 시간이 목표의 CONTENTION_FACTOR배를 넘으면
+    (락 대기, 다른 세션과의 경합 등) 바로 절반으로 줄입니다. 크기는 [min_rows, max_rows]로 제한합니다.
+    파이프라인 writer처럼 커밋이 다른 스레드에서 일어나면 writer.last_commit (가장 최근에 끝난
+    배치의 row 수, 소요 시간)을 대신 사용합니다.
+    target_seconds=None 이면 조절 없이 고정 크기로 동작합니다.
+    """
+
+    def __init__(self, target_seconds=TARGET_COMMIT_SECONDS, initial_rows=INITIAL_BATCH_ROWS,
+                 min_rows=MIN_BATCH_ROWS, max_rows=MAX_BATCH_ROWS):
+        self.target_seconds = target_seconds
+        self.min_rows = min_rows
+        self.max_rows = max_rows
+        self.batch_rows = max(min_rows, min(max_rows, initial_rows))
+        self.commits = 0
+
+    @classmethod
+    def fixed(cls, rows):
+        """트랜잭션마다 rows개 이상 쌓이면 커밋하는 고정 크기 컨트롤러."""
+        return cls(target_seconds=None, initial_rows=rows, min_rows=rows, max_rows=rows)
+
+    def __str__(self):
+        if self.target_seconds is None:
+            return f"고정 {self.batch_rows} rows"
+        return f"자동 (목표 {self.target_seconds}s, {self.min_rows}~{self.max_rows} rows)"
+
+    def should_commit(self, writer):
+        """레코드 하나를 마칠 때마다 호출. 버퍼의 row 수가 현재 배치 크기에 도달했는지 확인합니다."""
+        return writer.pending_rows >= self.batch_rows
+
+    def commit(self, writer):
+        """배치를 커밋하고 소요 시간으로 다음 배치 크기를 정합니다. 커밋한 row 수를 반환합니다."""
+        rows = writer.pending_rows
+        start = time.perf_counter()
+        writer.commit_batch()
+        elapsed = time.perf_counter() - start
+        observed = getattr(writer, 'last_commit', None)
+        self._adjust(*(observed or (rows, elapsed)))
+        self.commits += 1
+        return rows
+
+    def _adjust(self, rows, elapsed):
+        if self.target_seconds is None or elapsed <= 0 or rows == 0:
+            return
+        if elapsed > self.target_seconds * CONTENTION_FACTOR:
+            size = self.batch_rows // 2
+        else:
+            ideal = rows * self.target_seconds / elapsed
+            size = min(int((self.batch_rows + ideal) / 2), self.batch_rows * 2)
+        self.batch_rows = max(self.min_rows, min(self.max_rows, size))
+
+# -------------------------------------------------------------------------------------
+# 3. CLI 연동
+
+def add_batch_arguments(parser):
+    """시더 CLI에 배치 크기 옵션을 추가합니다."""
+    parser.add_argument("--batch-rows", type=int, default=None,
+                        help="트랜잭션당 row 수 고정 (생략 시 커밋 소요 시간에 맞춰 자동 조절)")
+    parser.add_argument("--batch-target-seconds", type=float, default=TARGET_COMMIT_SECONDS,
+                        help="자동 조절 시 트랜잭션당 목표 커밋 시간(초)")
+    parser.add_argument("--batch-max-rows", type=int, default=MAX_BATCH_ROWS,
+                        help="자동 조절 시 배치 row 수 상한 (버퍼 메모리 상한)")
+
+
+def create_batch_controller(args):
+    """CLI 인자로 AdaptiveBatchController를 만듭니다."""
+    if args.batch_rows:
+        return AdaptiveBatchController.fixed(args.batch_rows)
+    return AdaptiveBatchController(target_seconds=args.batch_target_seconds, max_rows=args.batch_max_rows,
+                                   initial_rows=min(INITIAL_BATCH_ROWS, args.batch_max_rows))
@@ -0,0 +1,749 @@
+# seeder_bench.py
+
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+from array import array
+from datetime import date, datetime
+from decimal import Decimal
+import argparse
+import contextlib
+import importlib
+import inspect
+import io
+import json
+import multiprocessing
+import numpy as np
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from seeder_writer import WRITE_MODE_CORE, WRITE_MODE_ORM, WRITE_MODES
+from seeder_reset import RESET_TRUNCATE, reset_tables
+from seeder_streaming import DEFAULT_MEMORY_CEILING_MB, MemoryBoundedBatchController, current_rss_mb
+from seeder_options import SeederOptions
+from seeder_batching import MIN_BATCH_ROWS
+from seeder_blocks import (AGE_TYPE_WEIGHTS, INSTALLMENT_MONTHS, MAX_SEATS, PAYMENT_METHOD_WEIGHTS, PAYMENT_METHODS,
+                           PAYMENT_TYPE_WEIGHTS, USER_WEIGHTS, iter_record_blocks)
+from seeder_discounts import DiscountPolicyIndex
+from seeder_ledger import INITIAL_COUPONS, BenefitLedger
+from seeder_money import cents_to_decimal, percent_of
+from seeder_pending import PendingChildren
+from seeder_pii import PiiPool
+from seeder_reference import value_for
+from seeder_sampling import AliasSampler, WeightedSampler, hotspot_sampler
+
+try:
+    import resource   # 피크 RSS 측정 (Linux/macOS)
+except ImportError:
+    resource = None
+
+# -------------------------------------------------------------------------------------
+# 1. 상수 정의
+
+# 벤치마크 대상: {이름: (모듈, 생성 함수)}
+BENCH_TARGETS = {
+    'unified': ('data_seeder_unified', 'generate_dummy_data'),
+    'fin': ('fin', 'generate_dummy_data'),
+    'reservation_only': ('data_seeder_reservation_only', 'generate_dummy_data'),
+    'store_payment': ('data_seeder_store_payment_only', 'generate_store_payments'),
+}
+
+DEFAULT_RECORD_COUNTS = [1000, 10000]
+DEFAULT_BATCH_SIZES = [0, 5000]   # 트랜잭션당 row 수, 0 = 커밋 시간 기준 자동 조절
+
+# SQLite 대역 DB의 참조 데이터 크기
+STANDIN_USERS = 2000
+STANDIN_NON_USERS = 1000
+STANDIN_SEATS = 500
+STANDIN_STORE_ITEMS = 20
+
+# -------------------------------------------------------------------------------------
+# 2. SQLite 대역 DB (로컬 MySQL 없이 실행할 때)
+
+STANDIN_DDL = """
+CREATE TABLE user (user_id INTEGER PRIMARY KEY, point DECIMAL(10,2) DEFAULT 0);
+CREATE TABLE non_user (non_user_id INTEGER PRIMARY KEY);
+CREATE TABLE seat (seat_id INTEGER PRIMARY KEY);
+CREATE TABLE screen_type (screen_type VARCHAR(7) PRIMARY KEY, price DECIMAL(10,2));
+CREATE TABLE screen_time (screen_time VARCHAR(7) PRIMARY KEY, adjust_price DECIMAL(10,2));
+CREATE TABLE age_type (age_type VARCHAR(7) PRIMARY KEY, adjust_price DECIMAL(10,2));
+CREATE TABLE screen_schedule (schedule_id INTEGER PRIMARY KEY, screen_type VARCHAR(7), screen_time VARCHAR(7));
+CREATE TABLE store_item (store_item_id INTEGER PRIMARY KEY, price DECIMAL(10,2));
+CREATE TABLE discount_policy (policy_id INTEGER PRIMARY KEY, partner_id VARCHAR(7), discount_amount DECIMAL(10,2),
+                              discount_percent DECIMAL(5,2), min_price DECIMAL(10,2), max_benefit_amount DECIMAL(10,2), end_date DATE);
+CREATE TABLE coupon (coupon_id INTEGER PRIMARY KEY, discount_type INTEGER, discount_value DECIMAL(10,2),
+                     max_discount_amount DECIMAL(10,2), min_price DECIMAL(10,2));
+CREATE TABLE reservation (reservation_id INTEGER PRIMARY KEY, schedule_id BIGINT, user_id BIGINT, non_user_id BIGINT,
+                          price DECIMAL(10,2), status TINYINT, created_at DATETIME);
+CREATE TABLE reservation_seat (reservation_seat_id INTEGER PRIMARY KEY, schedule_id BIGINT, seat_id BIGINT, created_at DATETIME);
+CREATE TABLE reservation_count (reservation_id BIGINT, age_type VARCHAR(7), count INT, price DECIMAL(10,2),
+                                PRIMARY KEY (reservation_id, age_type));
+CREATE TABLE reservation_seat_list (reservation_id BIGINT, reservation_seat_id BIGINT, PRIMARY KEY (reservation_id, reservation_seat_id));
+CREATE TABLE "order" (order_id INTEGER PRIMARY KEY, user_id BIGINT, store_item_id BIGINT, quantity INT, unit_price DECIMAL(10,2),
+                      price DECIMAL(10,2), status TINYINT, created_at DATETIME);
+CREATE TABLE payment (payment_id INTEGER PRIMARY KEY, payment_type TINYINT, type_id BIGINT, origin_amount DECIMAL(10,2),
+                      discount_total DECIMAL(10,2), amount DECIMAL(10,2), status TINYINT, created_at DATETIME, completed_at DATETIME);
+CREATE TABLE ticket_discount (benefit_id INTEGER PRIMARY KEY, reservation_seat_id BIGINT UNIQUE, benefit_code VARCHAR(7),
+                              applied_amount DECIMAL(10,2), created_at DATETIME);
+CREATE TABLE payment_discount (payment_id BIGINT, policy_id BIGINT, applied_amount DECIMAL(10,2), created_at DATETIME,
+                               PRIMARY KEY (payment_id, policy_id));
+CREATE TABLE payment_card (payment_id INTEGER PRIMARY KEY, card_company_code VARCHAR(7), card_number VARCHAR(4),
+                           installment_months INT, card_approval_number VARCHAR(10));
+CREATE TABLE payment_bank_transfer (payment_id INTEGER PRIMARY KEY, bank_code VARCHAR(7), account_number VARCHAR(30),
+                                    account_holder_name VARCHAR(12));
+CREATE TABLE payment_mobile (payment_id INTEGER PRIMARY KEY, carrier_code VARCHAR(7), phone_number VARCHAR(13), approval_code VARCHAR(10));
+"""
+
+
+def create_sqlite_standin(path, num_schedules, num_orders=0):
+    """시더가 읽는 참조 테이블과 트랜잭션 테이블을 가진 SQLite 파일을 새로 만듭니다."""
+    if os.path.exists(path):
+        os.remove(path)
+    r = random.Random(1)
+    con = sqlite3.connect(path)
+    con.executescript(STANDIN_DDL)
+    con.executemany("INSERT INTO user VALUES (?, ?)", [(i, r.choice([0, 500, 3000, 20000])) for i in range(1, STANDIN_USERS + 1)])
+    con.executemany("INSERT INTO non_user VALUES (?)", [(i,) for i in range(1, STANDIN_NON_USERS + 1)])
+    con.executemany("INSERT INTO seat VALUES (?)", [(i,) for i in range(1, STANDIN_SEATS + 1)])
+    con.executemany("INSERT INTO screen_type VALUES (?, ?)", [("00301", 0), ("00302", 5000), ("00303", 8000)])
+    con.executemany("INSERT INTO screen_time VALUES (?, ?)", [("00401", -2000), ("00402", 0), ("00403", 1000)])
+    con.executemany("INSERT INTO age_type VALUES (?, ?)", [("00201", 0), ("00202", -2000), ("00203", -5000), ("00204", -6000)])
+    con.executemany("INSERT INTO screen_schedule VALUES (?, ?, ?)", [
+        (i, r.choice(["00301", "00302", "00303"]), r.choice(["00401", "00402", "00403"])) for i in range(1, num_schedules + 1)
+    ])
+    con.executemany("INSERT INTO store_item VALUES (?, ?)", [(i, r.choice([3000, 5500, 9000])) for i in range(1, STANDIN_STORE_ITEMS + 1)])
+    policies = []
+    for i in range(1, 31):
+        amount = r.choice([None, 1000, 2000])
+        policies.append((i, f"0050{r.randint(1, 5)}", amount, 10 if amount is None else None,
+                         r.choice([0, 10000, 20000]), r.choice([None, 3000]), "2099-12-31"))
+    con.executemany("INSERT INTO discount_policy VALUES (?, ?, ?, ?, ?, ?, ?)", policies)
+    con.executemany("INSERT INTO coupon VALUES (?, ?, ?, ?, ?)", [(1, 0, 2000, None, 0), (2, 1, 20, 4000, 10000), (3, 1, 10, None, 0)])
+    con.executemany('INSERT INTO "order" (order_id, user_id, store_item_id, quantity, unit_price, price, status) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    [(i, 1, 1, 1, 3000, 3000, 0) for i in range(1, num_orders + 1)])
+    con.commit()
+    con.close()
+
+
+def _create_engine(database_url):
+    """벤치마크용 엔진. SQLite에는 MySQL 함수 CURDATE()를 등록합니다."""
+    if database_url.startswith('mysql'):
+        return create_engine(database_url, echo=False, connect_args={"local_infile": True})
+    engine = create_engine(database_url, echo=False)
+
+    @event.listens_for(engine, "connect")
+    def _register_functions(dbapi_connection, connection_record):
+        dbapi_connection.create_function("CURDATE", 0, lambda: date.today().isoformat())
+
+    return engine
+
+# -------------------------------------------------------------------------------------
+# 3. 측정
+
+class TimedSession(Session):
+    """execute / flush / commit에 걸린 시간(DB 시간)을 누적하는 세션.
+
+    전체 시간에서 DB 시간을 빼면 파이썬 쪽 생성 시간이 됩니다.
+    commit 안의 flush처럼 중첩된 호출은 바깥 호출에서 한 번만 셉니다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.db_seconds = 0.0
+        self._depth = 0
+
+    def _timed(self, method, *args, **kwargs):
+        if self._depth:
+            return method(*args, **kwargs)
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            self.db_seconds += time.perf_counter() - start
+            self._depth -= 1
+
+    def execute(self, *args, **kwargs):
+        return self._timed(super().execute, *args, **kwargs)
+
+    def flush(self, *args, **kwargs):
+        return self._timed(super().flush, *args, **kwargs)
+
+    def commit(self):
+        return self._timed(super().commit)
+
+
+def _peak_rss_mb():
+    """현재 프로세스의 피크 RSS (MB). resource 모듈이 없으면 None."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return round(peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024, 1)
+
+
+def _row_counts(session, tables):
+    return {table: session.execute(text(f"SELECT COUNT(*) FROM `{table}`")).scalar() for table in tables}
+
+
+def _batch_controller(case):
+    """케이스의 배치 컨트롤러. 커밋마다 RSS를 기록하도록 항상 MemoryBoundedBatchController를 씁니다
+    (스트리밍 케이스가 아니면 상한 없이 기록만 하므로 배치 동작은 AdaptiveBatchController와 같음)."""
+    ceiling_mb = case['memory_ceiling_mb'] if case['streaming'] else None
+    if case['batch_size']:
+        return MemoryBoundedBatchController(target_seconds=None, initial_rows=case['batch_size'], min_rows=case['batch_size'],
+                                            max_rows=case['batch_size'], ceiling_mb=ceiling_mb)
+    return MemoryBoundedBatchController(ceiling_mb=ceiling_mb)
+
+
+def _run_case(case):
+    """워커 프로세스: 케이스 하나를 실행하고 측정값을 반환합니다 (케이스마다 새 프로세스 → 피크 RSS 분리).
+
+    첫 배치와 마지막 배치 커밋 직후의 RSS 차이(rss_growth_mb)가 레코드 수와 무관하게 0 근처면
+    실행 중 메모리가 평탄한 것입니다 (피크 RSS는 참조 데이터 크기에 따라 달라짐).
+    """
+    module_name, function_name = BENCH_TARGETS[case['target']]
+    database_url = case['database_url']
+    if database_url is None:
+        path = os.path.join(case['tmp_dir'], f"bench_{case['target']}_{case['records']}_{case['batch_size']}.db")
+        create_sqlite_standin(path, num_schedules=max(200, case['records'] // 50), num_orders=case['records'])
+        database_url = f"sqlite:///{path}"
+
+    seeder = importlib.import_module(module_name)
+    engine = _create_engine(database_url)
+    session = TimedSession(bind=engine)
+    tables = seeder.TABLES_TO_DELETE
+    if case['database_url'] is not None:
+        reset_tables(session, tables, RESET_TRUNCATE)
+    rows_before = _row_counts(session, tables)
+    session.db_seconds = 0.0
+
+    generate = getattr(seeder, function_name)
+    batch_controller = _batch_controller(case)
+    if 'options' in inspect.signature(generate).parameters:   # SeederOptions를 받는 시더 (unified, fin)
+        call_args = (SeederOptions(write_mode=case['write_mode'], batch_controller=batch_controller, streaming=case['streaming']),)
+        kwargs = {}
+    else:
+        call_args = ()
+        kwargs = {'write_mode': case['write_mode'], 'batch_controller': batch_controller}
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):   # 시더 진행 로그 숨김
+        generate(session, case['records'], *call_args, **kwargs)
+    total_seconds = time.perf_counter() - start
+    write_seconds = session.db_seconds
+
+    rows_after = _row_counts(session, tables)
+    session.close()
+    engine.dispose()
+    if case['database_url'] is None:
+        os.remove(path)
+
+    rows = {table: rows_after[table] - rows_before[table] for table in tables}
+    rss = batch_controller.rss_summary() or (None, None, None)
+    return {
+        'target': case['target'],
+        'records': case['records'],
+        'batch_size': case['batch_size'],
+        'write_mode': case['write_mode'],
+        'streaming': case['streaming'],
+        'total_seconds': round(total_seconds, 3),
+        'generation_seconds': round(total_seconds - write_seconds, 3),
+        'write_seconds': round(write_seconds, 3),
+        'records_per_sec': round(case['records'] / total_seconds, 1),
+        'rows': rows,
+        'rows_per_sec': {table: round(count / total_seconds, 1) for table, count in rows.items()},
+        'peak_rss_mb': _peak_rss_mb(),
+        'rss_first_batch_mb': rss[0],
+        'rss_last_batch_mb': rss[2],
+        'rss_growth_mb': None if rss[0] is None else round(rss[2] - rss[0], 1),
+        'commits': batch_controller.commits,
+        'ceiling_hits': batch_controller.ceiling_hits,
+    }
+
+
+def run_benchmarks(targets, record_counts, batch_sizes, write_modes, database_url=None,
+                   streaming=False, memory_ceiling_mb=DEFAULT_MEMORY_CEILING_MB):
+    """모든 (대상, 건수, 배치 크기, 쓰기 방식) 조합을 케이스마다 새 프로세스에서 실행합니다.
+
+    streaming=True 이면 RSS 상한(memory_ceiling_mb)을 둔 스트리밍 모드로 실행하고, ORM 쓰기 방식은 건너뜁니다.
+    """
+    results = []
+    context = multiprocessing.get_context('spawn')
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for target in targets:
+            for records in record_counts:
+                for batch_size in batch_sizes:
+                    for write_mode in write_modes:
+                        if streaming and write_mode == WRITE_MODE_ORM:
+                            continue
+                        case = {'target': target, 'records': records, 'batch_size': batch_size, 'write_mode': write_mode,
+                                'streaming': streaming, 'memory_ceiling_mb': memory_ceiling_mb,
+                                'database_url': database_url, 'tmp_dir': tmp_dir}
+                        with context.Pool(processes=1) as pool:
+                            result = pool.apply(_run_case, (case,))
+                        results.append(result)
+                        _print_result(result)
+    return results
+
+# -------------------------------------------------------------------------------------
+# 4. 출력 및 기준선 비교
+
+def _case_key(result):
+    return result['target'], result['records'], result['batch_size'], result['write_mode'], result.get('streaming', False)
+
+
+def _print_result(result):
+    mode = result['write_mode'] + (' streaming' if result.get('streaming') else '')
+    print(f"[{result['target']}] records={result['records']} batch={result['batch_size']} mode={mode}: "
+          f"{result['records_per_sec']:,.0f} records/sec (전체 {result['total_seconds']:.2f}s = "
+          f"생성 {result['generation_seconds']:.2f}s + DB {result['write_seconds']:.2f}s, 피크 RSS {result['peak_rss_mb']} MB)")
+    if result.get('rss_first_batch_mb') is not None:
+        print(f"    RSS 첫 배치 {result['rss_first_batch_mb']} MB → 마지막 배치 {result['rss_last_batch_mb']} MB "
+              f"(증가 {result['rss_growth_mb']:+} MB, 커밋 {result['commits']}회, 상한 초과 {result['ceiling_hits']}회)")
+    for table, rate in result['rows_per_sec'].items():
+        if result['rows'][table]:
+            print(f"    {table:<24}{result['rows'][table]:>10,} rows {rate:>12,.0f} rows/sec")
+
+
+def compare_with_baseline(results, baseline):
+    """기준선 JSON과 같은 케이스끼리 records/sec를 비교해 출력합니다."""
+    baseline_map = {_case_key(result): result for result in baseline['results']}
+    print("\n--- 기준선 대비 ---")
+    for result in results:
+        base = baseline_map.get(_case_key(result))
+        if base is None:
+            continue
+        ratio = result['records_per_sec'] / base['records_per_sec']
+        growth = ''
+        if base.get('rss_growth_mb') is not None and result.get('rss_growth_mb') is not None:
+            growth = f", RSS 증가 {base['rss_growth_mb']:+} → {result['rss_growth_mb']:+} MB"
+        print(f"[{result['target']}] records={result['records']} batch={result['batch_size']} mode={result['write_mode']}: "
+              f"{base['records_per_sec']:,.0f} → {result['records_per_sec']:,.0f} records/sec ({ratio:.2f}x{growth})")
+
+
+# -------------------------------------------------------------------------------------
+# 5. 모듈별 마이크로 벤치마크 (DB 없이 생성 단계만)
+
+def _scalar_decisions(num_records, user_ids, schedule_ids, seat_ids, store_item_ids):
+    """기존 시더처럼 레코드마다 random.* 를 호출하여 RecordBlock과 같은 결정들을 뽑습니다."""
+    for _ in range(num_records):
+        payment_type = random.choices([0, 1], weights=PAYMENT_TYPE_WEIGHTS, k=1)[0]
+        is_user = random.choices([True, False], weights=USER_WEIGHTS, k=1)[0]
+        user_id = random.choice(user_ids) if is_user else None
+        non_user_id = random.randint(1, 1000) if not is_user else None
+        if payment_type == 0:
+            num_seats = random.randint(1, MAX_SEATS)
+            schedule_id = random.choice(schedule_ids)
+            age_types = random.choices(range(len(AGE_TYPE_WEIGHTS)), weights=AGE_TYPE_WEIGHTS, k=num_seats)
+            hours = random.randint(1, 500)
+            for _ in range(num_seats):
+                seat_id = random.choice(seat_ids)
+                if random.randint(0, 3) < 3:
+                    discount = random.uniform(1000, 5000)
+        else:
+            item_id = random.choice(store_item_ids)
+            quantity = random.randint(1, 3)
+            hours = random.randint(1, 500)
+            discount_percentage = random.uniform(0.05, 0.15)
+        completed_hours = random.randint(1, 10)
+        method = random.choices(PAYMENT_METHODS, weights=PAYMENT_METHOD_WEIGHTS, k=1)[0]
+        minutes = random.randint(1, 5)
+        installment = random.choice(INSTALLMENT_MONTHS)
+
+
+def _block_decisions(num_records, user_ids, schedule_ids, seat_ids, store_item_ids):
+    """RecordBlock에서 같은 결정들을 인덱싱으로만 읽습니다."""
+    rng = np.random.default_rng(42)
+    for block in iter_record_blocks(rng, num_records, user_ids, schedule_ids, store_item_ids):
+        for j in range(block.size):
+            payment_type = block.payment_type[j]
+            is_user = block.is_user[j]
+            user_id = block.user_id[j] if is_user else None
+            non_user_id = block.non_user_id[j] if not is_user else None
+            if payment_type == 0:
+                num_seats = block.num_seats[j]
+                schedule_id = block.schedule_id[j]
+                k0 = j * MAX_SEATS
+                age_types = block.age_type_index[k0:k0 + num_seats]
+                hours = block.reservation_hours[j]
+                for k in range(k0, k0 + num_seats):
+                    seat_id = seat_ids[int(block.seat_ratio[k] * len(seat_ids))]
+                    if block.discount_choice[k] < 3:
+                        discount = 1000 + 4000 * block.discount_ratio[k]
+            else:
+                item_id = block.store_item_id[j]
+                quantity = block.quantity[j]
+                hours = block.order_hours[j]
+                discount_percentage = block.store_discount_percentage[j]
+            completed_hours = block.completed_hours[j]
+            method = block.payment_method[j]
+            minutes = block.created_minutes[j]
+            installment = block.installment_months[j]
+
+
+def micro_blocks():
+    """레코드마다 random.* 호출 vs RecordBlock (seeder_blocks)."""
+    num_records = 200000
+    user_ids = list(range(1, 100001))
+    schedule_ids = list(range(1, 2001))
+    seat_ids = list(range(1, 5001))
+    store_item_ids = list(range(1, 51))
+
+    random.seed(42)
+    start = time.perf_counter()
+    _scalar_decisions(num_records, user_ids, schedule_ids, seat_ids, store_item_ids)
+    scalar_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _block_decisions(num_records, user_ids, schedule_ids, seat_ids, store_item_ids)
+    block_elapsed = time.perf_counter() - start
+
+    print(f"random.* 스칼라: {num_records / scalar_elapsed:,.0f} records/sec ({scalar_elapsed:.2f}s)")
+    print(f"NumPy 블록     : {num_records / block_elapsed:,.0f} records/sec ({block_elapsed:.2f}s)")
+    print(f"속도 향상      : {scalar_elapsed / block_elapsed:.1f}x")
+
+
+def micro_pii():
+    """row마다 Faker 호출 vs PiiPool (seeder_pii)."""
+    from faker import Faker
+
+    num_rows = 50000
+    faker = Faker('ko_KR')
+    faker.seed_instance(42)
+
+    start = time.perf_counter()
+    for _ in range(num_rows):
+        faker.numerify('####')
+        faker.numerify('##########')
+        faker.name()[:12]
+        faker.phone_number()[:13]
+    faker_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pii = PiiPool(faker, seed=42)
+    for _ in range(num_rows):
+        pii.card_number()
+        pii.approval_number()
+        pii.name()
+        pii.phone_number()
+        pii.account_number()
+    pool_elapsed = time.perf_counter() - start
+
+    print(f"Faker row 호출: {num_rows / faker_elapsed:,.0f} rows/sec ({faker_elapsed:.2f}s)")
+    print(f"PII 풀        : {num_rows / pool_elapsed:,.0f} rows/sec ({pool_elapsed:.2f}s, 풀 생성 포함)")
+    print(f"속도 향상     : {faker_elapsed / pool_elapsed:.1f}x")
+
+
+def micro_sampling():
+    """random.choices vs WeightedSampler / AliasSampler, Zipf 핫스팟 (seeder_sampling)."""
+    draws = 500000
+    methods = ['CARD', 'BANK', 'MOBILE']
+    weights = [70, 10, 20]
+
+    random.seed(42)
+    start = time.perf_counter()
+    expected = [random.choices(methods, weights=weights, k=1)[0] for _ in range(draws)]
+    choices_seconds = time.perf_counter() - start
+
+    sampler = WeightedSampler(methods, weights)
+    random.seed(42)
+    start = time.perf_counter()
+    actual = [sampler.draw() for _ in range(draws)]
+    sampler_seconds = time.perf_counter() - start
+
+    alias_sampler = AliasSampler(methods, weights)
+    start = time.perf_counter()
+    for _ in range(draws):
+        alias_sampler.draw()
+    alias_seconds = time.perf_counter() - start
+
+    print(f"random.choices(k=1): {draws / choices_seconds:,.0f} draws/sec")
+    print(f"WeightedSampler    : {draws / sampler_seconds:,.0f} draws/sec (같은 결과: {actual == expected})")
+    print(f"AliasSampler       : {draws / alias_seconds:,.0f} draws/sec")
+
+    user_ids = array('q', range(1, 1000001))
+    start = time.perf_counter()
+    hot_users = hotspot_sampler(user_ids, 1.0)
+    build_seconds = time.perf_counter() - start
+    picks = hot_users.draw_batch(np.random.default_rng(42), draws)
+    _, counts = np.unique(picks, return_counts=True)
+    top_share = np.sort(counts)[::-1][:len(user_ids) // 100].sum() / draws
+    start = time.perf_counter()
+    for _ in range(draws):
+        hot_users.draw()
+    zipf_seconds = time.perf_counter() - start
+    print(f"Zipf(1.0) 100만 id : 표 생성 {build_seconds:.2f}s, {draws / zipf_seconds:,.0f} draws/sec, 상위 1% id 비중 {top_share:.0%}")
+
+
+def micro_money():
+    """float → Decimal vs 정수 센트 → Decimal (seeder_money)."""
+    num_values = 500000
+    random.seed(42)
+    cents = [random.randint(0, 3000000) for _ in range(num_values)]
+    floats = [c / 100 for c in cents]
+
+    # 기존 방식: float 연산 → 값마다 Decimal(str(round(x, 2)))
+    start = time.perf_counter()
+    [Decimal(str(round(x * 0.9, 2))) for x in floats]
+    float_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    [cents_to_decimal(c - percent_of(c, 10)) for c in cents]
+    cents_seconds = time.perf_counter() - start
+
+    # float 누적 오차: 원가 - 할인 합계 != 결제 금액 이 되는 경우
+    drift = sum(1 for x in floats if round(x - round(x * 0.1, 2), 2) + round(x * 0.1, 2) != x)
+    print(f"float → Decimal: {num_values / float_seconds:,.0f} values/sec")
+    print(f"센트 → Decimal : {num_values / cents_seconds:,.0f} values/sec")
+    print(f"float 계산에서 amount + discount != origin 인 경우: {drift}/{num_values} (센트: 0)")
+
+
+def discount_policy_rows(num_partners, per_partner, seed=42):
+    """(policy_id, partner_id, 정액, 정률, 최소 금액, 최대 할인) 형식의 가짜 할인 정책 row."""
+    r = random.Random(seed)
+    rows = []
+    for partner in range(num_partners):
+        for _ in range(per_partner):
+            fixed = r.random() < 0.5
+            rows.append((len(rows) + 1, f"005{partner:02d}",
+                         r.choice([100000, 200000, 300000]) if fixed else None,
+                         None if fixed else r.choice([0.05, 0.1, 0.15]),
+                         r.choice([0, 1000000, 2000000, 3000000]),
+                         r.choice([None, 500000, 1000000])))
+    return rows
+
+
+def micro_discounts():
+    """제휴사별 정책 리스트 순회 vs DiscountPolicyIndex 이분 탐색 (seeder_discounts)."""
+    # 제휴사 200곳 x 정책 25개 = 5,000개 정책, 결제 20만 건
+    num_payments = 200000
+    rows = discount_policy_rows(200, 25)
+    r = random.Random(42)
+    partners = list(dict.fromkeys(row[1] for row in rows))
+    payment_partners = [r.choice(partners) for _ in range(num_payments)]
+    payment_amounts = [r.randint(500000, 6000000) for _ in range(num_payments)]
+
+    # 기존 방식: 제휴사별 dict 리스트에서 정책마다 조건 확인 (적용 가능한 정책 수)
+    policy_map = {}
+    for policy_id, partner, fixed, rate, min_price, cap in rows:
+        policy_map.setdefault(partner, []).append({'id': policy_id, 'min_price': min_price})
+    start = time.perf_counter()
+    expected = [sum(1 for policy in policy_map[partner] if amount >= policy['min_price'])
+                for partner, amount in zip(payment_partners, payment_amounts)]
+    scan_seconds = time.perf_counter() - start
+
+    index = DiscountPolicyIndex(rows)
+    start = time.perf_counter()
+    scalar = [len(index.eligible(partner, amount)) for partner, amount in zip(payment_partners, payment_amounts)]
+    scalar_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    positions, _ = index.discounts(payment_partners, payment_amounts, random.Random(42))
+    batch_seconds = time.perf_counter() - start
+
+    print(f"정책 리스트 순회: {num_payments / scan_seconds:,.0f} payments/sec")
+    print(f"이분 탐색       : {num_payments / scalar_seconds:,.0f} payments/sec (같은 결과: {scalar == expected})")
+    print(f"discounts() 배치: {num_payments / batch_seconds:,.0f} payments/sec "
+          f"(정책 선택: {sum(position is not None for position in positions):,}건)")
+
+
+def micro_ledger():
+    """회원 100만 명 장부 생성과 포인트 차감 (seeder_ledger)."""
+    num_users, num_uses = 1000000, 200000
+    user_ids = array('q', range(1, num_users + 1))
+    start = time.perf_counter()
+    ledger = BenefitLedger(user_ids, array('q', (user_id % 5000 * 100 for user_id in user_ids)))
+    ledger.grant(ledger.coupons, random.sample(range(1, num_users + 1), num_users * 3 // 10), INITIAL_COUPONS)
+    build_seconds = time.perf_counter() - start
+
+    random.seed(42)
+    start = time.perf_counter()
+    used = sum(ledger.use_points(random.randint(1, num_users), 150000) for _ in range(num_uses))
+    use_seconds = time.perf_counter() - start
+
+    size = ledger.points.itemsize * len(ledger.points) + len(ledger.coupons) + len(ledger.vouchers)
+    print(f"장부 생성 : {build_seconds:.2f}s, {size / 2**20:,.1f} MiB")
+    print(f"포인트 차감: {num_uses / use_seconds:,.0f} uses/sec, 차감 합계 {used / 100:,.2f}원, "
+          f"반영 대기 회원 {ledger.pending_debits:,}명")
+
+
+class _Row:
+    def __init__(self, **values):
+        self.__dict__.update(values)
+
+
+class _Discount(_Row):
+    pass
+
+
+class _ListWriter:
+    """배치 버퍼만 흉내 내는 writer."""
+
+    def __init__(self):
+        self.rows = []
+
+    def add(self, model, **values):
+        self.rows.append(model(**values))
+
+
+def _placeholder_scan(num_records, batch_size):
+    """기존 fin.py 방식: Payment마다 배치 버퍼 전체를 훑어 placeholder를 채웁니다."""
+    entities_to_add = []
+    for i in range(1, num_records + 1):
+        for _ in range(6):   # 트랜잭션당 좌석/할인/상세 row
+            entities_to_add.append(_Row(payment_id=None))
+        if i % 2 == 0:
+            entities_to_add.append(_Discount(payment_id='placeholder', applied_amount=1000))
+        for entity in entities_to_add:
+            if isinstance(entity, _Discount) and entity.payment_id == 'placeholder':
+                entity.payment_id = i
+        if i % batch_size == 0:
+            entities_to_add = []
+
+
+def _pending_children(num_records, batch_size):
+    """PendingChildren 방식: 트랜잭션의 결제 단위 자식만 부모 PK에 연결합니다."""
+    writer = _ListWriter()
+    pending = PendingChildren('payment_id')
+    for i in range(1, num_records + 1):
+        for _ in range(6):
+            writer.add(_Row, payment_id=None)
+        if i % 2 == 0:
+            pending.add(_Discount, applied_amount=1000)
+        pending.attach(writer, i)
+        if i % batch_size == 0:
+            writer.rows = []
+
+
+def micro_pending():
+    """배치 크기별 placeholder 스캔 vs PendingChildren (seeder_pending)."""
+    num_records = 10000
+    for batch_size in [500, 2000, 10000]:
+        start = time.perf_counter()
+        _placeholder_scan(num_records, batch_size)
+        scan_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        _pending_children(num_records, batch_size)
+        pending_elapsed = time.perf_counter() - start
+
+        print(f"BATCH_SIZE {batch_size:>6}: placeholder 스캔 {num_records / scan_elapsed:>12,.0f} records/sec, "
+              f"PendingChildren {num_records / pending_elapsed:>12,.0f} records/sec "
+              f"({scan_elapsed / pending_elapsed:.1f}x)")
+
+
+def micro_reference():
+    """fetchall() 리스트 + dict vs array 메모리 (seeder_reference, 100만 id)."""
+    import tracemalloc
+
+    num_ids = 1000000
+    tracemalloc.start()
+    rows = [(user_id, float(user_id % 5000)) for user_id in range(1, num_ids + 1)]
+    user_ids = [row[0] for row in rows]
+    user_point_map = {row[0]: row[1] for row in rows}
+    del rows
+    list_bytes = tracemalloc.get_traced_memory()[0]
+    del user_ids, user_point_map
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    ids = array('q', range(1, num_ids + 1))
+    points = array('d', (float(user_id % 5000) for user_id in ids))
+    array_seconds = time.perf_counter() - start
+    array_bytes = sys.getsizeof(ids) + sys.getsizeof(points)
+
+    print(f"리스트 + dict : {list_bytes / 2**20:,.1f} MiB")
+    print(f"array('q'/'d'): {array_bytes / 2**20:,.1f} MiB ({array_seconds:.2f}s)")
+    print(f"value_for     : {value_for(ids, points, 123457)}")
+
+
+class _BufferWriter:
+    """pending_rows / commit_batch만 흉내 내는 writer."""
+
+    def __init__(self):
+        self.rows = []
+
+    @property
+    def pending_rows(self):
+        return len(self.rows)
+
+    def commit_batch(self):
+        self.rows = []
+
+
+def micro_streaming():
+    """RSS 상한 컨트롤러: 상한을 현재 RSS + 20MB로 두고 배치마다 버퍼를 채웠다 비움 (seeder_streaming)."""
+    ceiling = int(current_rss_mb()) + 20
+    controller = MemoryBoundedBatchController(target_seconds=None, initial_rows=400000, min_rows=MIN_BATCH_ROWS,
+                                              max_rows=400000, ceiling_mb=ceiling)
+    writer = _BufferWriter()
+    start = time.perf_counter()
+    for i in range(2000000):
+        writer.rows.append((i, 'x' * 40))
+        if controller.should_commit(writer):
+            controller.commit(writer)
+    if writer.pending_rows:
+        controller.commit(writer)
+    print(f"RSS 상한 {ceiling} MB: 커밋 {controller.commits}회, 상한 초과 {controller.ceiling_hits}회, "
+          f"배치 상한 {controller.max_rows} rows, RSS(첫/최대/마지막) {controller.rss_summary()} MB, "
+          f"{time.perf_counter() - start:.1f}s")
+
+
+# 마이크로 벤치마크: {이름: 함수}
+MICRO_BENCHMARKS = {
+    'blocks': micro_blocks,
+    'pii': micro_pii,
+    'sampling': micro_sampling,
+    'money': micro_money,
+    'discounts': micro_discounts,
+    'ledger': micro_ledger,
+    'pending': micro_pending,
+    'reference': micro_reference,
+    'streaming': micro_streaming,
+}
+
+
+def run_micro_benchmarks(names):
+    for name in names:
+        print(f"--- {name}: {MICRO_BENCHMARKS[name].__doc__}")
+        MICRO_BENCHMARKS[name]()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="시더 벤치마크 (생성/쓰기 시간, 테이블별 rows/sec, 피크 RSS)")
+    parser.add_argument("--targets", nargs="+", choices=list(BENCH_TARGETS), default=list(BENCH_TARGETS))
+    parser.add_argument("--records", nargs="+", type=int, default=DEFAULT_RECORD_COUNTS, help="케이스별 생성 건수")
+    parser.add_argument("--batch-sizes", nargs="+", type=int, default=DEFAULT_BATCH_SIZES, help="트랜잭션당 row 수 (0 = 자동 조절)")
+    parser.add_argument("--write-modes", nargs="+", choices=WRITE_MODES, default=[WRITE_MODE_CORE])
+    parser.add_argument("--database-url", default=None,
+                        help="로컬 MySQL 등 대상 DB (생략 시 케이스마다 SQLite 대역 DB 생성, 지정 시 트랜잭션 테이블을 TRUNCATE)")
+    parser.add_argument("--output", default=None, help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", default=None, help="비교할 기준선 결과 JSON")
+    parser.add_argument("--streaming", action="store_true",
+                        help="--streaming(배치 버퍼 RSS 상한, core/load_data만)으로 실행해 첫/마지막 배치 RSS 증가량 확인")
+    parser.add_argument("--memory-ceiling-mb", type=int, default=DEFAULT_MEMORY_CEILING_MB, help="스트리밍 모드 RSS 상한(MB)")
+    parser.add_argument("--micro", nargs="+", choices=list(MICRO_BENCHMARKS), default=None,
+                        help="DB 없이 모듈별 생성 단계 마이크로 벤치마크만 실행")
+    args = parser.parse_args()
+
+    if args.micro:
+        run_micro_benchmarks(args.micro)
+        sys.exit()
+
+    results = run_benchmarks(args.targets, args.records, args.batch_sizes, args.write_modes, args.database_url,
+                             streaming=args.streaming, memory_ceiling_mb=args.memory_ceiling_mb)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({
+                'created_at': datetime.now().isoformat(timespec='seconds'),
+                'database': 'sqlite-standin' if args.database_url is None else args.database_url.split('@')[-1],
+                'results': results,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            compare_with_baseline(results, json.load(f))
@@ -0,0 +1,103 @@
+# seeder_blocks.py
+
+from array import array
+import numpy as np
+from seeder_sampling import WeightedSampler
+
+# -------------------------------------------------------------------------------------
+# 1. 상수 정의 (시더의 random.choices 가중치와 동일)
+
+VECTOR_BLOCK_SIZE = 4096   # 한 번에 난수를 뽑는 레코드 수
+MAX_SEATS = 4              # 예매 1건당 최대 좌석 수 (randint(1, 4))
+
+PAYMENT_TYPE_WEIGHTS = [80, 20]          # 0: 예매, 1: 스토어
+USER_WEIGHTS = [80, 20]                  # 회원, 비회원
+AGE_TYPE_WEIGHTS = [60, 25, 10, 5]       # 성인, 청소년, 경로, 우대 (AGE_TYPE_CODES 순서)
+PAYMENT_METHODS = ['CARD', 'BANK', 'MOBILE']
+PAYMENT_METHOD_WEIGHTS = [70, 10, 20]
+INSTALLMENT_MONTHS = [0, 3, 6]
+
+# -------------------------------------------------------------------------------------
+# 2. 블록 생성
+
+def _weighted(rng, weights, size):
+    """가중치에 따라 0..len(weights)-1 인덱스를 size개 뽑습니다 (rng.choice(p=...)와 같은 값)."""
+    return WeightedSampler(range(len(weights)), weights).draw_indexes(rng, size)
+
+
+def _column(values, typecode='q'):
+    """NumPy 배열을 같은 값의 array로 바꿉니다 (메모리 복사 한 번, 파이썬 객체는 인덱싱할 때만 생성)."""
+    dtype = np.float64 if typecode == 'd' else np.uint8 if typecode == 'B' else np.int64
+    return array(typecode, np.ascontiguousarray(values, dtype=dtype).tobytes())
+
+
+def _pick(rng, ids, sampler, size):
+    """ids에서 size개를 뽑습니다. sampler(핫스팟 AliasSampler)가 있으면 그 분포로, 없으면 균등하게."""
+    if sampler is not None:
+        return sampler.draw_batch(rng, size)
+    return ids[rng.integers(0, len(ids), size)]
+
+
+class RecordBlock:
+    """size개 레코드의 난수 결정을 NumPy로 한 번에 뽑아 컬럼별 array('q'/'d'/'B')로 보관합니다.
+
+    row 조립 단계는 block.컬럼[j] 인덱싱만 합니다. NumPy 스칼라 인덱싱은 느리고, tolist()는
+    레코드가 쓰지 않는 컬럼(스토어 건의 좌석 컬럼 등)까지 모든 값을 파이썬 객체로 만들므로
+    버퍼를 그대로 복사한 array를 씁니다. 좌석 단위 컬럼은 길이 size * MAX_SEATS의 1차원 array로,
+    레코드 j의 좌석 s는 [j * MAX_SEATS + s] 입니다.
+    좌석은 스케줄별 빈 좌석 중에서 골라야 하므로 seat_id 대신 [0, 1) 난수(seat_ratio)를
+    뽑아 두고 SeatOccupancy.draw(..., ratios=)에 넘깁니다.
+    hotspots({'user' | 'schedule' | 'store_item': AliasSampler})를 주면 그 id는 핫스팟 분포로 뽑습니다.
+    """
+
+    def __init__(self, rng, size, user_ids, schedule_ids, store_item_ids, hotspots=None):
+        self.size = size
+        hotspots = hotspots or {}
+
+        # 트랜잭션 / 사용자 타입
+        self.payment_type = _column(_weighted(rng, PAYMENT_TYPE_WEIGHTS, size))
+        self.is_user = _column(_weighted(rng, USER_WEIGHTS, size) == 0, 'B')
+        self.user_id = _column(_pick(rng, user_ids, hotspots.get('user'), size))
+        self.non_user_id = _column(rng.integers(1, 1001, size))
+
+        # 예매
+        num_seats = rng.integers(1, MAX_SEATS + 1, size)
+        schedule_id = _pick(rng, schedule_ids, hotspots.get('schedule'), size)
+        age_type_index = _weighted(rng, AGE_TYPE_WEIGHTS, (size, MAX_SEATS))
+        self.num_seats = _column(num_seats)
+        self.schedule_id = _column(schedule_id)
+        self.age_type_index = _column(age_type_index)
+        self.seat_ratio = _column(rng.random((size, MAX_SEATS)), 'd')
+        self.discount_choice = _column(rng.integers(0, 4, (size, MAX_SEATS)))
+        self.discount_ratio = _column(rng.random((size, MAX_SEATS)), 'd')   # uniform(a, b) = a + (b - a) * ratio
+        self.reservation_hours = _column(rng.integers(1, 501, size))
+        self._reservation_columns = (schedule_id, age_type_index, num_seats)   # reservation_prices()용
+
+        # 스토어
+        self.store_item_id = _column(_pick(rng, store_item_ids, hotspots.get('store_item'), size))
+        self.quantity = _column(rng.integers(1, 4, size))
+        self.order_hours = _column(rng.integers(1, 501, size))
+        self.store_discount_percentage = _column(rng.uniform(0.05, 0.15, size), 'd')
+
+        # 결제
+        self.completed_hours = _column(rng.integers(1, 11, size))
+        self.created_minutes = _column(rng.integers(1, 6, size))
+        self.payment_method = [PAYMENT_METHODS[k] for k in _weighted(rng, PAYMENT_METHOD_WEIGHTS, size).tolist()]
+        self.installment_months = _column(np.asarray(INSTALLMENT_MONTHS)[rng.integers(0, len(INSTALLMENT_MONTHS), size)])
+
+    def reservation_prices(self, price_matrix):
+        """레코드별 예매 총액(센트) array (TicketPriceMatrix.reservation_prices_for 한 번으로 계산)."""
+        return _column(price_matrix.reservation_prices_for(*self._reservation_columns))
+
+
+def iter_record_blocks(rng, num_records, user_ids, schedule_ids, store_item_ids,
+                       block_size=VECTOR_BLOCK_SIZE, hotspots=None):
+    """num_records개 레코드를 block_size 단위 RecordBlock으로 나눠 생성합니다."""
+    user_ids = np.asarray(user_ids, dtype=np.int64)
+    schedule_ids = np.asarray(schedule_ids, dtype=np.int64)
+    store_item_ids = np.asarray(store_item_ids, dtype=np.int64)
+    remaining = num_records
+    while remaining > 0:
+        size = min(block_size, remaining)
+        yield RecordBlock(rng, size, user_ids, schedule_ids, store_item_ids, hotspots)
+        remaining -= size
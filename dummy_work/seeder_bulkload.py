@@ -0,0 +1,239 @@
+# seeder_bulkload.py
+
+from sqlalchemy import text, bindparam, event
+from contextlib import contextmanager
+from seeder_reset import load_foreign_keys
+
+# -------------------------------------------------------------------------------------
+# 1. 상수 정의
+
+# 적재 중 삭제한 보조 인덱스 정의 (프로세스가 죽어도 다음 실행에서 다시 만들 수 있도록 DB에 기록)
+BULK_LOAD_INDEX_TABLE = "seeder_bulk_load_index"
+
+BULK_LOAD_INDEX_DDL = (
+    f"CREATE TABLE IF NOT EXISTS {BULK_LOAD_INDEX_TABLE} ("
+    "  table_name VARCHAR(64) NOT NULL,"
+    "  index_name VARCHAR(64) NOT NULL,"
+    "  definition TEXT NOT NULL,"
+    "  PRIMARY KEY (table_name, index_name))"
+)
+
+BULK_LOAD_CHECKS_SQL = "SET SESSION foreign_key_checks = 0, unique_checks = 0"
+
+# -------------------------------------------------------------------------------------
+# 2. 인덱스 정의 조회
+
+def load_indexes(session, schema, tables):
+    """tables의 인덱스를 {테이블명: [{'name', 'unique', 'type', 'columns': [(컬럼, prefix 길이, DESC 여부)]}]}로 읽습니다."""
+    rows = session.execute(text(
+        "SELECT TABLE_NAME, INDEX_NAME, NON_UNIQUE, INDEX_TYPE, COLUMN_NAME, SUB_PART, COLLATION "
+        "FROM information_schema.STATISTICS "
+        "WHERE TABLE_SCHEMA = :schema AND TABLE_NAME IN :tables "
+        "ORDER BY TABLE_NAME, INDEX_NAME, SEQ_IN_INDEX"
+    ).bindparams(bindparam('tables', expanding=True)), {'schema': schema, 'tables': list(tables)}).fetchall()
+
+    indexes = {}
+    for table, name, non_unique, index_type, column, sub_part, collation in rows:
+        table_indexes = indexes.setdefault(table, {})
+        index = table_indexes.setdefault(name, {'name': name, 'unique': not int(non_unique), 'type': index_type, 'columns': []})
+        index['columns'].append((column, sub_part, collation == 'D'))
+    return {table: list(table_indexes.values()) for table, table_indexes in indexes.items()}
+
+
+def index_definition(index):
+    """ALTER TABLE ... ADD 뒤에 붙일 인덱스 정의 (예: UNIQUE INDEX `uk_seat_discount` (`reservation_seat_id`, `benefit_code`))."""
+    columns = ', '.join(
+        f"`{column}`" + (f"({sub_part})" if sub_part else '') + (' DESC' if descending else '')
+        for column, sub_part, descending in index['columns']
+    )
+    return f"{'UNIQUE INDEX' if index['unique'] else 'INDEX'} `{index['name']}` ({columns})"
+
+
+def _covers(index, columns):
+    """index의 앞쪽 컬럼이 columns와 같은지 (InnoDB가 FK에 쓸 수 있는 인덱스인지)."""
+    return [column for column, _, _ in index['columns'][:len(columns)]] == list(columns)
+
+# -------------------------------------------------------------------------------------
+# 3. 대량 적재 모드
+
+def _disable_checks_on_connect(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute(BULK_LOAD_CHECKS_SQL)
+    cursor.close()
+
+
+def disable_checks_on_connect(engine):
+    """engine이 새로 여는 커넥션마다 foreign_key_checks=0, unique_checks=0을 겁니다.
+
+    샤드 워커, async writer처럼 적재가 끝나면 dispose하는 엔진용이라 설정을 되돌리지 않습니다.
+    async 엔진은 sync_engine에 겁니다. MySQL이 아니면 아무것도 하지 않습니다.
+    """
+    engine = getattr(engine, 'sync_engine', engine)
+    if engine.dialect.name == 'mysql':
+        event.listen(engine, 'connect', _disable_checks_on_connect)
+    return engine
+
+
+class BulkLoadSession:
+    """대량 적재 동안 보조 인덱스 유지와 FK/UNIQUE 검사를 미루고, 끝난 뒤 한 번에 다시 만들고 검증합니다.
+
+    prepare(): 적재 대상 테이블의 보조 인덱스를 삭제하고(정의는 BULK_LOAD_INDEX_TABLE에 기록),
+    이후 시더 엔진에서 꺼내는 커넥션마다 foreign_key_checks=0, unique_checks=0을 겁니다.
+    FK가 사용하는 인덱스(FK 컬럼으로 시작하는 인덱스가 PK 등 다른 인덱스로 대체되지 않는 경우)와
+    BTREE가 아닌 인덱스(FULLTEXT 등), 함수 인덱스는 그대로 둡니다.
+    restore(): 커넥션 설정을 되돌리고 테이블마다 ALTER TABLE 한 번으로 인덱스를 다시 만듭니다 (정렬 후 일괄 생성).
+    finish(): restore() 후 ANALYZE TABLE로 통계를 갱신하고, 검사를 끈 동안 FK/UNIQUE 규칙이
+    깨졌는지 검증 쿼리로 확인해 위반이 있으면 RuntimeError를 냅니다.
+
+    커넥션 설정은 시더 session의 엔진(파이프라인 writer 스레드 포함)에 checkout 훅으로 겁니다.
+    샤드 프로세스와 async writer는 자체 엔진을 쓰므로 run_sharded(bulk_load=True),
+    AsyncTableWriter(bulk_load=True)가 그 엔진에 disable_checks_on_connect()를 겁니다.
+    """
+
+    def __init__(self, session, tables):
+        if session.get_bind().dialect.name != 'mysql':
+            raise ValueError("대량 적재 모드는 MySQL/MariaDB에서만 사용할 수 있습니다.")
+        self.session = session
+        self.engine = session.get_bind()
+        self.tables = list(tables)
+        self.schema = session.execute(text("SELECT DATABASE()")).scalar()
+        self.previous_checks = session.execute(text("SELECT @@SESSION.foreign_key_checks, @@SESSION.unique_checks")).fetchone()
+        self.dropped = {}   # {테이블명: [인덱스 정의, ...]}
+
+    # ------------------ 커넥션 설정 ------------------
+    def _disable_checks(self, dbapi_connection, connection_record, connection_proxy):
+        _disable_checks_on_connect(dbapi_connection, connection_record)
+
+    def _restore_checks(self, dbapi_connection, connection_record):
+        if dbapi_connection is None:
+            return
+        foreign_key_checks, unique_checks = self.previous_checks
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"SET SESSION foreign_key_checks = {int(foreign_key_checks)}, unique_checks = {int(unique_checks)}")
+        cursor.close()
+
+    # ------------------ 인덱스 삭제 / 재생성 ------------------
+    def _droppable_indexes(self):
+        """FK가 필요로 하지 않는 BTREE 보조 인덱스를 {테이블명: [인덱스, ...]}로 반환합니다."""
+        indexes = load_indexes(self.session, self.schema, self.tables)
+        kept = {table: [index for index in table_indexes
+                        if index['name'] == 'PRIMARY' or index['type'] != 'BTREE'
+                        or any(column is None for column, _, _ in index['columns'])]
+                for table, table_indexes in indexes.items()}
+        droppable = {table: [index for index in table_indexes if index not in kept[table]]
+                     for table, table_indexes in indexes.items()}
+
+        # FK의 자식 컬럼 / 부모 컬럼을 덮는 인덱스가 남지 않으면 첫 번째 후보를 남김
+        for fk in load_foreign_keys(self.session, self.schema, self.tables):
+            for table, columns in ((fk['table'], fk['columns']), (fk['ref_table'], fk['ref_columns'])):
+                if table not in droppable or any(_covers(index, columns) for index in kept[table]):
+                    continue
+                for index in droppable[table]:
+                    if _covers(index, columns):
+                        droppable[table].remove(index)
+                        kept[table].append(index)
+                        break
+        return {table: table_indexes for table, table_indexes in droppable.items() if table_indexes}
+
+    def prepare(self):
+        """보조 인덱스를 삭제하고 커넥션마다 FK/UNIQUE 검사를 끄도록 설정합니다."""
+        self.session.execute(text(BULK_LOAD_INDEX_DDL))
+        # 이전 실행이 중간에 죽어 다시 만들지 못한 인덱스가 있으면 이번 재생성 대상에 포함
+        for table, definition in self.session.execute(text(
+            f"SELECT table_name, definition FROM {BULK_LOAD_INDEX_TABLE} ORDER BY table_name, index_name"
+        )):
+            self.dropped.setdefault(table, []).append(definition)
+        if self.dropped:
+            print(f"이전 대량 적재에서 다시 만들지 못한 인덱스: {self.dropped}")
+
+        for table, table_indexes in self._droppable_indexes().items():
+            for index in table_indexes:
+                definition = index_definition(index)
+                self.session.execute(text(
+                    f"INSERT INTO {BULK_LOAD_INDEX_TABLE} (table_name, index_name, definition) "
+                    f"VALUES (:table_name, :index_name, :definition)"
+                ), {'table_name': table, 'index_name': index['name'], 'definition': definition})
+                self.dropped.setdefault(table, []).append(definition)
+                print(f"  인덱스 삭제: `{table}` {definition}")
+            self.session.commit()   # 정의를 기록한 뒤에 삭제 (ALTER는 암묵적 커밋)
+            self.session.execute(text(
+                f"ALTER TABLE `{table}` " + ', '.join(f"DROP INDEX `{index['name']}`" for index in table_indexes)
+            ))
+        self.session.commit()
+
+        # 이후 꺼내는 커넥션부터 적용 (반납할 때 원래 값으로 되돌림)
+        event.listen(self.engine, 'checkout', self._disable_checks)
+        event.listen(self.engine, 'checkin', self._restore_checks)
+
+    def restore(self):
+        """커넥션 설정을 되돌리고 삭제했던 인덱스를 테이블마다 ALTER TABLE 한 번으로 다시 만듭니다."""
+        self.session.commit()   # 현재 커넥션을 반납해 checkin에서 설정이 복원되도록 함
+        if event.contains(self.engine, 'checkout', self._disable_checks):
+            event.remove(self.engine, 'checkout', self._disable_checks)
+            event.remove(self.engine, 'checkin', self._restore_checks)
+
+        for table, definitions in self.dropped.items():
+            print(f"  인덱스 재생성: `{table}` ({len(definitions)}개)")
+            self.session.execute(text(f"ALTER TABLE `{table}` " + ', '.join(f"ADD {d}" for d in definitions)))
+            self.session.execute(text(f"DELETE FROM {BULK_LOAD_INDEX_TABLE} WHERE table_name = :table_name"),
+                                 {'table_name': table})
+            self.session.commit()
+        self.dropped = {}
+
+    # ------------------ 통계 / 검증 ------------------
+    def analyze(self):
+        self.session.execute(text("ANALYZE TABLE " + ', '.join(f"`{table}`" for table in self.tables))).fetchall()
+        self.session.commit()
+
+    def verify(self):
+        """검사를 끈 동안 들어간 row가 FK와 UNIQUE 규칙을 지키는지 확인합니다. 위반 목록을 반환합니다."""
+        violations = []
+        for fk in load_foreign_keys(self.session, self.schema, self.tables):
+            if fk['table'] not in self.tables:
+                continue
+            on = ' AND '.join(f"c.`{c}` = p.`{p}`" for c, p in zip(fk['columns'], fk['ref_columns']))
+            not_null = ' AND '.join(f"c.`{c}` IS NOT NULL" for c in fk['columns'])
+            orphans = self.session.execute(text(
+                f"SELECT COUNT(*) FROM `{fk['table']}` c LEFT JOIN `{fk['ref_table']}` p ON {on} "
+                f"WHERE {not_null} AND p.`{fk['ref_columns'][0]}` IS NULL"
+            )).scalar()
+            if orphans:
+                violations.append(f"FK {fk['table']}.{fk['name']}: 부모가 없는 row {orphans}건")
+
+        for table, table_indexes in load_indexes(self.session, self.schema, self.tables).items():
+            for index in table_indexes:
+                if not index['unique'] or index['name'] == 'PRIMARY':
+                    continue
+                columns = [f"LEFT(`{c}`, {sub_part})" if sub_part else f"`{c}`" for c, sub_part, _ in index['columns']]
+                not_null = ' AND '.join(f"`{c}` IS NOT NULL" for c, _, _ in index['columns'])
+                duplicates = self.session.execute(text(
+                    f"SELECT COUNT(*) FROM (SELECT 1 FROM `{table}` WHERE {not_null} "
+                    f"GROUP BY {', '.join(columns)} HAVING COUNT(*) > 1) AS dup"
+                )).scalar()
+                if duplicates:
+                    violations.append(f"UNIQUE {table}.{index['name']}: 중복 키 {duplicates}개")
+        self.session.commit()
+        return violations
+
+    def finish(self):
+        """인덱스 재생성 → ANALYZE TABLE → FK/UNIQUE 검증. 위반이 있으면 RuntimeError."""
+        self.restore()
+        self.analyze()
+        violations = self.verify()
+        if violations:
+            raise RuntimeError("대량 적재 검증 실패 (검사를 끈 동안 규칙 위반):\n  " + "\n  ".join(violations))
+        print("대량 적재 검증 완료 (FK / UNIQUE 위반 없음)")
+
+
+@contextmanager
+def bulk_load_mode(session, tables):
+    """with 블록 동안 대량 적재 모드. 정상 종료 시 finish(), 예외 시 인덱스와 설정만 되돌리고 예외를 다시 냅니다."""
+    bulk_load = BulkLoadSession(session, tables)
+    bulk_load.prepare()
+    try:
+        yield bulk_load
+    except BaseException:
+        session.rollback()
+        bulk_load.restore()
+        raise
+    bulk_load.finish()
@@ -0,0 +1,152 @@
+# seeder_discounts.py
+
+from bisect import bisect_right
+import random
+from seeder_money import to_cents
+
+# -------------------------------------------------------------------------------------
+# 1. 상수 정의
+
+NO_CAP = 2 ** 62        # 최대 할인 한도가 없는 정책의 한도 (센트)
+NO_FIXED = -1           # 고정 금액 할인이 아닌 정책의 fixed 값
+
+# -------------------------------------------------------------------------------------
+# 2. 할인 정책 인덱스
+
+class DiscountPolicyIndex:
+    """discount_policy / coupon row를 그룹(제휴사)별, 최소 사용 금액 순으로 정렬해 둔 인덱스입니다.
+
+    정책마다 (고정 할인 금액 | 할인 배율, 최소 사용 금액, 최대 할인 한도)를 센트 리스트로 두고,
+    그룹 안에서는 min_price 오름차순이라 "금액 이하의 min_price를 가진 정책" = 그룹 앞쪽 구간입니다.
+    그래서 적용 가능 정책은 이분 탐색 한 번으로 찾습니다.
+    groups는 row에서 처음 나온 순서를 유지하므로 제휴사 목록을 그대로 random.choice에 쓸 수 있습니다.
+    시더는 discounts()로 (그룹, 금액)마다 적용 가능한 정책 중 하나를 골라 할인 금액을 구합니다.
+    """
+
+    def __init__(self, rows):
+        """rows: [(policy_id, 그룹, 고정 할인 센트 | None, 할인 배율 | None, 최소 금액 센트, 한도 센트 | None), ...]"""
+        self.groups = {}
+        for row in rows:
+            self.groups.setdefault(row[1], len(self.groups))
+        rows = sorted(rows, key=lambda row: (self.groups[row[1]], row[4]))   # 같은 min_price는 입력 순서 유지
+
+        self.policy_ids = [row[0] for row in rows]
+        self._fixed = [NO_FIXED if row[2] is None else row[2] for row in rows]
+        self._rate = [row[3] or 0.0 for row in rows]
+        self._min_prices = [row[4] for row in rows]
+        self._cap = [NO_CAP if row[5] is None else row[5] for row in rows]
+        self._ranges = {}   # {그룹: (시작 위치, 끝 위치)}
+        for position, row in enumerate(rows):
+            start, _ = self._ranges.get(row[1], (position, position))
+            self._ranges[row[1]] = (start, position + 1)
+        self._positions = {policy_id: position for position, policy_id in enumerate(self.policy_ids)}
+
+    @classmethod
+    def from_discount_policies(cls, rows, percent_rate=0.01, group_by_partner=True):
+        """discount_policy 조회 결과 (policy_id, partner_id, discount_amount, discount_percent, min_price, max_benefit_amount).
+
+        percent_rate는 discount_percent 값을 배율로 바꾸는 계수입니다 (10.00 → 0.10 이면 0.01).
+        group_by_partner=False 이면 제휴사와 관계없이 모든 정책을 그룹 None 하나로 묶습니다.
+        기존 dict 버전과 같이 금액/비율/한도가 NULL이거나 0이면 "해당 없음"으로 봅니다
+        (할인 금액 0인 정책은 비율 할인으로, 한도 0은 한도 없음으로 처리).
+        """
+        return cls([(policy_id, partner_id if group_by_partner else None,
+                     to_cents(amount) if amount else None,
+                     float(percent) * percent_rate if percent else None,
+                     to_cents(min_price) or 0,
+                     to_cents(max_benefit) if max_benefit else None)
+                    for policy_id, partner_id, amount, percent, min_price, max_benefit in rows])
+
+    @classmethod
+    def from_coupons(cls, rows):
+        """coupon 조회 결과 (coupon_id, discount_type, discount_value, max_discount_amount, min_price).
+
+        discount_type 0은 고정 금액(한도 없음), 1은 discount_value% 할인(max_discount_amount 한도)입니다.
+        """
+        return cls([(coupon_id, None,
+                     (to_cents(value) if value else 0) if discount_type == 0 else None,
+                     float(value) / 100 if discount_type == 1 and value else None,
+                     to_cents(min_price) or 0,
+                     to_cents(max_amount) if discount_type == 1 and max_amount else None)
+                    for coupon_id, discount_type, value, max_amount, min_price in rows])
+
+    @classmethod
+    def from_policy_columns(cls, columns, percent_rate=0.01, group_by_partner=True):
+        """load_reference(session, 'discount_policy')의 컬럼 array로 만듭니다 (금액은 이미 센트, NULL은 0).
+
+        0을 "해당 없음"으로 보는 규칙은 from_discount_policies와 같습니다.
+        """
+        policy_ids, (partner_codes, partners), amounts, percents, min_prices, max_benefits = columns
+        return cls([(policy_id, partners[partner_code] if group_by_partner else None,
+                     amount or None,
+                     percent * percent_rate if percent else None,
+                     min_price,
+                     max_benefit or None)
+                    for policy_id, partner_code, amount, percent, min_price, max_benefit
+                    in zip(policy_ids, partner_codes, amounts, percents, min_prices, max_benefits)])
+
+    @classmethod
+    def from_coupon_columns(cls, columns):
+        """load_reference(session, 'coupon')의 컬럼 array로 만듭니다 (discount_value는 float, 금액은 센트, NULL은 0).
+
+        discount_type 규칙은 from_coupons와 같습니다.
+        """
+        coupon_ids, discount_types, values, max_amounts, min_prices = columns
+        return cls([(coupon_id, None,
+                     (to_cents(value) if value else 0) if discount_type == 0 else None,
+                     value / 100 if discount_type == 1 and value else None,
+                     min_price,
+                     max_amount if discount_type == 1 and max_amount else None)
+                    for coupon_id, discount_type, value, max_amount, min_price
+                    in zip(coupon_ids, discount_types, values, max_amounts, min_prices)])
+
+    def __len__(self):
+        return len(self.policy_ids)
+
+    def pick(self, group, random_source=random):
+        """그룹의 정책 하나를 균등하게 골라 위치를 반환합니다 (그룹이 없으면 None).
+
+        random.choice(정책 리스트)와 같은 개수의 난수를 소비합니다.
+        """
+        bounds = self._ranges.get(group)
+        if bounds is None:
+            return None
+        start, end = bounds
+        return start + random_source.randrange(end - start)
+
+    def eligible(self, group, amount):
+        """amount에 적용 가능한(min_price <= amount) 그룹 정책 위치 range (이분 탐색)."""
+        start, end = self._ranges.get(group, (0, 0))
+        return range(start, bisect_right(self._min_prices, amount, start, end))
+
+    def discount_at(self, position, amount):
+        """위치의 정책을 amount(센트)에 적용한 할인 금액 (최소 금액 미달이면 0)."""
+        if amount < self._min_prices[position]:
+            return 0
+        fixed = self._fixed[position]
+        discount = fixed if fixed != NO_FIXED else round(amount * self._rate[position])
+        return min(discount, self._cap[position])
+
+    def discounts(self, groups, amounts, random_source=random):
+        """(그룹, 금액) 쌍마다 적용 가능한 정책 하나를 균등하게 골라 (위치 리스트, 할인 금액 리스트)를 반환합니다.
+
+        후보는 eligible()의 이분 탐색 구간이며, 적용 가능한 정책이 없으면 위치 None, 할인 0 입니다.
+        후보가 있는 쌍마다 randrange 한 번만 소비합니다.
+        """
+        positions = []
+        discounts = []
+        for group, amount in zip(groups, amounts):
+            candidates = self.eligible(group, amount)
+            if candidates:
+                position = candidates[random_source.randrange(len(candidates))]
+                positions.append(position)
+                discounts.append(self.discount_at(position, amount))
+            else:
+                positions.append(None)
+                discounts.append(0)
+        return positions, discounts
+
+    def discount(self, policy_id, amount):
+        """policy_id 정책을 amount(센트)에 적용한 할인 금액 (없는 정책이면 0)."""
+        position = self._positions.get(policy_id)
+        return 0 if position is None else self.discount_at(position, amount)
@@ -0,0 +1,127 @@
+# seeder_ids.py
+
+from sqlalchemy import text
+
+# -------------------------------------------------------------------------------------
+# 1. 상수 정의
+
+# 한 번에 예약하는 PK 블록 크기
+ID_BLOCK_SIZE = 10000
+
+# 클라이언트에서 PK를 미리 할당하는 테이블과 PK 컬럼
+PK_COLUMNS = {
+    'reservation': 'reservation_id',
+    'reservation_seat': 'reservation_seat_id',
+    'order': 'order_id',
+    'payment': 'payment_id',
+}
+
+# ticket_discount.benefit_id는 시더가 직접 세는 값 (비어 있는 DB에서의 시작값)
+BENEFIT_ID_START = 100000
+
+# -------------------------------------------------------------------------------------
+# 2. 테이블 이름
+
+def qualified_table_name(session, table):
+    """세션에 schema_translate_map(섀도 테이블 적재)이 걸려 있으면 `스키마`.`테이블`을 반환합니다.
+
+    text() 쿼리는 schema_translate_map의 영향을 받지 않으므로 시더가 직접 쓰는 SQL에서 사용합니다.
+    """
+    schema = session.connection().get_execution_options().get('schema_translate_map', {}).get(None)
+    return f"`{schema}`.`{table}`" if schema else f"`{table}`"
+
+# -------------------------------------------------------------------------------------
+# 3. 현재 최대 키 (이어 붙이기)
+
+def next_benefit_id(session):
+    """기존 ticket_discount 다음의 benefit_id를 반환합니다 (비어 있으면 BENEFIT_ID_START)."""
+    max_id = session.execute(text(
+        f"SELECT MAX(benefit_id) FROM {qualified_table_name(session, 'ticket_discount')}"
+    )).scalar()
+    return BENEFIT_ID_START if max_id is None else max(BENEFIT_ID_START, int(max_id) + 1)
+
+
+def current_high_water_marks(session):
+    """PK를 할당하는 테이블과 benefit_id의 현재 최대값 {테이블명: 최대 키 또는 None}."""
+    marks = {}
+    for table, pk_column in PK_COLUMNS.items():
+        marks[table] = session.execute(text(f"SELECT MAX({pk_column}) FROM {qualified_table_name(session, table)}")).scalar()
+    marks['ticket_discount'] = session.execute(text(
+        f"SELECT MAX(benefit_id) FROM {qualified_table_name(session, 'ticket_discount')}"
+    )).scalar()
+    return marks
+
+# -------------------------------------------------------------------------------------
+# 4. PK 블록 할당기
+
+class IdBlockAllocator:
+    """테이블별 PK 블록을 미리 예약해 두고 파이썬에서 ID를 할당합니다.
+
+    row마다 session.flush()로 AUTO_INCREMENT 값을 읽어오는 대신,
+    시작 시점의 최대 PK를 한 번 조회한 뒤 그 다음 값부터 블록 단위로 ID를 나눠줍니다.
+    시더가 해당 테이블의 유일한 writer라는 전제에서 동작합니다.
+    """
+
+    def __init__(self, start_ids, block_size=ID_BLOCK_SIZE, end_ids=None):
+        # start_ids: {테이블명: 다음에 할당할 ID}, end_ids: {테이블명: 할당 가능한 범위의 끝(미포함)}
+        self.block_size = block_size
+        self.end_ids = end_ids or {}
+        self._high_water = {table: start - 1 for table, start in start_ids.items()}
+        self._next = {table: start for table, start in start_ids.items()}
+        self._limit = {table: start for table, start in start_ids.items()}
+
+    @classmethod
+    def from_session(cls, session, tables=None, block_size=ID_BLOCK_SIZE):
+        """DB의 현재 최대 PK를 조회하여 할당기를 생성합니다."""
+        tables = tables or list(PK_COLUMNS.keys())
+        start_ids = {}
+        for table in tables:
+            pk_column = PK_COLUMNS[table]
+            table_name = qualified_table_name(session, table)
+            max_id = session.execute(text(f"SELECT COALESCE(MAX({pk_column}), 0) FROM {table_name}")).scalar()
+            start_ids[table] = int(max_id) + 1
+        return cls(start_ids, block_size=block_size)
+
+    @classmethod
+    def from_ranges(cls, id_ranges, block_size=ID_BLOCK_SIZE):
+        """샤드에 배정된 ID 범위({테이블명: range})만 사용하는 할당기를 생성합니다."""
+        ranges = {table: id_range for table, id_range in id_ranges.items() if table in PK_COLUMNS}
+        return cls({table: r.start for table, r in ranges.items()}, block_size=block_size,
+                   end_ids={table: r.stop for table, r in ranges.items()})
+
+    def reserve(self, table, count):
+        """count개의 연속된 ID 범위를 예약하여 range로 반환합니다."""
+        start = self._high_water[table] + 1
+        end = self.end_ids.get(table)
+        if end is not None:
+            if start >= end:
+                raise RuntimeError(f"{table} 테이블에 배정된 ID 범위를 모두 사용했습니다. (끝: {end})")
+            count = min(count, end - start)
+        self._high_water[table] += count
+        return range(start, start + count)
+
+    def next_id(self, table):
+        """다음 ID를 반환합니다. 현재 블록을 다 쓰면 새 블록을 예약합니다."""
+        if self._next[table] >= self._limit[table]:
+            block = self.reserve(table, self.block_size)
+            self._next[table] = block.start
+            self._limit[table] = block.stop
+        value = self._next[table]
+        self._next[table] += 1
+        return value
+
+    def getstate(self):
+        """체크포인트용 할당 상태 (다음 ID, 현재 블록 끝, 예약한 최대 ID)."""
+        return {'next': dict(self._next), 'limit': dict(self._limit), 'high_water': dict(self._high_water)}
+
+    def setstate(self, state):
+        self._next = dict(state['next'])
+        self._limit = dict(state['limit'])
+        self._high_water = dict(state['high_water'])
+
+    def sync_auto_increment(self, session):
+        """실제로 사용한 마지막 ID 다음 값으로 AUTO_INCREMENT를 맞춥니다."""
+        if session.get_bind().dialect.name != 'mysql':
+            return
+        for table, next_value in self._next.items():
+            session.execute(text(f"ALTER TABLE {qualified_table_name(session, table)} AUTO_INCREMENT = {next_value}"))
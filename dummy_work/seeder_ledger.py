@@ -0,0 +1,138 @@
+# seeder_ledger.py
+
+from sqlalchemy import Numeric, bindparam, text
+from array import array
+from bisect import bisect_left
+from seeder_money import cents_to_decimal
+
+# -------------------------------------------------------------------------------------
+# 1. 상수 정의
+
+INITIAL_COUPONS = 2      # 쿠폰 보유 회원의 시작 쿠폰 수
+INITIAL_VOUCHERS = 1     # 관람권 보유 회원의 시작 관람권 수
+POINT_DEBIT_TABLE = "seeder_point_debit"   # 배치별 포인트 차감액을 담는 세션 임시 테이블
+USER_TABLE = "`user`"    # 참조 데이터라 섀도 테이블 적재(swap) 중에도 라이브 테이블을 갱신
+
+# -------------------------------------------------------------------------------------
+# 2. 회원 혜택 장부
+
+class BenefitLedger:
+    """회원별 포인트 잔액(센트)과 쿠폰/관람권 보유 수를 user_ids 위치로 인덱싱한 배열로 관리합니다.
+
+    user_ids는 PK 순으로 정렬된 array('q') (load_reference('user_point'))이고, 회원 한 명당
+    포인트 8바이트 + 쿠폰/관람권 1바이트씩만 씁니다. TicketDiscount를 만들 때 use_*로 차감하고,
+    write_back()이 마지막 반영 이후 사용한 포인트를 임시 테이블 + JOIN UPDATE 한 번으로 user 테이블에 반영합니다.
+    쿠폰/관람권 보유 수는 스키마에 보유 테이블이 없어 이 실행의 메모리에만 있고 DB에 저장하지 않습니다
+    (실행마다 grant()로 새로 배정).
+    """
+
+    def __init__(self, user_ids, points):
+        if len(user_ids) != len(points):
+            raise ValueError("user_ids와 points의 길이가 같아야 합니다.")
+        self.user_ids = user_ids
+        self.points = array('q', points)
+        self.coupons = array('B', bytes(len(user_ids)))
+        self.vouchers = array('B', bytes(len(user_ids)))
+        self._debits = {}   # {위치: write_back 이후 사용한 포인트 센트}
+
+    def _position(self, user_id):
+        position = bisect_left(self.user_ids, user_id)
+        if position < len(self.user_ids) and self.user_ids[position] == user_id:
+            return position
+        return None
+
+    def grant(self, inventory, user_ids, count):
+        """inventory(self.coupons / self.vouchers)에서 user_ids 회원의 보유 수를 count로 설정합니다."""
+        for user_id in user_ids:
+            position = self._position(user_id)
+            if position is not None:
+                inventory[position] = count
+
+    def point_balance(self, user_id):
+        position = self._position(user_id)
+        return 0 if position is None else self.points[position]
+
+    def coupons_left(self, user_id):
+        position = self._position(user_id)
+        return 0 if position is None else self.coupons[position]
+
+    def vouchers_left(self, user_id):
+        position = self._position(user_id)
+        return 0 if position is None else self.vouchers[position]
+
+    def use_points(self, user_id, amount):
+        """잔액 한도 안에서 포인트를 차감하고 실제 차감액(센트)을 반환합니다."""
+        position = self._position(user_id)
+        if position is None:
+            return 0
+        amount = max(0, min(amount, self.points[position]))
+        if amount:
+            self.points[position] -= amount
+            self._debits[position] = self._debits.get(position, 0) + amount
+        return amount
+
+    def use_coupon(self, user_id):
+        """쿠폰 하나를 사용합니다. 남은 쿠폰이 없으면 False."""
+        return self._take(self.coupons, user_id)
+
+    def use_voucher(self, user_id):
+        """관람권 하나를 사용합니다. 남은 관람권이 없으면 False."""
+        return self._take(self.vouchers, user_id)
+
+    def _take(self, inventory, user_id):
+        position = self._position(user_id)
+        if position is None or not inventory[position]:
+            return False
+        inventory[position] -= 1
+        return True
+
+    @property
+    def pending_debits(self):
+        """아직 user 테이블에 반영하지 않은 회원 수."""
+        return len(self._debits)
+
+    def write_back(self, session):
+        """write_back 이후 사용한 포인트를 user.point에서 한 번에 차감합니다 (커밋은 호출하는 쪽에서).
+
+        차감액을 세션 임시 테이블에 executemany로 넣고 JOIN UPDATE 한 번으로 반영하므로
+        회원 수와 관계없이 문장 수가 일정합니다. 장부는 시작 시점 잔액으로 만든 것이라 다른 실행이
+        같은 회원의 포인트를 동시에 쓰면 초과 차감될 수 있으므로, 결과 잔액은 0 아래로 내려가지 않게 합니다.
+        샤드 실행은 partition_users()로 회원을 나눠 샤드끼리 같은 회원을 쓰지 않습니다.
+        반영한 회원 수를 반환합니다.
+        """
+        if not self._debits:
+            return 0
+        session.execute(text(
+            f"CREATE TEMPORARY TABLE IF NOT EXISTS {POINT_DEBIT_TABLE} "
+            f"(user_id BIGINT PRIMARY KEY, used DECIMAL(12,2) NOT NULL)"
+        ))
+        session.execute(text(f"DELETE FROM {POINT_DEBIT_TABLE}"))
+        session.execute(text(f"INSERT INTO {POINT_DEBIT_TABLE} (user_id, used) VALUES (:user_id, :used)")
+                        .bindparams(bindparam('used', type_=Numeric(12, 2))),
+                        [{'user_id': self.user_ids[position], 'used': cents_to_decimal(used)}
+                         for position, used in self._debits.items()])
+        if session.get_bind().dialect.name == 'mysql':
+            session.execute(text(
+                f"UPDATE {USER_TABLE} u JOIN {POINT_DEBIT_TABLE} d ON d.user_id = u.user_id "
+                f"SET u.point = GREATEST(u.point - d.used, 0)"
+            ))
+        else:
+            # SQLite 3.33+: UPDATE ... FROM
+            session.execute(text(
+                f"UPDATE {USER_TABLE} SET point = MAX(point - d.used, 0) FROM {POINT_DEBIT_TABLE} d "
+                f"WHERE d.user_id = {USER_TABLE}.user_id"
+            ))
+        count = len(self._debits)
+        self._debits = {}
+        return count
+
+
+def partition_users(user_ids, points, partition):
+    """샤드 실행 시 (샤드 번호, 샤드 수)에 해당하는 회원과 포인트만 남깁니다 (partition_seat_ids와 같은 분할).
+
+    샤드마다 서로 다른 회원 집합의 장부를 가지므로 여러 샤드가 한 회원의 잔액/쿠폰을 중복으로 쓰지 않습니다.
+    """
+    if not partition:
+        return user_ids, points
+    shard_index, shard_count = partition
+    return user_ids[shard_index::shard_count], points[shard_index::shard_count]
@@ -0,0 +1,156 @@
+# seeder_metrics.py
+
+from contextlib import contextmanager
+from datetime import datetime
+import json
+import time
+
+# -------------------------------------------------------------------------------------
+# 1. 상수 정의
+
+# reference_load: 참조 데이터 조회 / generation: 난수 결정 등 파이썬 로직 (전체 - 나머지 단계)
+# row_build: writer.add (ORM 엔티티 / 튜플 생성) / flush: 배치 전송 / commit: 커밋
+PHASES = ['reference_load', 'generation', 'row_build', 'flush', 'commit']
+
+PROGRESS_INTERVAL_SECONDS = 5.0   # 진행 로그(rolling records/sec, ETA) 최소 간격
+
+# -------------------------------------------------------------------------------------
+# 2. 단계별 계측
+
+class SeederMetrics:
+    """시더 실행을 단계별로 계측하고 JSON 한 줄 로그 / JSON 파일로 내보냅니다.
+
+    비활성화는 metrics=None 으로 합니다. 이때 시더는 배치 단위의 `if metrics:` 분기만 거치고
+    writer도 감싸지 않으므로 row 단위 경로에는 계측 비용이 없습니다.
+    """
+
+    def __init__(self, seeder_name, total_records, path=None, stream=None,
+                 progress_interval=PROGRESS_INTERVAL_SECONDS):
+        self.seeder_name = seeder_name
+        self.total_records = total_records
+        self.path = path
+        self.stream = stream
+        self.progress_interval = progress_interval
+        self.phase_seconds = dict.fromkeys(PHASES, 0.0)
+        self._start = self._lap = time.perf_counter()
+        self._last_report_time = self._start
+        self._last_report_records = 0
+
+    def lap(self, phase):
+        """직전 lap 이후 경과 시간을 phase에 더합니다 (예: 참조 데이터 조회 완료 시점)."""
+        now = time.perf_counter()
+        self.phase_seconds[phase] += now - self._lap
+        self._lap = now
+
+    @contextmanager
+    def phase(self, phase):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phase_seconds[phase] += time.perf_counter() - start
+
+    def instrument(self, writer):
+        """writer.add / 배치 전송 / 커밋 시간을 재는 writer로 감쌉니다."""
+        return InstrumentedRowWriter(writer, self)
+
+    def emit(self, event, **fields):
+        """JSON 한 줄 로그를 출력합니다."""
+        record = {'event': event, 'seeder': self.seeder_name, **fields}
+        print(json.dumps(record, ensure_ascii=False), file=self.stream, flush=True)
+
+    def report(self, records_done):
+        """배치 커밋마다 호출. progress_interval마다 rolling records/sec와 ETA를 출력합니다."""
+        now = time.perf_counter()
+        window = now - self._last_report_time
+        if window < self.progress_interval and records_done < self.total_records:
+            return
+        rate = (records_done - self._last_report_records) / window if window > 0 else 0.0
+        remaining = self.total_records - records_done
+        self.emit('progress',
+                  records=records_done, total=self.total_records,
+                  elapsed_seconds=round(now - self._start, 3),
+                  records_per_sec=round(rate, 1),
+                  eta_seconds=round(remaining / rate, 1) if rate > 0 else None)
+        self._last_report_time = now
+        self._last_report_records = records_done
+
+    def finish(self, records_done, row_counts):
+        """단계별 시간, 테이블별 row 수를 요약 출력하고 path가 있으면 JSON 파일로 저장합니다."""
+        elapsed = time.perf_counter() - self._start
+        measured = sum(seconds for phase, seconds in self.phase_seconds.items() if phase != 'generation')
+        self.phase_seconds['generation'] = max(0.0, elapsed - measured)
+        summary = {
+            'records': records_done,
+            'elapsed_seconds': round(elapsed, 3),
+            'records_per_sec': round(records_done / elapsed, 1) if elapsed > 0 else None,
+            'phase_seconds': {phase: round(seconds, 3) for phase, seconds in self.phase_seconds.items()},
+            'rows': dict(row_counts),
+        }
+        self.emit('summary', **summary)
+        if self.path:
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump({'seeder': self.seeder_name, 'finished_at': datetime.now().isoformat(timespec='seconds'),
+                           **summary}, f, ensure_ascii=False, indent=2)
+        return summary
+
+
+class InstrumentedRowWriter:
+    """row writer를 감싸 add는 row_build, 배치 전송은 flush, 커밋은 commit 단계로 잽니다.
+
+    PK 사전 할당 없는 ORM 모드는 add 안에서 부모 row를 flush하므로 그 시간은 row_build에 들어갑니다.
+    파이프라인 writer를 감싸면 flush는 writer 스레드에 배치를 넘기며 기다린 시간(backpressure)입니다.
+    """
+
+    def __init__(self, writer, metrics):
+        self.writer = writer
+        self.metrics = metrics
+        self.session = writer.session
+
+    @property
+    def row_counts(self):
+        return self.writer.row_counts
+
+    @property
+    def pending_rows(self):
+        return self.writer.pending_rows
+
+    @property
+    def last_commit(self):
+        return getattr(self.writer, 'last_commit', None)
+
+    def add(self, model, **values):
+        start = time.perf_counter()
+        try:
+            return self.writer.add(model, **values)
+        finally:
+            self.metrics.phase_seconds['row_build'] += time.perf_counter() - start
+
+    def commit_batch(self):
+        with self.metrics.phase('flush'):
+            self.writer.flush_batch()
+        with self.metrics.phase('commit'):
+            self.session.commit()
+
+    def close(self, sync_auto_increment=True):
+        if self.writer.has_pending_rows():
+            self.commit_batch()
+        self.writer.close(sync_auto_increment)
+
+# -------------------------------------------------------------------------------------
+# 3. CLI 연동
+
+def add_metrics_arguments(parser):
+    """시더 CLI에 계측 옵션을 추가합니다."""
+    parser.add_argument("--metrics", action="store_true",
+                        help="단계별 소요 시간과 진행률(records/sec, ETA)을 JSON 한 줄 로그로 출력")
+    parser.add_argument("--metrics-file", default=None, help="실행 요약을 저장할 JSON 파일 경로 (--metrics 포함)")
+    parser.add_argument("--metrics-interval", type=float, default=PROGRESS_INTERVAL_SECONDS,
+                        help="진행 로그 출력 간격(초)")
+
+
+def create_metrics(seeder_name, args):
+    """CLI 인자로 SeederMetrics를 만듭니다. 계측 옵션이 없으면 None (계측 비활성)."""
+    if not (args.metrics or args.metrics_file):
+        return None
+    return SeederMetrics(seeder_name, args.records, path=args.metrics_file, progress_interval=args.metrics_interval)
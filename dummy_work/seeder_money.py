@@ -0,0 +1,78 @@
+# seeder_money.py
+
+from decimal import Decimal
+from functools import lru_cache
+from sqlalchemy import Numeric
+
+# -------------------------------------------------------------------------------------
+# 1. 상수 정의
+
+CENTS_PER_WON = 100   # DECIMAL(10,2) 금액을 0.01 단위 정수로
+MONEY_SCALE = 2       # 소수 자릿수가 이 값인 DECIMAL/Numeric 컬럼을 금액 컬럼으로 봄
+
+# -------------------------------------------------------------------------------------
+# 2. 정수 센트 ↔ DECIMAL 변환
+
+def to_cents(value):
+    """DB에서 읽은 DECIMAL(또는 float/int) 금액을 정수 센트로 바꿉니다. None은 그대로 반환합니다."""
+    if value is None:
+        return None
+    if isinstance(value, Decimal):
+        return int(value.scaleb(MONEY_SCALE).to_integral_value())
+    return int(round(value * CENTS_PER_WON))
+
+
+def cents_to_decimal(cents):
+    """정수 센트를 DECIMAL 컬럼에 넣을 Decimal로 바꿉니다 (12345 → Decimal('123.45'))."""
+    return Decimal(int(cents)).scaleb(-MONEY_SCALE)
+
+
+def format_cents(cents):
+    """정수 센트를 소수점 두 자리 문자열로 바꿉니다 (LOAD DATA TSV용, -5 → '-0.05')."""
+    whole, frac = divmod(abs(int(cents)), CENTS_PER_WON)
+    return f"{'-' if cents < 0 else ''}{whole}.{frac:02d}"
+
+# -------------------------------------------------------------------------------------
+# 3. 정수 센트 연산
+
+def percent_of(cents, percent):
+    """금액의 percent% 를 센트 단위로 반올림합니다 (percent는 5, 12.5 같은 퍼센트 값)."""
+    return int(round(cents * percent / 100))
+
+
+def ceil_percent_to_won(cents, percent):
+    """금액의 percent% 를 1원 단위로 올림합니다 (math.ceil(원 금액 * percent / 100)과 같음, percent는 정수)."""
+    return -(-cents * percent // (100 * CENTS_PER_WON)) * CENTS_PER_WON
+
+# -------------------------------------------------------------------------------------
+# 4. 쓰기 경계 (writer에서 사용)
+
+@lru_cache(maxsize=None)
+def money_columns(table):
+    """테이블의 금액 컬럼(소수 2자리 DECIMAL) 이름 집합. 이 컬럼의 값은 정수 센트로 받습니다."""
+    return frozenset(column.name for column in table.columns
+                     if isinstance(column.type, Numeric) and column.type.scale == MONEY_SCALE)
+
+
+def decimal_values(values, columns):
+    """dict의 금액 컬럼 값(정수 센트)을 Decimal로 바꿉니다 (제자리 변경)."""
+    for name in columns:
+        cents = values.get(name)
+        if cents is not None:
+            values[name] = cents_to_decimal(cents)
+    return values
+
+
+def decimal_rows(columns, rows, money):
+    """튜플 row들을 금액 컬럼만 Decimal로 바꾼 dict 리스트로 만듭니다 (Core executemany 파라미터)."""
+    indexes = [k for k, name in enumerate(columns) if name in money]
+    if not indexes:
+        return [dict(zip(columns, row)) for row in rows]
+    params = []
+    for row in rows:
+        row = list(row)
+        for k in indexes:
+            if row[k] is not None:
+                row[k] = cents_to_decimal(row[k])
+        params.append(dict(zip(columns, row)))
+    return params
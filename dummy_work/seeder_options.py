@@ -0,0 +1,62 @@
+# seeder_options.py
+
+from dataclasses import dataclass, replace
+from datetime import datetime
+from seeder_batching import AdaptiveBatchController, create_batch_controller
+from seeder_streaming import create_streaming_controller
+from seeder_writer import WRITE_MODE_ORM
+
+# -------------------------------------------------------------------------------------
+# 1. 실행 옵션
+
+@dataclass
+class SeederOptions:
+    """generate_dummy_data(data_seeder_unified / fin)의 실행 옵션을 한데 묶은 객체입니다.
+
+    CLI에서는 from_args()로 만들고, 샤드 실행(run_sharded)은 for_shard()로 샤드마다
+    시드/ID 범위/좌석 몫만 바꾼 사본을 워커에 넘깁니다. 기본값은 ORM 쓰기, seed=42 입니다.
+    """
+
+    # 생성
+    seed: int = 42
+    base_time: datetime = None              # 생성 시각 기준, None이면 seed_base_time(seed)
+    vectorized: bool = False                # 레코드별 난수 결정을 NumPy 블록으로 (unified만)
+    hotspot_skew: float = 0.0               # > 0 이면 회원/스케줄/상품 id를 Zipf 분포로
+    append: bool = False                    # 기존 데이터에 이어 붙임 (--append), 이미 팔린 좌석을 점유 인덱스에 반영
+
+    # 쓰기
+    write_mode: str = WRITE_MODE_ORM        # orm | core | load_data
+    preallocate_ids: bool = False           # ORM 쓰기에서도 PK를 미리 예약한 블록에서 할당
+    batch_controller: AdaptiveBatchController = None   # None이면 커밋 시간 기준 자동 조절
+    writer_threads: int = 0                 # > 0 이면 생성과 DB 쓰기를 겹쳐 실행
+    async_writer: object = None             # AsyncTableWriter (unified core 쓰기만)
+    streaming: bool = False                 # 배치 버퍼를 RSS 상한 안에서 커밋 (core/load_data)
+
+    # 샤드 실행 (run_sharded가 채움)
+    id_ranges: dict = None                  # {테이블: 이 샤드의 PK/benefit_id range}
+    seat_partition: tuple = None            # (샤드 번호, 샤드 수)
+
+    # 계측 / 재시작
+    metrics: object = None                  # SeederMetrics
+    checkpoint: object = None               # SeederCheckpoint (단일 프로세스 unified만)
+
+    @classmethod
+    def from_args(cls, args, **overrides):
+        """시더 CLI 인자로 옵션을 만듭니다. metrics/checkpoint처럼 시더마다 다른 값은 overrides로 넘깁니다."""
+        options = cls(
+            seed=args.seed,
+            base_time=args.base_time,
+            vectorized=getattr(args, 'vectorized', False),
+            hotspot_skew=args.hotspot_skew,
+            append=args.append,
+            write_mode=args.write_mode,
+            batch_controller=create_streaming_controller(args) if args.streaming else create_batch_controller(args),
+            writer_threads=args.writer_threads,
+            streaming=args.streaming,
+        )
+        return replace(options, **overrides)
+
+    def for_shard(self, shard):
+        """plan_shards()의 샤드 하나에 맞춘 사본 (시드, 기준 시각, ID 범위, 좌석/회원 몫)."""
+        return replace(self, seed=shard['seed'], base_time=shard['base_time'], id_ranges=shard['id_ranges'],
+                       seat_partition=shard['seat_partition'], metrics=None, checkpoint=None)
@@ -0,0 +1,27 @@
+# seeder_pending.py
+
+# -------------------------------------------------------------------------------------
+# 1. 부모 PK 확정 전 자식 row 보류
+
+class PendingChildren:
+    """부모 row의 PK가 정해지기 전에 결정된 자식 row를 트랜잭션 단위로 보류합니다.
+
+    예) PaymentDiscount는 결제 금액을 계산하는 도중에 결정되지만 payment_id는 Payment row를
+    만든 뒤에야 알 수 있습니다. 배치 버퍼 전체를 훑으며 'placeholder'를 찾는 대신
+    트랜잭션마다 이 구조에 모아 두었다가 attach()에서 부모 PK를 채워 writer로 넘깁니다.
+    """
+
+    def __init__(self, fk_column):
+        self.fk_column = fk_column
+        self._rows = []   # [(model, values), ...]
+
+    def add(self, model, **values):
+        """부모 PK 없이 자식 row를 보류합니다."""
+        self._rows.append((model, values))
+
+    def attach(self, writer, parent_id):
+        """보류한 자식 row에 부모 PK를 채워 writer에 추가하고 비웁니다."""
+        for model, values in self._rows:
+            values[self.fk_column] = parent_id
+            writer.add(model, **values)
+        self._rows = []
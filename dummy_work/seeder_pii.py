@@ -0,0 +1,111 @@
+# seeder_pii.py
+
+import numpy as np
+import random
+
+# -------------------------------------------------------------------------------------
+# 1. 상수 정의
+
+PII_POOL_SIZE = 4096          # 이름 / 전화번호 / 계좌번호 풀 크기
+DIGIT_BUFFER_SIZE = 1 << 16   # 한 번에 만들어 두는 숫자 문자 수
+
+# 컬럼 길이 제한 (payment_card / payment_bank_transfer / payment_mobile)
+CARD_NUMBER_LENGTH = 4        # card_number VARCHAR(4)
+APPROVAL_NUMBER_LENGTH = 10   # card_approval_number / approval_code VARCHAR(10)
+PHONE_NUMBER_MAX_LENGTH = 13  # phone_number VARCHAR(13), '010-####-####'
+HOLDER_NAME_MAX_LENGTH = 12   # account_holder_name VARCHAR(12)
+ACCOUNT_NUMBER_MIN_LENGTH = 10
+ACCOUNT_NUMBER_MAX_LENGTH = 14
+
+_ZERO = ord('0')
+
+# -------------------------------------------------------------------------------------
+# 2. 숫자 문자열 생성 (NumPy 일괄 생성)
+
+def _digit_string(rng, size):
+    """0~9 숫자 size개를 한 번에 뽑아 하나의 문자열로 반환합니다."""
+    return (rng.integers(0, 10, size, dtype=np.uint8) + _ZERO).tobytes().decode('ascii')
+
+
+def generate_random_account_numbers(rng, size):
+    """0으로 시작하지 않는 10~14자리 계좌 번호 size개를 한 번에 생성합니다."""
+    width = ACCOUNT_NUMBER_MAX_LENGTH
+    lengths = rng.integers(ACCOUNT_NUMBER_MIN_LENGTH, width + 1, size).tolist()
+    digits = rng.integers(0, 10, (size, width), dtype=np.uint8)
+    digits[:, 0] = rng.integers(1, 10, size, dtype=np.uint8)
+    raw = (digits + _ZERO).tobytes().decode('ascii')
+    return [raw[i * width:i * width + length] for i, length in enumerate(lengths)]
+
+
+def generate_random_phone_numbers(rng, size):
+    """'010-####-####' 형식(13자) 휴대폰 번호 size개를 한 번에 생성합니다."""
+    raw = _digit_string(rng, size * 8)
+    return [f"010-{raw[i:i + 4]}-{raw[i + 4:i + 8]}" for i in range(0, size * 8, 8)]
+
+# -------------------------------------------------------------------------------------
+# 3. PII 풀
+
+class PiiPool:
+    """결제 상세(카드/계좌이체/휴대폰)용 가짜 개인정보를 미리 만들어 두고 O(1)로 꺼내 씁니다.
+
+    row마다 Faker를 호출하는 대신 이름은 Faker로 pool_size개만 만들고,
+    전화번호/계좌번호는 NumPy로 일괄 생성한 풀에서 뽑습니다.
+    카드 번호/승인 번호 같은 숫자 문자열은 미리 만든 숫자 버퍼를 잘라서 씁니다.
+    같은 seed면 같은 순서로 값이 나옵니다 (전역 random 상태는 건드리지 않음).
+    """
+
+    def __init__(self, faker, seed=42, pool_size=PII_POOL_SIZE):
+        self._rng = np.random.default_rng(seed)
+        self._random = random.Random(seed)
+        self.names = [faker.name()[:HOLDER_NAME_MAX_LENGTH] for _ in range(pool_size)]
+        self.phone_numbers = generate_random_phone_numbers(self._rng, pool_size)
+        self.account_numbers = generate_random_account_numbers(self._rng, pool_size)
+        self._digits = ''
+        self._digit_pos = 0
+        self._digits_rng_state = None   # 현재 숫자 버퍼를 만들기 직전의 rng 상태 (체크포인트용)
+
+    def digits(self, length):
+        """length자리 숫자 문자열을 반환합니다. 버퍼를 다 쓰면 새로 채웁니다."""
+        pos = self._digit_pos
+        if pos + length > len(self._digits):
+            self._digits_rng_state = self._rng.bit_generator.state
+            self._digits = _digit_string(self._rng, max(DIGIT_BUFFER_SIZE, length))
+            pos = 0
+        self._digit_pos = pos + length
+        return self._digits[pos:pos + length]
+
+    def card_number(self):
+        return self.digits(CARD_NUMBER_LENGTH)
+
+    def approval_number(self):
+        return self.digits(APPROVAL_NUMBER_LENGTH)
+
+    def name(self):
+        return self.names[self._random.randrange(len(self.names))]
+
+    def phone_number(self):
+        return self.phone_numbers[self._random.randrange(len(self.phone_numbers))]
+
+    def account_number(self):
+        return self.account_numbers[self._random.randrange(len(self.account_numbers))]
+
+    def getstate(self):
+        """체크포인트용 난수 상태. 숫자 버퍼 대신 버퍼를 만들기 직전의 rng 상태를 저장합니다."""
+        return {
+            'rng': self._rng.bit_generator.state,
+            'random': self._random.getstate(),
+            'digits_rng': self._digits_rng_state,
+            'digits_size': len(self._digits),
+            'digit_pos': self._digit_pos,
+        }
+
+    def setstate(self, state):
+        """getstate()로 저장한 상태로 되돌립니다 (숫자 버퍼는 다시 생성)."""
+        self._digits = ''
+        if state['digits_rng'] is not None:
+            self._rng.bit_generator.state = state['digits_rng']
+            self._digits = _digit_string(self._rng, state['digits_size'])
+        self._digits_rng_state = state['digits_rng']
+        self._digit_pos = state['digit_pos']
+        self._rng.bit_generator.state = state['rng']
+        self._random.setstate(state['random'])
@@ -0,0 +1,109 @@
+# seeder_pipeline.py
+
+from sqlalchemy.orm import sessionmaker
+import queue
+import threading
+import time
+
+# -------------------------------------------------------------------------------------
+# 1. 상수 정의
+
+PIPELINE_QUEUE_BATCHES = 4   # writer 스레드보다 앞서 만들어 둘 수 있는 배치 수 (메모리 상한)
+_STOP = None                 # writer 스레드 종료 신호
+
+# -------------------------------------------------------------------------------------
+# 2. 생성 / DB 쓰기 파이프라인
+
+class PipelinedRowWriter:
+    """row 생성(호출 스레드)과 DB 쓰기(writer 스레드)를 겹쳐 실행하는 writer.
+
+    commit_batch()는 core/load_data writer의 버퍼를 take_batch()로 떼어 bounded queue에 넣기만 하고,
+    writer 스레드들이 각자 커넥션 풀에서 받은 Session으로 배치를 전송하고 커밋합니다.
+    queue가 가득 차면 commit_batch()가 자리가 날 때까지 기다리므로(backpressure)
+    메모리에 떠 있는 배치는 queue_batches + writer 스레드 수를 넘지 않습니다.
+
+    배치는 레코드 경계에서 잘리고 자식 row는 같은 배치의 부모나 기존 참조 데이터만 가리키므로
+    writer 스레드 사이에 커밋 순서가 바뀌어도 FK가 깨지지 않습니다.
+    PK는 호출 스레드에서 id_allocator로 미리 할당하므로 ORM 쓰기 방식은 지원하지 않습니다.
+    """
+
+    def __init__(self, writer, workers=2, queue_batches=PIPELINE_QUEUE_BATCHES):
+        if not hasattr(writer, 'take_batch'):
+            raise ValueError("파이프라인 모드는 core/load_data 쓰기 방식에서만 사용할 수 있습니다.")
+        self.writer = writer
+        self.session = writer.session
+        self.last_commit = None   # 가장 최근에 끝난 배치의 (row 수, 전송 + 커밋 소요 시간)
+        self._queue = queue.Queue(maxsize=queue_batches)
+        self._error = None
+
+        # 섀도 테이블 교체 시의 schema_translate_map 등 실행 옵션이 그대로 따라가도록 같은 bind 사용
+        Session = sessionmaker(bind=self.session.get_bind())
+        self._threads = [
+            threading.Thread(target=self._drain, args=(Session,), name=f"seeder-writer-{n}", daemon=True)
+            for n in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    @property
+    def row_counts(self):
+        return self.writer.row_counts
+
+    @property
+    def pending_rows(self):
+        return self.writer.pending_rows
+
+    def add(self, model, **values):
+        return self.writer.add(model, **values)
+
+    def has_pending_rows(self):
+        return self.writer.has_pending_rows()
+
+    def _drain(self, Session):
+        """writer 스레드: queue에서 배치를 꺼내 전송하고 커밋합니다."""
+        session = Session()
+        try:
+            while True:
+                item = self._queue.get()
+                if item is _STOP:
+                    break
+                if self._error is not None:
+                    continue   # 오류 이후에는 호출 스레드가 막히지 않도록 비우기만 함
+                rows, batch = item
+                start = time.perf_counter()
+                try:
+                    self.writer.write_batch(session, batch)
+                    session.commit()
+                except Exception as e:
+                    session.rollback()
+                    self._error = e
+                    continue
+                self.last_commit = (rows, time.perf_counter() - start)
+        finally:
+            session.close()
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise RuntimeError(f"writer 스레드에서 배치 쓰기에 실패했습니다: {self._error}") from self._error
+
+    def flush_batch(self):
+        """버퍼를 배치로 떼어 queue에 넣습니다. queue가 가득 차 있으면 기다립니다."""
+        self._raise_error()
+        rows = self.writer.pending_rows
+        batch = self.writer.take_batch()
+        if batch:
+            self._queue.put((rows, batch))
+
+    def commit_batch(self):
+        """커밋은 writer 스레드가 하므로 배치를 넘기기만 합니다."""
+        self.flush_batch()
+
+    def close(self, sync_auto_increment=True):
+        """남은 배치를 모두 커밋하고 writer 스레드를 종료한 뒤 AUTO_INCREMENT를 보정합니다."""
+        self.flush_batch()
+        for _ in self._threads:
+            self._queue.put(_STOP)
+        for thread in self._threads:
+            thread.join()
+        self._raise_error()
+        self.writer.close(sync_auto_increment)
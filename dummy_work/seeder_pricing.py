@@ -0,0 +1,107 @@
+# seeder_pricing.py
+
+from sqlalchemy import text
+from array import array
+from bisect import bisect_left
+import numpy as np
+from seeder_money import to_cents
+from seeder_reference import load_reference
+
+# -------------------------------------------------------------------------------------
+# 1. 티켓 가격 행렬
+
+class TicketPriceMatrix:
+    """(schedule_id, 관람 연령) 별 최종 티켓 가격을 미리 계산해 둔 dense 행렬입니다.
+
+    가격은 schedule_id와 age_type에만 의존하므로 screen_schedule / screen_type /
+    screen_time / age_type 을 읽은 직후 한 번만 계산합니다.
+    행은 schedule_ids 순서(정렬), 열은 age_type_codes 순서입니다.
+    base_price와 가격/가감 맵은 정수 센트이고, 행렬과 조회 결과도 int64 센트입니다.
+    스케줄 입력은 load_reference(session, 'schedule')의 컬럼 array 그대로이고, 가격은 범주 코드별로
+    한 번 구한 값을 NumPy 인덱싱으로 펼치므로 스케줄별 파이썬 객체(dict/리스트)를 만들지 않습니다.
+    """
+
+    def __init__(self, schedule_ids, screen_type_column, screen_time_column, screen_type_map, screen_time_map,
+                 age_type_map, base_price, age_type_codes):
+        """screen_type_column / screen_time_column: (코드 array, 범주 리스트) (load_reference의 'code' 컬럼)."""
+        self.base_price = base_price
+        self.age_type_codes = list(age_type_codes)
+        schedule_ids = np.asarray(schedule_ids, dtype=np.int64)
+        order = np.argsort(schedule_ids, kind='stable')
+        self.schedule_ids = schedule_ids[order]
+
+        # 범주 코드별 가격과 가격 정보 유무 → 스케줄별 값
+        type_codes, screen_types = screen_type_column
+        time_codes, screen_times = screen_time_column
+        type_codes = np.asarray(type_codes, dtype=np.int64)[order]
+        time_codes = np.asarray(time_codes, dtype=np.int64)[order]
+        type_prices = np.array([screen_type_map.get(value, 0) for value in screen_types] or [0], dtype=np.int64)
+        time_prices = np.array([screen_time_map.get(value, 0) for value in screen_times] or [0], dtype=np.int64)
+        type_known = np.array([bool(value) for value in screen_types] or [False])
+        time_known = np.array([bool(value) for value in screen_times] or [False])
+        schedule_prices = base_price + type_prices[type_codes] + time_prices[time_codes]
+        has_price_info = type_known[type_codes] & time_known[time_codes]
+
+        age_adjustments = np.array([age_type_map.get(code, 0) for code in self.age_type_codes], dtype=np.int64)
+        # 상영관/시간 정보가 없는 스케줄은 연령 가감 없이 기본 가격
+        prices = np.maximum(0, schedule_prices[:, None] + age_adjustments[None, :])
+        prices[~has_price_info, :] = base_price
+        self.prices = prices
+
+        # 스칼라 조회용: schedule_id array(이분 탐색)와 행 우선 가격 array (행마다 연령 수만큼)
+        self._ids = array('q', self.schedule_ids.tobytes())
+        self._flat = array('q', prices.tobytes())
+        self._width = len(self.age_type_codes)
+        self._base_row = array('q', [base_price] * self._width)
+
+    @classmethod
+    def from_session(cls, session, base_price, age_type_codes):
+        """가격 정책 테이블을 조회하여 행렬을 생성합니다."""
+        schedule_ids, screen_type_column, screen_time_column = load_reference(session, 'schedule')
+        screen_type_prices = session.execute(text("SELECT screen_type, price FROM screen_type")).fetchall()
+        screen_time_adjustments = session.execute(text("SELECT screen_time, adjust_price FROM screen_time")).fetchall()
+        age_type_adjustments = session.execute(text("SELECT age_type, adjust_price FROM age_type")).fetchall()
+        return cls(
+            schedule_ids, screen_type_column, screen_time_column,
+            {row[0]: to_cents(row[1]) for row in screen_type_prices},
+            {row[0]: to_cents(row[1]) for row in screen_time_adjustments},
+            {row[0]: to_cents(row[1]) for row in age_type_adjustments},
+            base_price, age_type_codes,
+        )
+
+    def row(self, schedule_id):
+        """스케줄 하나의 연령별 가격 array('q') (age_type_codes 순서, 없는 스케줄이면 기본 가격)."""
+        position = bisect_left(self._ids, schedule_id)
+        if position < len(self._ids) and self._ids[position] == schedule_id:
+            start = position * self._width
+            return self._flat[start:start + self._width]
+        return self._base_row
+
+    def prices_for(self, schedule_ids, age_indexes):
+        """배치 가격 조회. schedule_ids (N,) 와 age_indexes (N,) 또는 (N, K) 로 가격 배열을 반환합니다."""
+        schedule_ids = np.asarray(schedule_ids, dtype=np.int64)
+        age_indexes = np.asarray(age_indexes, dtype=np.int64)
+        rows = np.searchsorted(self.schedule_ids, schedule_ids)
+        rows = np.minimum(rows, len(self.schedule_ids) - 1)
+        known = self.schedule_ids[rows] == schedule_ids
+        if age_indexes.ndim == 2:
+            prices = self.prices[rows[:, None], age_indexes]
+            return np.where(known[:, None], prices, self.base_price)
+        return np.where(known, self.prices[rows, age_indexes], self.base_price)
+
+    def reservation_prices_for(self, schedule_ids, age_indexes, num_seats):
+        """배치 예매 총액. age_indexes (N, K) 중 앞쪽 num_seats개 좌석 가격의 합을 반환합니다."""
+        prices = self.prices_for(schedule_ids, age_indexes)
+        seat_mask = np.arange(prices.shape[1])[None, :] < np.asarray(num_seats)[:, None]
+        return (prices * seat_mask).sum(axis=1)
+
+
+def count_age_types(age_indexes):
+    """좌석별 연령 인덱스를 [(연령 인덱스, 인원), ...]으로 집계합니다 (처음 등장한 순서).
+
+    ReservationCount 생성용.
+    """
+    counts = {}
+    for k in age_indexes:
+        counts[k] = counts.get(k, 0) + 1
+    return counts.items()
@@ -0,0 +1,141 @@
+# seeder_reference.py
+
+from sqlalchemy import text
+from array import array
+from bisect import bisect_left
+import hashlib
+import os
+import pickle
+from seeder_money import to_cents
+
+# -------------------------------------------------------------------------------------
+# 1. 상수 정의
+
+STREAM_CHUNK_ROWS = 100000   # 서버 사이드 커서에서 한 번에 받아 array에 붙이는 row 수
+CODE_TYPECODE = 'h'          # screen_type / screen_time 등 범주형 컬럼의 코드 배열 (2바이트)
+CHECKSUM_MAX_ROWS = 100000   # 이 row 수 이하인 참조 테이블은 지문에 CHECKSUM TABLE(전체 값)을 씀 (MySQL)
+
+# 참조 데이터 종류: (원본 테이블, PK 컬럼, 조회 SQL, 컬럼별 타입)
+#   'q' → array('q') (int64), 'd' → array('d') (float64), 'cents' → 금액을 정수 센트로 담은 array('q'),
+#   'code' → (코드 array, 범주 리스트)
+# PK 순서로 읽어야 같은 seed에서 같은 id가 뽑히고, 캐시와 DB 조회 결과가 같은 순서가 됩니다.
+REFERENCE_SOURCES = {
+    'schedule': ('screen_schedule', 'schedule_id',
+                 "SELECT schedule_id, screen_type, screen_time FROM screen_schedule ORDER BY schedule_id", ('q', 'code', 'code')),
+    'seat': ('seat', 'seat_id', "SELECT seat_id FROM seat ORDER BY seat_id", ('q',)),
+    'user': ('user', 'user_id', "SELECT user_id FROM user ORDER BY user_id", ('q',)),
+    'user_point': ('user', 'user_id', "SELECT user_id, point FROM user ORDER BY user_id", ('q', 'cents')),
+    'non_user': ('non_user', 'non_user_id', "SELECT non_user_id FROM non_user ORDER BY non_user_id", ('q',)),
+    'store_item': ('store_item', 'store_item_id', "SELECT store_item_id, price FROM store_item ORDER BY store_item_id", ('q', 'cents')),
+    'discount_policy': ('discount_policy', 'policy_id',
+                        "SELECT policy_id, partner_id, discount_amount, discount_percent, min_price, max_benefit_amount "
+                        "FROM discount_policy ORDER BY policy_id", ('q', 'code', 'cents', 'd', 'cents', 'cents')),
+    'coupon': ('coupon', 'coupon_id',
+               "SELECT coupon_id, discount_type, discount_value, max_discount_amount, min_price FROM coupon ORDER BY coupon_id",
+               ('q', 'q', 'd', 'cents', 'cents')),
+}
+
+# 캐시 디렉터리 (SEEDER_CACHE_DIR="" 이면 캐시 사용 안 함)
+REFERENCE_CACHE_DIR = os.getenv("SEEDER_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".seeder_cache"))
+
+# -------------------------------------------------------------------------------------
+# 2. 서버 사이드 커서 → 컬럼 array
+
+def stream_columns(session, sql, column_types, chunk_rows=STREAM_CHUNK_ROWS):
+    """sql 결과를 서버 사이드 커서로 chunk_rows씩 받아 컬럼별 array로 쌓습니다.
+
+    fetchall()처럼 전체 결과를 파이썬 튜플 리스트로 만들지 않으므로
+    메모리는 값 하나당 8바이트(int64/float64) 또는 2바이트(범주 코드)입니다.
+    'code' 컬럼은 값마다 처음 나온 순서대로 번호를 매겨 (코드 array, 범주 리스트)로 반환합니다.
+    'd' / 'cents' 컬럼의 NULL은 0으로 담습니다.
+    """
+    columns = []
+    code_maps = []
+    for column_type in column_types:
+        columns.append(array(CODE_TYPECODE if column_type == 'code' else 'q' if column_type == 'cents' else column_type))
+        code_maps.append({} if column_type == 'code' else None)
+
+    result = session.execute(text(sql), execution_options={'stream_results': True})
+    for rows in result.partitions(chunk_rows):
+        for k, values in enumerate(zip(*rows)):
+            codes = code_maps[k]
+            if codes is not None:
+                columns[k].extend(codes.setdefault(value, len(codes)) for value in values)
+            elif column_types[k] == 'd':
+                columns[k].extend(float(value or 0) for value in values)
+            elif column_types[k] == 'cents':
+                columns[k].extend(to_cents(value) or 0 for value in values)
+            else:
+                columns[k].extend(values)
+
+    return [(column, list(codes)) if codes is not None else column for column, codes in zip(columns, code_maps)]
+
+
+def table_fingerprint(session, table, pk_column):
+    """원본 테이블의 싼 지문: row 수와 PK 범위 (MySQL은 값 변경을 알 수 있는 항목도 포함).
+
+    MySQL에서 row가 CHECKSUM_MAX_ROWS 이하인 작은 테이블(정책, 쿠폰, 상품 등)은 CHECKSUM TABLE로
+    모든 값을 확인합니다. 큰 테이블은 매 실행마다 전체를 읽지 않도록 information_schema의 UPDATE_TIME을 쓰는데,
+    MySQL 8은 이 값을 information_schema_stats_expiry(기본 86400초) 동안 캐시하므로 세션에서 0으로 두고 읽습니다.
+    InnoDB는 서버 재시작 후 UPDATE_TIME이 NULL이 되므로 그때 큰 테이블의 PK가 아닌 값만 바뀌었다면 캐시를 지우세요
+    (값이 계속 바뀌는 컬럼은 cache_dir=''로 항상 DB에서 읽음, 예: fin.py의 user_point).
+    """
+    row = session.execute(text(f"SELECT COUNT(*), MIN({pk_column}), MAX({pk_column}) FROM `{table}`")).fetchone()
+    parts = [str(value) for value in row]
+    dialect = session.get_bind().dialect
+    if dialect.name == 'mysql':
+        if row[0] <= CHECKSUM_MAX_ROWS:
+            parts.append(str(session.execute(text(f"CHECKSUM TABLE `{table}`")).fetchone()[1]))
+        else:
+            if not dialect.is_mariadb and dialect.server_version_info >= (8, 0):
+                session.execute(text("SET SESSION information_schema_stats_expiry = 0"))
+            parts.append(str(session.execute(
+                text("SELECT UPDATE_TIME FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = :table"),
+                {'table': table}
+            ).scalar()))
+    return ':'.join(parts)
+
+# -------------------------------------------------------------------------------------
+# 3. 디스크 캐시
+
+def _cache_path(session, name, cache_dir):
+    """DB 위치, 조회 SQL, 원본 테이블 지문으로 캐시 파일 경로를 정합니다."""
+    table, pk_column, sql, column_types = REFERENCE_SOURCES[name]
+    url = session.get_bind().url.render_as_string(hide_password=True)
+    key = '|'.join([url, sql, ','.join(column_types), table_fingerprint(session, table, pk_column)])
+    return os.path.join(cache_dir, f"{name}_{hashlib.sha256(key.encode()).hexdigest()[:16]}.pkl")
+
+
+def load_reference(session, name, cache_dir=REFERENCE_CACHE_DIR):
+    """참조 데이터 한 종류를 컬럼별 array 리스트로 반환합니다 (REFERENCE_SOURCES[name]의 컬럼 순서).
+
+    원본 테이블 지문(table_fingerprint)이 같은 캐시 파일이 있으면 DB를 읽지 않고 파일에서 불러오고,
+    없으면 서버 사이드 커서로 읽은 뒤 캐시에 저장합니다. row가 추가/삭제되면 지문이 달라져 다시 읽습니다.
+    """
+    table, pk_column, sql, column_types = REFERENCE_SOURCES[name]
+    if not cache_dir:
+        return stream_columns(session, sql, column_types)
+
+    path = _cache_path(session, name, cache_dir)
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+    columns = stream_columns(session, sql, column_types)
+    os.makedirs(cache_dir, exist_ok=True)
+    # 샤드 프로세스들이 동시에 같은 캐시를 쓸 수 있으므로 임시 파일에 쓴 뒤 교체
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(columns, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return columns
+
+# -------------------------------------------------------------------------------------
+# 4. 조회 도우미
+
+def value_for(sorted_ids, values, key, default=0):
+    """PK 순으로 정렬된 id array에서 key를 이분 탐색해 같은 위치의 값을 반환합니다 (없으면 default)."""
+    index = bisect_left(sorted_ids, key)
+    if index < len(sorted_ids) and sorted_ids[index] == key:
+        return values[index]
+    return default
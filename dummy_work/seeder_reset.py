@@ -0,0 +1,218 @@
+# seeder_reset.py
+
+from sqlalchemy import text, bindparam
+from contextlib import contextmanager
+
+# -------------------------------------------------------------------------------------
+# 1. 상수 정의
+
+RESET_DELETE = "delete"      # row 단위 DELETE FROM (기존 방식)
+RESET_TRUNCATE = "truncate"  # FK 체크를 끄고 TRUNCATE (MySQL 외에는 DELETE로 대체)
+RESET_SWAP = "swap"          # 섀도 테이블에 적재 후 RENAME TABLE 한 문장으로 교체 (MySQL 전용)
+RESET_MODES = [RESET_DELETE, RESET_TRUNCATE, RESET_SWAP]
+
+DELETE_CHUNK_SIZE = 5000          # 청크 삭제 시 한 번에 지우는 payment 수
+
+SHADOW_SCHEMA_SUFFIX = "_shadow"  # 섀도 테이블을 만드는 스키마: {현재 DB}_shadow
+OLD_SCHEMA_SUFFIX = "_old"        # 교체 직후 기존 테이블을 잠깐 옮겨 두는 스키마: {현재 DB}_old
+
+# -------------------------------------------------------------------------------------
+# 2. TRUNCATE 리셋
+
+@contextmanager
+def foreign_key_checks_disabled(session):
+    """세션의 FOREIGN_KEY_CHECKS를 끄고, 끝나면 원래 값으로 되돌립니다."""
+    previous = session.execute(text("SELECT @@SESSION.foreign_key_checks")).scalar()
+    session.execute(text("SET SESSION foreign_key_checks = 0"))
+    try:
+        yield
+    finally:
+        session.execute(text(f"SET SESSION foreign_key_checks = {int(previous)}"))
+
+
+def reset_tables(session, tables, mode=RESET_TRUNCATE):
+    """tables(자식 → 부모 순서)를 비웁니다.
+
+    truncate 모드는 MySQL에서 FK 체크를 끈 세션으로 테이블마다 TRUNCATE 하므로
+    row 수와 관계없이 거의 일정한 시간에 끝나고 undo 로그도 쌓이지 않습니다.
+    TRUNCATE가 없는 DB(SQLite 등)에서는 DELETE로 대체합니다.
+    swap 모드는 ShadowTableSwap을 사용해야 합니다.
+    """
+    if mode == RESET_SWAP:
+        raise ValueError("swap 리셋은 reset_tables가 아니라 ShadowTableSwap으로 수행합니다.")
+    if mode not in RESET_MODES:
+        raise ValueError(f"지원하지 않는 리셋 방식입니다: {mode} (사용 가능: {RESET_MODES})")
+
+    if mode == RESET_TRUNCATE and session.get_bind().dialect.name == 'mysql':
+        with foreign_key_checks_disabled(session):
+            for table_name in tables:
+                session.execute(text(f"TRUNCATE TABLE `{table_name}`"))
+    else:
+        for table_name in tables:
+            session.execute(text(f"DELETE FROM `{table_name}`"))
+    session.commit()
+
+# -------------------------------------------------------------------------------------
+# 3. PK 범위 청크 삭제
+
+def delete_payments_in_chunks(session, payment_type, child_tables, chunk_size=DELETE_CHUNK_SIZE, start_after=0):
+    """payment_type이 같은 결제와 자식 row를 payment_id 범위 단위로 나눠 삭제합니다.
+
+    ID 목록을 파이썬으로 가져와 IN (...) 한 문장으로 지우는 대신, PK 인덱스를 따라
+    chunk_size개씩 [시작, 끝] 범위를 잡아 자식 → payment 순서로 지우고 청크마다 커밋합니다.
+    이미 지운 범위는 다시 조회되지 않으므로 중단 후 다시 실행하면 남은 부분부터 이어집니다.
+    start_after를 주면 그 payment_id 다음부터 시작합니다. 삭제한 payment 수를 반환합니다.
+    """
+    is_mysql = session.get_bind().dialect.name == 'mysql'
+    params = {'payment_type': payment_type}
+    total = session.execute(text(
+        "SELECT COUNT(*) FROM payment WHERE payment_type = :payment_type AND payment_id > :start_after"
+    ), {**params, 'start_after': start_after}).scalar()
+    if not total:
+        return 0
+
+    deleted = 0
+    last_id = start_after
+    while True:
+        # PK 인덱스로 다음 청크의 끝 payment_id 조회
+        end_id = session.execute(text(
+            "SELECT MAX(payment_id) FROM ("
+            "  SELECT payment_id FROM payment WHERE payment_type = :payment_type AND payment_id > :last_id "
+            "  ORDER BY payment_id LIMIT :chunk_size"
+            ") AS chunk"
+        ), {**params, 'last_id': last_id, 'chunk_size': chunk_size}).scalar()
+        if end_id is None:
+            break
+
+        range_params = {**params, 'start_id': last_id + 1, 'end_id': end_id}
+        for table_name in child_tables:
+            if is_mysql:
+                session.execute(text(
+                    f"DELETE c FROM `{table_name}` c JOIN payment p ON p.payment_id = c.payment_id "
+                    f"WHERE p.payment_type = :payment_type AND p.payment_id BETWEEN :start_id AND :end_id"
+                ), range_params)
+            else:
+                session.execute(text(
+                    f"DELETE FROM `{table_name}` WHERE payment_id IN ("
+                    f"SELECT payment_id FROM payment WHERE payment_type = :payment_type "
+                    f"AND payment_id BETWEEN :start_id AND :end_id)"
+                ), range_params)
+        result = session.execute(text(
+            "DELETE FROM payment WHERE payment_type = :payment_type AND payment_id BETWEEN :start_id AND :end_id"
+        ), range_params)
+        session.commit()
+
+        deleted += result.rowcount
+        last_id = end_id
+        print(f"  ... {deleted}/{total}건 삭제 (마지막 payment_id: {last_id})")
+    return deleted
+
+# -------------------------------------------------------------------------------------
+# 4. 섀도 테이블 교체
+
+def load_foreign_keys(session, schema, tables):
+    """tables가 가지고 있거나 참조되는 FK 정의를 읽습니다.
+
+    [{'table', 'name', 'columns', 'ref_table', 'ref_columns', 'update_rule', 'delete_rule'}, ...]
+    """
+    rows = session.execute(text(
+        "SELECT kcu.TABLE_NAME, kcu.CONSTRAINT_NAME, kcu.COLUMN_NAME, "
+        "       kcu.REFERENCED_TABLE_NAME, kcu.REFERENCED_COLUMN_NAME, rc.UPDATE_RULE, rc.DELETE_RULE "
+        "FROM information_schema.KEY_COLUMN_USAGE kcu "
+        "JOIN information_schema.REFERENTIAL_CONSTRAINTS rc "
+        "  ON rc.CONSTRAINT_SCHEMA = kcu.CONSTRAINT_SCHEMA AND rc.TABLE_NAME = kcu.TABLE_NAME "
+        " AND rc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME "
+        "WHERE kcu.TABLE_SCHEMA = :schema AND kcu.REFERENCED_TABLE_NAME IS NOT NULL "
+        "  AND (kcu.TABLE_NAME IN :tables OR kcu.REFERENCED_TABLE_NAME IN :tables) "
+        "ORDER BY kcu.TABLE_NAME, kcu.CONSTRAINT_NAME, kcu.ORDINAL_POSITION"
+    ).bindparams(bindparam('tables', expanding=True)), {'schema': schema, 'tables': list(tables)}).fetchall()
+
+    foreign_keys = {}
+    for table, name, column, ref_table, ref_column, update_rule, delete_rule in rows:
+        fk = foreign_keys.setdefault((table, name), {
+            'table': table, 'name': name, 'columns': [], 'ref_table': ref_table, 'ref_columns': [],
+            'update_rule': update_rule, 'delete_rule': delete_rule,
+        })
+        fk['columns'].append(column)
+        fk['ref_columns'].append(ref_column)
+    return list(foreign_keys.values())
+
+
+class ShadowTableSwap:
+    """섀도 스키마에 빈 테이블 사본을 만들어 적재한 뒤 RENAME TABLE 한 번으로 교체합니다.
+
+    적재하는 동안 라이브 테이블은 기존 데이터를 그대로 제공합니다.
+    적재용 세션/엔진에는 execution_options(schema_translate_map)를 걸어
+    ORM/Core INSERT가 섀도 스키마의 같은 이름 테이블로 가도록 합니다.
+    (참조 데이터 조회용 text() 쿼리는 그대로 라이브 스키마를 읽습니다.)
+
+    CREATE TABLE ... LIKE 는 외래 키를 복사하지 않으므로, 교체 직전에 라이브 테이블의 FK를
+    섀도 테이블에 만들어 두고 RENAME TABLE 한 문장으로 교체합니다. 라이브 테이블은 교체 순간까지
+    FK를 그대로 가지며, 교체 대상 테이블들은 FK와 함께 한꺼번에 바뀝니다.
+    교체 대상 밖의 테이블이 교체 대상을 참조하는 FK만 교체 후 새 테이블로 다시 연결합니다.
+    """
+
+    def __init__(self, session, tables):
+        if session.get_bind().dialect.name != 'mysql':
+            raise ValueError("swap 리셋은 MySQL/MariaDB에서만 사용할 수 있습니다.")
+        self.session = session
+        self.tables = list(tables)
+        self.live_schema = session.execute(text("SELECT DATABASE()")).scalar()
+        self.shadow_schema = self.live_schema + SHADOW_SCHEMA_SUFFIX
+        self.old_schema = self.live_schema + OLD_SCHEMA_SUFFIX
+        self.foreign_keys = []
+
+    @property
+    def execution_options(self):
+        """섀도 테이블에 적재할 엔진/세션에 걸 execution_options."""
+        return {'schema_translate_map': {None: self.shadow_schema}}
+
+    def prepare(self):
+        """섀도 스키마에 라이브 테이블과 같은 구조의 빈 테이블을 만듭니다."""
+        self.foreign_keys = load_foreign_keys(self.session, self.live_schema, self.tables)
+        self.session.execute(text(f"CREATE DATABASE IF NOT EXISTS `{self.shadow_schema}`"))
+        self.session.execute(text(f"CREATE DATABASE IF NOT EXISTS `{self.old_schema}`"))
+        for table_name in self.tables:
+            self.session.execute(text(f"DROP TABLE IF EXISTS `{self.shadow_schema}`.`{table_name}`"))
+            self.session.execute(text(f"DROP TABLE IF EXISTS `{self.old_schema}`.`{table_name}`"))
+            self.session.execute(text(
+                f"CREATE TABLE `{self.shadow_schema}`.`{table_name}` LIKE `{self.live_schema}`.`{table_name}`"
+            ))
+        self.session.commit()
+
+    def _add_foreign_key(self, schema, fk, ref_schema):
+        """schema의 fk['table']에 FK를 만듭니다. 참조 테이블은 ref_schema에서 찾습니다."""
+        columns = ', '.join(f'`{c}`' for c in fk['columns'])
+        ref_columns = ', '.join(f'`{c}`' for c in fk['ref_columns'])
+        self.session.execute(text(
+            f"ALTER TABLE `{schema}`.`{fk['table']}` ADD CONSTRAINT `{fk['name']}` "
+            f"FOREIGN KEY ({columns}) REFERENCES `{ref_schema}`.`{fk['ref_table']}` ({ref_columns}) "
+            f"ON UPDATE {fk['update_rule']} ON DELETE {fk['delete_rule']}"
+        ))
+
+    def swap(self):
+        """섀도 테이블에 FK를 만든 뒤 RENAME TABLE 한 문장으로 라이브 테이블과 교체하고 기존 테이블을 삭제합니다."""
+        live, shadow, old = self.live_schema, self.shadow_schema, self.old_schema
+        owned = [fk for fk in self.foreign_keys if fk['table'] in self.tables]
+        inbound = [fk for fk in self.foreign_keys if fk['table'] not in self.tables]
+        with foreign_key_checks_disabled(self.session):
+            # 라이브 테이블의 FK는 그대로 두고 섀도 테이블에 같은 FK를 미리 생성
+            # (InnoDB FK는 RENAME된 참조 테이블을 따라가므로, 교체 대상끼리의 참조는 섀도 사본을 가리킴)
+            for fk in owned:
+                self._add_foreign_key(shadow, fk, shadow if fk['ref_table'] in self.tables else live)
+
+            # 한 문장으로 교체: 라이브 → old를 모두 먼저, 그다음 섀도 → 라이브
+            # (FK 이름은 스키마 안에서 유일해야 하므로 같은 이름의 FK가 한 스키마에 겹치지 않는 순서)
+            renames = [f"`{live}`.`{table_name}` TO `{old}`.`{table_name}`" for table_name in self.tables]
+            renames += [f"`{shadow}`.`{table_name}` TO `{live}`.`{table_name}`" for table_name in self.tables]
+            self.session.execute(text("RENAME TABLE " + ", ".join(renames)))
+
+            # 교체 대상 밖의 테이블이 교체 대상을 참조하던 FK는 old 테이블을 따라갔으므로 새 테이블로 다시 연결
+            # (여기서 실패하면 old 테이블을 지우지 않고 남겨 둡니다)
+            for fk in inbound:
+                self.session.execute(text(f"ALTER TABLE `{live}`.`{fk['table']}` DROP FOREIGN KEY `{fk['name']}`"))
+                self._add_foreign_key(live, fk, live)
+
+            for table_name in self.tables:
+                self.session.execute(text(f"DROP TABLE IF EXISTS `{old}`.`{table_name}`"))
+        self.session.commit()
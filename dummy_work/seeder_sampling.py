@@ -0,0 +1,141 @@
+# seeder_sampling.py
+
+from array import array
+from bisect import bisect
+from itertools import accumulate
+import numpy as np
+import random
+
+# -------------------------------------------------------------------------------------
+# 1. 상수 정의
+
+HOTSPOT_SEED = 0   # 핫스팟 순위(어떤 id가 인기 id인지)를 정하는 시드, 샤드/실행마다 같은 id가 인기
+
+# -------------------------------------------------------------------------------------
+# 2. 누적 가중치 샘플러
+
+class WeightedSampler:
+    """분포 하나의 누적 가중치 표를 한 번만 만들어 두고 이분 탐색으로 뽑습니다.
+
+    random.choices(population, weights=..., k=1)은 호출마다 누적 표를 다시 만듭니다.
+    draw()는 그와 같은 방식(random() * 합계 → bisect)으로 난수를 같은 개수만큼 소비하므로
+    같은 seed면 random.choices와 같은 값이 나옵니다. draw_batch(rng, size)는
+    numpy Generator.choice(len, size, p=정규화 가중치)와 같은 값을 NumPy 배열로 반환합니다.
+    population은 복사하지 않으므로 array('q') 같은 큰 id 배열도 그대로 쓸 수 있습니다.
+    """
+
+    def __init__(self, population, weights, random_source=random):
+        if len(population) != len(weights) or not len(population):
+            raise ValueError("population과 weights의 길이가 같아야 하고 비어 있지 않아야 합니다.")
+        self.population = population
+        if isinstance(weights, np.ndarray):
+            self.cum_weights = array('d', np.cumsum(weights, dtype=np.float64).tobytes())
+        else:
+            self.cum_weights = list(accumulate(weights))
+        self.total = self.cum_weights[-1] + 0.0
+        if self.total <= 0.0:
+            raise ValueError("가중치 합이 0보다 커야 합니다.")
+        self._weights = weights
+        self._hi = len(self.cum_weights) - 1
+        self._random = random_source.random
+        self._cdf = None
+        self._population_array = None
+
+    def draw(self):
+        """값 하나 (random.choices(population, weights, k=1)[0]과 같음)."""
+        return self.population[bisect(self.cum_weights, self._random() * self.total, 0, self._hi)]
+
+    def draws(self, k):
+        """값 k개 리스트 (random.choices(population, weights, k=k)와 같음)."""
+        population, cum_weights, total, hi, rand = self.population, self.cum_weights, self.total, self._hi, self._random
+        return [population[bisect(cum_weights, rand() * total, 0, hi)] for _ in range(k)]
+
+    def draw_indexes(self, rng, size):
+        """NumPy rng로 인덱스 배열을 뽑습니다 (rng.choice(len, size, p=...)와 같은 난수 소비)."""
+        if self._cdf is None:
+            p = np.asarray(self._weights, dtype=np.float64)
+            cdf = (p / p.sum()).cumsum()
+            self._cdf = cdf / cdf[-1]
+        return self._cdf.searchsorted(rng.random(size), side='right')
+
+    def draw_batch(self, rng, size):
+        """NumPy rng로 값 배열을 뽑습니다."""
+        if self._population_array is None:
+            self._population_array = np.asarray(self.population)
+        return self._population_array[self.draw_indexes(rng, size)]
+
+# -------------------------------------------------------------------------------------
+# 3. alias 샘플러
+
+class AliasSampler:
+    """Vose alias method: 뽑을 때마다 인덱스 하나와 [0, 1) 난수 하나로 O(1)에 뽑습니다.
+
+    핫스팟처럼 원소가 수백만 개인 분포에서 누적 표 이분 탐색보다 빠릅니다 (500만 id 기준
+    draw 약 1.7배, draw_indexes 약 10배). 대신 표를 만드는 데 O(n) 파이썬 루프가 돌아
+    500만 id에 몇 초 걸리므로 실행마다 한 번 만드는 분포에만 씁니다.
+    random.choices와 난수 소비 방식이 다르므로 같은 seed여도 값은 다릅니다.
+    """
+
+    def __init__(self, population, weights, random_source=random):
+        n = len(population)
+        if n != len(weights) or not n:
+            raise ValueError("population과 weights의 길이가 같아야 하고 비어 있지 않아야 합니다.")
+        scaled = (np.asarray(weights, dtype=np.float64) * (n / float(np.sum(weights)))).tolist()
+        prob = [1.0] * n
+        alias = list(range(n))
+        is_small = np.asarray(scaled) < 1.0
+        small = np.flatnonzero(is_small).tolist()
+        large = np.flatnonzero(~is_small).tolist()
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[s], alias[s] = scaled[s], l
+            scaled[l] -= 1.0 - scaled[s]
+            (small if scaled[l] < 1.0 else large).append(l)
+
+        self.population = population
+        self.prob = array('d', prob)
+        self.alias = array('q', alias)
+        self._n = n
+        self._random = random_source.random
+        self._prob_array = None
+        self._population_array = None
+
+    def draw(self):
+        u = self._random() * self._n
+        i = int(u)
+        return self.population[i if u - i < self.prob[i] else self.alias[i]]
+
+    def draws(self, k):
+        return [self.draw() for _ in range(k)]
+
+    def draw_indexes(self, rng, size):
+        if self._prob_array is None:
+            self._prob_array = (np.frombuffer(self.prob, dtype=np.float64), np.frombuffer(self.alias, dtype=np.int64))
+        prob, alias = self._prob_array
+        u = rng.random(size) * self._n
+        i = u.astype(np.int64)
+        return np.where(u - i < prob[i], i, alias[i])
+
+    def draw_batch(self, rng, size):
+        if self._population_array is None:
+            self._population_array = np.asarray(self.population)
+        return self._population_array[self.draw_indexes(rng, size)]
+
+# -------------------------------------------------------------------------------------
+# 4. 핫스팟 (Zipf) 분포
+
+def zipf_weights(n, skew, seed=HOTSPOT_SEED):
+    """n개 원소에 Zipf 가중치 1 / rank^skew 를 줍니다. 순위는 seed로 섞어 id 크기와 무관하게 배정합니다."""
+    ranks = np.random.default_rng(seed).permutation(n) + 1
+    return ranks.astype(np.float64) ** -skew
+
+
+def hotspot_sampler(population, skew, random_source=random):
+    """skew > 0 이면 Zipf 핫스팟 샘플러, 0이면 None (호출하는 쪽에서 균등 random.choice 사용).
+
+    skew=1.0 이면 상위 1% id가 전체 선택의 약 70%를 차지합니다 (100만 id 기준).
+    id 수만큼 원소가 있는 큰 분포를 실행 내내 뽑으므로 AliasSampler(뽑을 때 O(1))를 씁니다.
+    """
+    if not skew:
+        return None
+    return AliasSampler(population, zipf_weights(len(population), skew), random_source)
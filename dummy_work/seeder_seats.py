@@ -0,0 +1,249 @@
+# seeder_seats.py
+
+from sqlalchemy import text
+from array import array
+from bisect import bisect_left
+import random
+import numpy as np
+from seeder_ids import qualified_table_name
+from seeder_reference import STREAM_CHUNK_ROWS
+
+# -------------------------------------------------------------------------------------
+# 1. 상수 정의
+
+# 스케줄의 위치 교환 기록이 좌석 수 / DENSE_SWAP_RATIO 칸을 넘으면 dict 대신 좌석 수 길이의 배열로 바꿈
+# (dict 항목 하나는 int 객체 포함 약 100바이트, 배열 칸은 2~4바이트)
+DENSE_SWAP_RATIO = 32
+
+
+class _DenseSwaps(array):
+    """{위치: seat_ids 인덱스} dict와 같은 get/pop/items를 제공하는 위치 → 인덱스 배열.
+
+    판매 구간으로 넘어간 칸의 값은 다시 읽지 않으므로 pop은 값을 지우지 않고 반환만 합니다.
+    """
+
+    def get(self, pos, default=None):
+        return self[pos]
+
+    def pop(self, pos, default=None):
+        return self[pos]
+
+    def items(self):
+        return ((pos, index) for pos, index in enumerate(self) if pos != index)
+
+# -------------------------------------------------------------------------------------
+# 2. 스케줄별 좌석 점유 인덱스
+
+class SeatOccupancy:
+    """스케줄별로 이미 판매된 좌석을 기억하고, 빈 좌석 k개를 O(k)로 뽑아 점유 처리합니다.
+
+    스케줄마다 seat_ids의 '가상 셔플 배열'을 두고 Fisher-Yates를 k단계만 진행합니다.
+    배열 전체를 복사하지 않고 위치가 바뀐 칸만 {위치: seat_ids 인덱스} dict에 기록하므로
+    메모리는 판매된 좌석 수에 비례하고, 같은 스케줄에서 같은 좌석이 두 번 나오지 않습니다.
+    판매가 늘어 dict가 커지면 그 스케줄만 2~4바이트 배열로 바꾸므로 스케줄당 메모리는
+    좌석 수 x 배열 칸 크기를 넘지 않습니다 (레코드 수가 아무리 많아도 상한이 있음, 뽑히는 좌석은 같음).
+
+    journal(리스트)을 주면 뽑을 때마다 (schedule_id, 위치)를 기록합니다.
+    체크포인트는 이 기록만 배치마다 저장하고, 이어서 실행할 때 replay()로 같은 상태를 다시 만듭니다.
+    seat_ids는 load_reference의 array('q')를 복사하지 않고 그대로 씁니다 (리스트 등은 array('q')로 변환).
+    """
+
+    def __init__(self, seat_ids, random_source=random, journal=None):
+        self.seat_ids = seat_ids if isinstance(seat_ids, array) else array('q', seat_ids)
+        self._random = random_source
+        self._schedules = {}   # {schedule_id: [판매 좌석 수, {위치: seat_ids 인덱스}]}
+        self._sorted_seats = None   # (seat_id 정렬 array, 정렬 위치 → seat_ids 인덱스 array | None), occupy()에서 처음 쓸 때 생성
+        self.journal = journal
+        self._dense_after = len(self.seat_ids) // DENSE_SWAP_RATIO
+        self._dense_typecode = 'H' if len(self.seat_ids) <= 0xFFFF else 'I'
+
+    def _compact(self, state):
+        """위치 교환 dict가 임계값을 넘으면 좌석 수 길이의 배열로 바꿉니다."""
+        swaps = state[1]
+        if type(swaps) is dict and len(swaps) > self._dense_after:
+            dense = _DenseSwaps(self._dense_typecode, range(len(self.seat_ids)))
+            for pos, index in swaps.items():
+                dense[pos] = index
+            state[1] = dense
+
+    def remaining(self, schedule_id):
+        """스케줄의 남은 좌석 수."""
+        state = self._schedules.get(schedule_id)
+        return len(self.seat_ids) - (state[0] if state else 0)
+
+    def draw(self, schedule_id, k, ratios=None):
+        """스케줄의 빈 좌석 k개를 뽑아 점유하고 seat_id 리스트를 반환합니다.
+
+        ratios([0, 1) 난수 k개)를 주면 random 대신 그 값으로 위치를 고릅니다 (vectorized 모드).
+        """
+        state = self._schedules.get(schedule_id)
+        if state is None:
+            state = self._schedules[schedule_id] = [0, {}]
+        used, swaps = state
+        free = len(self.seat_ids) - used
+        if k > free:
+            raise RuntimeError(f"schedule_id={schedule_id}의 빈 좌석이 부족합니다. (요청: {k}, 남은 좌석: {free})")
+
+        seats = []
+        journal = self.journal
+        for t in range(k):
+            last = free - 1
+            if ratios is None:
+                pick = self._random.randrange(free)
+            else:
+                pick = min(int(ratios[t] * free), last)
+            if journal is not None:
+                journal.append((schedule_id, pick))
+            seats.append(self.seat_ids[swaps.get(pick, pick)])
+            # 뽑힌 칸에 마지막 빈 칸의 좌석을 옮기고, 마지막 칸은 판매 구간이 됨
+            swaps[pick] = swaps.pop(last, last)
+            free = last
+        state[0] = used + k
+        self._compact(state)
+        return seats
+
+    def _index_of(self, seat_id):
+        """seat_id의 seat_ids 인덱스 (이 인덱스에 없는 좌석이면 None).
+
+        seat_id 순 array에서 이분 탐색합니다. seat_ids가 이미 정렬돼 있으면(load_reference는 PK 순) 그대로 쓰고,
+        아니면 처음 한 번만 정렬 사본과 위치 array를 만듭니다 (좌석당 16바이트, dict 대신).
+        """
+        if self._sorted_seats is None:
+            ids = np.asarray(self.seat_ids, dtype=np.int64)
+            if np.all(ids[1:] > ids[:-1]):
+                self._sorted_seats = (self.seat_ids, None)
+            else:
+                order = np.argsort(ids, kind='stable')
+                self._sorted_seats = (array('q', ids[order].tobytes()), array('q', order.astype(np.int64).tobytes()))
+        sorted_ids, indexes = self._sorted_seats
+        position = bisect_left(sorted_ids, seat_id)
+        if position == len(sorted_ids) or sorted_ids[position] != seat_id:
+            return None
+        return position if indexes is None else indexes[position]
+
+    def new_bitmap(self):
+        """좌석 수만큼의 비트를 가진 빈 비트맵 (mark / occupy_bitmap 용, 좌석 8개당 1바이트)."""
+        return bytearray((len(self.seat_ids) + 7) // 8)
+
+    def mark(self, bitmap, seat_id):
+        """비트맵에 seat_id의 비트를 켭니다 (이 인덱스에 없는 좌석은 무시, 같은 좌석을 여러 번 표시해도 한 번)."""
+        index = self._index_of(seat_id)
+        if index is not None:
+            bitmap[index >> 3] |= 1 << (index & 7)
+
+    def occupy(self, schedule_id, seat_ids):
+        """이미 판매된 좌석을 점유 처리하고 점유한 수를 반환합니다 (기존 데이터에 이어 붙일 때 사용).
+
+        이 인덱스에 없는 좌석(다른 샤드 몫)과 이미 점유된 좌석은 건너뜁니다.
+        """
+        indexes = (self._index_of(seat_id) for seat_id in seat_ids)
+        return self._occupy_indexes(schedule_id, [index for index in indexes if index is not None])
+
+    def occupy_bitmap(self, schedule_id, bitmap):
+        """mark()로 표시한 비트맵의 좌석을 점유 처리하고 점유한 수를 반환합니다 (이미 점유된 좌석은 건너뜀)."""
+        bits = np.unpackbits(np.frombuffer(bytes(bitmap), dtype=np.uint8), bitorder='little')
+        return self._occupy_indexes(schedule_id, np.flatnonzero(bits).tolist())
+
+    def _occupy_indexes(self, schedule_id, indexes):
+        """seat_ids 인덱스들을 판매 구간으로 옮기고 새로 점유한 수를 반환합니다."""
+        state = self._schedules.get(schedule_id)
+        if state is None:
+            state = self._schedules[schedule_id] = [0, {}]
+        swaps = state[1]
+        free = len(self.seat_ids) - state[0]
+        # 자리를 옮긴 빈 좌석의 현재 위치 {seat_ids 인덱스: 위치}
+        moved_to = {index: pos for pos, index in swaps.items() if pos < free}
+
+        taken = 0
+        for index in indexes:
+            pos = moved_to.pop(index, None)
+            if pos is None:
+                if index >= free or swaps.get(index, index) != index:
+                    continue   # 이미 판매된 좌석
+                pos = index
+            # draw()와 같이 마지막 빈 칸의 좌석을 pos로 옮기고 마지막 칸을 판매 구간으로
+            last = free - 1
+            moved = swaps.pop(last, last)
+            if pos != last:
+                swaps[pos] = moved
+                moved_to[moved] = pos
+            free = last
+            taken += 1
+        state[0] = len(self.seat_ids) - free
+        self._compact(state)
+        return taken
+
+    def first_available(self, schedule_ids, schedule_id, k):
+        """schedule_id가 매진이면 정렬된 schedule_ids에서 그다음부터 돌며 빈 좌석이 k개 이상인 스케줄을 반환합니다.
+
+        핫스팟 분포에서는 인기 스케줄이 먼저 매진되므로 대체 스케줄을 고를 때 사용합니다 (난수 사용 없음).
+        """
+        if self.remaining(schedule_id) >= k:
+            return schedule_id
+        start = bisect_left(schedule_ids, schedule_id)
+        for offset in range(1, len(schedule_ids) + 1):
+            candidate = schedule_ids[(start + offset) % len(schedule_ids)]
+            if self.remaining(candidate) >= k:
+                return candidate
+        raise RuntimeError(f"빈 좌석이 {k}개 이상 남은 스케줄이 없습니다.")
+
+    def take_journal(self):
+        """지난 호출 이후 기록된 (schedule_id, 위치) 목록을 꺼내고 비웁니다."""
+        entries = self.journal
+        self.journal = []
+        return entries
+
+    def replay(self, entries):
+        """take_journal()로 저장해 둔 기록을 다시 적용해 점유 상태를 복원합니다 (난수 사용 없음)."""
+        for schedule_id, pick in entries:
+            state = self._schedules.get(schedule_id)
+            if state is None:
+                state = self._schedules[schedule_id] = [0, {}]
+            swaps = state[1]
+            last = len(self.seat_ids) - state[0] - 1
+            swaps[pick] = swaps.pop(last, last)
+            state[0] += 1
+            self._compact(state)
+
+
+def occupy_existing_seats(session, seat_index, up_to_id=None, chunk_rows=STREAM_CHUNK_ROWS):
+    """DB에 이미 있는 reservation_seat를 점유 인덱스에 반영하고, 반영한 마지막 reservation_seat_id를 반환합니다.
+
+    --append로 기존 데이터에 이어 붙일 때 같은 스케줄의 좌석을 다시 팔지 않도록 사용합니다 (초기화 후 실행에서는 호출하지 않음).
+    up_to_id를 주면 그 ID까지만 읽습니다 (체크포인트에서 이어서 실행할 때 실행 시작 시점의 데이터만 반영).
+    테이블이 비어 있으면(또는 up_to_id=0) 조회 없이 0을 반환합니다.
+    row는 서버 사이드 커서로 schedule_id 순으로 받아 스케줄 하나씩 좌석 비트맵에 접은 뒤 점유 처리하므로,
+    기존 row 수와 관계없이 메모리는 좌석 비트맵 하나(좌석 수 / 8 바이트)입니다.
+    """
+    table = qualified_table_name(session, 'reservation_seat')
+    if up_to_id is None:
+        up_to_id = session.execute(text(f"SELECT MAX(reservation_seat_id) FROM {table}")).scalar() or 0
+    if not up_to_id:
+        return 0
+
+    result = session.execute(
+        text(f"SELECT schedule_id, seat_id FROM {table} WHERE reservation_seat_id <= :up_to_id ORDER BY schedule_id"),
+        {'up_to_id': up_to_id}, execution_options={'stream_results': True}
+    )
+    current_schedule_id, bitmap = None, None
+    for rows in result.partitions(chunk_rows):
+        for schedule_id, seat_id in rows:
+            if schedule_id != current_schedule_id:
+                if bitmap is not None:
+                    seat_index.occupy_bitmap(current_schedule_id, bitmap)
+                current_schedule_id, bitmap = schedule_id, seat_index.new_bitmap()
+            seat_index.mark(bitmap, seat_id)
+    if bitmap is not None:
+        seat_index.occupy_bitmap(current_schedule_id, bitmap)
+    return up_to_id
+
+
+def partition_seat_ids(seat_ids, seat_partition):
+    """샤드 실행 시 (샤드 번호, 샤드 수)에 해당하는 좌석만 남깁니다.
+
+    샤드마다 서로 다른 좌석 집합을 쓰므로 프로세스 간 조율 없이도 중복 예매가 생기지 않습니다.
+    """
+    if not seat_partition:
+        return seat_ids
+    shard_index, shard_count = seat_partition
+    return seat_ids[shard_index::shard_count]
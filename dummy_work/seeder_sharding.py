@@ -0,0 +1,152 @@
+# seeder_sharding.py
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from datetime import datetime, timedelta
+import argparse
+import importlib
+import multiprocessing
+from seeder_ids import BENEFIT_ID_START, IdBlockAllocator, PK_COLUMNS, next_benefit_id
+from seeder_bulkload import disable_checks_on_connect
+
+# -------------------------------------------------------------------------------------
+# 1. 상수 정의
+
+# 트랜잭션 1건이 테이블별로 만들 수 있는 최대 row 수 (샤드별 ID 범위 크기 계산용)
+# ticket_discount는 PK가 아니라 시더가 직접 세는 benefit_id 범위입니다.
+MAX_ROWS_PER_RECORD = {
+    'reservation': 1,
+    'reservation_seat': 4,
+    'order': 1,
+    'payment': 1,
+    'ticket_discount': 4,
+}
+
+BASE_TIME_EPOCH = datetime(2025, 1, 1)   # base_time을 주지 않으면 이 시각 + seed로 기준 시각을 정함
+
+# -------------------------------------------------------------------------------------
+# 2. 샤드 계획
+
+def seed_base_time(seed):
+    """seed에서 기준 시각을 정합니다 (BASE_TIME_EPOCH + seed를 1년 이내 분 단위로).
+
+    생성 시각(created_at 등)은 모두 기준 시각에서 빼서 만들므로, 실행한 날짜와 관계없이
+    같은 seed면 같은 데이터가 나옵니다. 현재 시각 기준 데이터가 필요하면 --base-time now.
+    """
+    return BASE_TIME_EPOCH + timedelta(minutes=seed % (365 * 24 * 60))
+
+
+def parse_base_time(value):
+    """--base-time 값: ISO 형식 시각 또는 now(현재 시각)."""
+    if value == 'now':
+        return datetime.now()
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"ISO 형식 시각(예: 2025-06-01T12:00) 또는 now 여야 합니다: {value}")
+
+
+def add_base_time_argument(parser):
+    """시더 CLI에 --base-time 옵션을 추가합니다."""
+    parser.add_argument("--base-time", type=parse_base_time, default=None,
+                        help="생성 시각의 기준 (ISO 형식 또는 now, 생략 시 --seed에서 파생해 실행 날짜와 무관하게 재현)")
+
+
+def derive_shard_seed(seed, shard_index, workers):
+    """(seed, 샤드 번호)로 샤드별 난수 시드를 만듭니다. 워커가 1개면 seed를 그대로 씁니다."""
+    if workers == 1:
+        return seed
+    return (seed * 1000003 + shard_index * 7919 + 1) & 0xFFFFFFFF
+
+
+def plan_shards(num_records, workers, id_allocator, seed, base_time, benefit_id_start=BENEFIT_ID_START):
+    """num_records를 workers개 샤드로 나누고 샤드마다 겹치지 않는 ID 범위와 시드를 배정합니다.
+
+    같은 (seed, base_time, workers)와 같은 DB 시작 상태라면 항상 같은 계획이 나옵니다.
+    생성되는 데이터는 workers에 따라 달라집니다. 샤드 시드(derive_shard_seed)와 샤드별 좌석/회원 몫
+    (seat_ids[shard_index::workers])이 워커 수로 정해지므로, 같은 seed라도 --workers가 다르면
+    다른 데이터가 나옵니다 (재현하려면 --workers도 같게).
+    """
+    shards = []
+    next_benefit_id = benefit_id_start
+    base_count, remainder = divmod(num_records, workers)
+    for shard_index in range(workers):
+        shard_records = base_count + (1 if shard_index < remainder else 0)
+        if shard_records == 0:
+            continue
+        id_ranges = {
+            table: id_allocator.reserve(table, shard_records * MAX_ROWS_PER_RECORD[table])
+            for table in PK_COLUMNS
+        }
+        benefit_count = shard_records * MAX_ROWS_PER_RECORD['ticket_discount']
+        id_ranges['ticket_discount'] = range(next_benefit_id, next_benefit_id + benefit_count)
+        next_benefit_id += benefit_count
+        shards.append({
+            'shard_index': shard_index,
+            'num_records': shard_records,
+            'seed': derive_shard_seed(seed, shard_index, workers),
+            'id_ranges': id_ranges,
+            'base_time': base_time,
+            'seat_partition': (shard_index, workers),   # 샤드별 좌석 집합 (중복 예매 방지)
+        })
+    return shards
+
+# -------------------------------------------------------------------------------------
+# 3. 워커 실행
+
+def _create_engine(database_url, execution_options=None, bulk_load=False):
+    """워커 전용 엔진 (프로세스마다 자체 커넥션 사용).
+
+    execution_options는 섀도 테이블 적재(schema_translate_map) 등에 사용합니다.
+    bulk_load면 --bulk-load의 foreign_key_checks/unique_checks=0을 워커 커넥션에도 겁니다.
+    """
+    if database_url.startswith('mysql'):
+        engine = create_engine(database_url, echo=False, connect_args={"local_infile": True})
+    else:
+        engine = create_engine(database_url, echo=False)
+    if bulk_load:
+        disable_checks_on_connect(engine)
+    return engine.execution_options(**execution_options) if execution_options else engine
+
+
+def _run_shard(job):
+    """워커 프로세스: 자기 커넥션으로 배정된 샤드를 생성합니다."""
+    module_name, database_url, shard, options, execution_options, bulk_load = job
+    seeder = importlib.import_module(module_name)
+    engine = _create_engine(database_url, execution_options, bulk_load)
+    session = sessionmaker(bind=engine)()
+    try:
+        seeder.generate_dummy_data(session, shard['num_records'], options.for_shard(shard))
+    finally:
+        session.close()
+        engine.dispose()
+    return shard['shard_index'], shard['num_records']
+
+
+def run_sharded(module_name, database_url, num_records, workers, options, execution_options=None, bulk_load=False):
+    """generate_dummy_data를 workers개 프로세스로 나눠 실행하고 AUTO_INCREMENT를 보정합니다.
+
+    options(SeederOptions)는 샤드마다 for_shard()로 시드/ID 범위/좌석 몫만 바꿔 전달합니다.
+    options.base_time이 없으면 seed_base_time(options.seed)를 모든 샤드가 같이 씁니다.
+    execution_options는 모든 워커 엔진에 적용됩니다 (예: ShadowTableSwap.execution_options).
+    bulk_load는 bulk_load_mode 안에서 실행할 때 True로 넘겨 워커 커넥션의 FK/UNIQUE 검사도 끕니다.
+    """
+    seed = options.seed
+    base_time = options.base_time or seed_base_time(seed)
+    engine = _create_engine(database_url, execution_options)
+    session = sessionmaker(bind=engine)()
+    # 기존 데이터가 있으면 (--append) 현재 최대 키 다음부터 샤드별 범위를 나눔
+    shards = plan_shards(num_records, workers, IdBlockAllocator.from_session(session), seed, base_time,
+                         benefit_id_start=next_benefit_id(session))
+
+    print(f"--- {num_records}건을 {len(shards)}개 샤드로 나눠 생성 시작 (시드: {seed}) ---")
+    jobs = [(module_name, database_url, shard, options, execution_options, bulk_load) for shard in shards]
+    with multiprocessing.get_context('spawn').Pool(processes=len(shards)) as pool:
+        for shard_index, shard_records in pool.imap_unordered(_run_shard, jobs):
+            print(f"--- 샤드 {shard_index}: {shard_records}건 완료 ---")
+
+    # 샤드 사이의 빈 ID 구간은 그대로 두고, 실제 최대 PK 기준으로 AUTO_INCREMENT 보정
+    IdBlockAllocator.from_session(session).sync_auto_increment(session)
+    session.commit()
+    session.close()
+    engine.dispose()
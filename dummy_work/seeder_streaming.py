@@ -0,0 +1,135 @@
+# seeder_streaming.py
+
+from seeder_batching import AdaptiveBatchController, INITIAL_BATCH_ROWS, MIN_BATCH_ROWS
+import gc
+import os
+
+# -------------------------------------------------------------------------------------
+# 1. 상수 정의
+
+DEFAULT_MEMORY_CEILING_MB = 1024   # 스트리밍 모드의 프로세스 RSS 상한 (MB)
+RSS_CHECK_ROWS = 2000              # 배치 중간에 RSS를 다시 읽는 간격 (버퍼 row 수)
+CEILING_SHRINK = 0.5               # 상한을 넘긴 배치 다음부터 배치 row 상한에 곱하는 비율
+
+# -------------------------------------------------------------------------------------
+# 2. RSS 측정
+
+def current_rss_bytes():
+    """현재 프로세스의 RSS(바이트). /proc가 없으면 resource의 최대 RSS로 대신합니다."""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def current_rss_mb():
+    return current_rss_bytes() / 2 ** 20
+
+# -------------------------------------------------------------------------------------
+# 3. 메모리 상한 배치 컨트롤러
+
+class MemoryBoundedBatchController(AdaptiveBatchController):
+    """AdaptiveBatchController에 프로세스 RSS 상한을 더한 컨트롤러입니다 (--streaming).
+
+    상한이 묶는 것은 writer의 배치 버퍼뿐입니다. 참조 데이터(좌석/회원/스케줄 배열, 가격표)는
+    처음부터 끝까지 메모리에 있으므로 RSS는 그만큼 깔고 시작하며, 상한은 그보다 커야 합니다.
+    시더는 참조 데이터를 다 올린 뒤 check_floor()를 불러, 이 바닥 RSS가 이미 상한을 넘으면
+    배치를 줄여도 지킬 수 없으므로 생성을 시작하지 않고 바로 중단합니다.
+
+    버퍼에 RSS_CHECK_ROWS개가 쌓일 때마다 RSS를 읽어, 상한을 넘으면 배치 크기와 관계없이
+    바로 커밋해 버퍼를 비우고 그 뒤로는 배치 row 상한을 줄입니다. 커밋마다 RSS를 기록하므로
+    첫 배치 / 최대 / 마지막 배치의 RSS로 실행 중 메모리가 평탄했는지 확인할 수 있습니다.
+    ceiling_mb=None 이면 상한 없이 RSS 기록만 합니다.
+    """
+
+    def __init__(self, *args, ceiling_mb=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.ceiling_bytes = ceiling_mb * 2 ** 20 if ceiling_mb else None
+        self.ceiling_hits = 0
+        self.floor_rss = self.first_rss = self.peak_rss = self.last_rss = None
+        self._next_check = RSS_CHECK_ROWS
+
+    def __str__(self):
+        if self.ceiling_bytes is None:
+            return super().__str__()
+        return f"{super().__str__()}, RSS 상한 {self.ceiling_bytes // 2 ** 20} MB"
+
+    def check_floor(self):
+        """참조 데이터 로드 직후(배치 버퍼가 빈 상태) RSS를 바닥으로 기록하고, 이미 상한을 넘으면 RuntimeError."""
+        self.floor_rss = current_rss_bytes()
+        if self.ceiling_bytes is not None and self.floor_rss > self.ceiling_bytes:
+            raise RuntimeError(f"참조 데이터를 올린 직후 RSS {self.floor_rss / 2 ** 20:,.0f} MB가 이미 상한 "
+                               f"{self.ceiling_bytes // 2 ** 20:,} MB를 넘습니다. --memory-ceiling-mb를 늘리세요.")
+
+    def should_commit(self, writer):
+        rows = writer.pending_rows
+        if rows >= self.batch_rows:
+            return True
+        if self.ceiling_bytes is None or rows < self._next_check:
+            return False
+        self._next_check = rows + RSS_CHECK_ROWS
+        return rows >= self.min_rows and current_rss_bytes() > self.ceiling_bytes
+
+    def commit(self, writer):
+        over = self.ceiling_bytes is not None and current_rss_bytes() > self.ceiling_bytes
+        rows = super().commit(writer)
+        rss = current_rss_bytes()
+        if self.first_rss is None:
+            self.first_rss = rss
+        self.peak_rss = max(self.peak_rss or 0, rss)
+        self.last_rss = rss
+        if over:
+            # 버퍼를 비워도 상한 근처면 이후 배치를 작게 (min_rows 아래로는 줄이지 않음)
+            self.ceiling_hits += 1
+            self.max_rows = max(self.min_rows, int(self.max_rows * CEILING_SHRINK))
+            self.batch_rows = min(self.batch_rows, self.max_rows)
+        self._next_check = RSS_CHECK_ROWS
+        return rows
+
+    def rss_summary(self):
+        """(첫 배치, 최대, 마지막 배치) 커밋 직후 RSS(MB). 커밋 전이면 None."""
+        if self.first_rss is None:
+            return None
+        return tuple(round(value / 2 ** 20, 1) for value in (self.first_rss, self.peak_rss, self.last_rss))
+
+# -------------------------------------------------------------------------------------
+# 4. GC 관리
+
+def freeze_reference_objects():
+    """참조 데이터 로드가 끝난 뒤 호출. 지금까지 만든 객체를 GC 추적 대상에서 빼 세대별 수집 비용을 줄입니다.
+
+    참조 배열/매핑, ORM 매퍼, Faker 같은 실행 내내 살아 있는 객체를 full GC 때마다 다시 훑지 않게 됩니다.
+    """
+    gc.collect()
+    gc.freeze()
+
+
+def unfreeze_reference_objects():
+    gc.unfreeze()
+
+# -------------------------------------------------------------------------------------
+# 5. CLI 연동
+
+def add_streaming_arguments(parser):
+    """시더 CLI에 스트리밍(메모리 상한) 옵션을 추가합니다."""
+    parser.add_argument("--streaming", action="store_true",
+                        help="배치 버퍼를 RSS 상한 안에서 커밋하는 모드 (core/load_data). 참조 데이터는 그대로 전부 메모리에 올리므로 "
+                             "RSS가 레코드 수에 따라 늘지 않을 뿐 일정한 크기의 파이프라인은 아님")
+    parser.add_argument("--memory-ceiling-mb", type=int, default=DEFAULT_MEMORY_CEILING_MB,
+                        help="스트리밍 모드의 프로세스 RSS 상한(MB), 넘으면 배치를 바로 커밋하고 배치 크기를 줄임")
+
+
+def create_streaming_controller(args):
+    """CLI 인자로 MemoryBoundedBatchController를 만듭니다 (create_batch_controller와 같은 배치 옵션).
+
+    --batch-rows 고정 크기여도 RSS 상한을 넘으면 MIN_BATCH_ROWS까지는 일찍 커밋할 수 있습니다.
+    """
+    if args.batch_rows:
+        return MemoryBoundedBatchController(target_seconds=None, initial_rows=args.batch_rows,
+                                            min_rows=min(args.batch_rows, MIN_BATCH_ROWS), max_rows=args.batch_rows,
+                                            ceiling_mb=args.memory_ceiling_mb)
+    return MemoryBoundedBatchController(target_seconds=args.batch_target_seconds, max_rows=args.batch_max_rows,
+                                        initial_rows=min(INITIAL_BATCH_ROWS, args.batch_max_rows),
+                                        ceiling_mb=args.memory_ceiling_mb)
@@ -0,0 +1,260 @@
+# seeder_writer.py
+
+from sqlalchemy import insert, text
+from datetime import datetime
+import os
+import tempfile
+from seeder_ids import PK_COLUMNS, qualified_table_name
+from seeder_money import decimal_rows, decimal_values, format_cents, money_columns
+from seeder_pipeline import PipelinedRowWriter
+
+# -------------------------------------------------------------------------------------
+# 1. 상수 정의
+
+WRITE_MODE_ORM = "orm"    # ORM 엔티티 + session.add_all (기존 방식)
+WRITE_MODE_CORE = "core"  # 테이블별 튜플 수집 + Core executemany (multi-row VALUES)
+WRITE_MODE_LOAD_DATA = "load_data"  # 테이블별 TSV 청크 + LOAD DATA LOCAL INFILE (MySQL 전용)
+WRITE_MODES = [WRITE_MODE_ORM, WRITE_MODE_CORE, WRITE_MODE_LOAD_DATA]
+
+# LOAD DATA용 TSV 이스케이프 (MySQL 기본 FIELDS ESCAPED BY '\\')
+TSV_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+# -------------------------------------------------------------------------------------
+# 2. 배치 writer
+
+class OrmRowWriter:
+    """기존 ORM 경로. row마다 엔티티를 만들고 배치 커밋 시 session.add_all 합니다.
+
+    금액 컬럼(DECIMAL(…,2)) 값은 모든 writer에서 정수 센트로 받고, DB에 보낼 때만 변환합니다.
+
+    id_allocator가 없으면 PK가 필요한 부모 테이블(PK_COLUMNS)은 즉시 flush하여
+    AUTO_INCREMENT 값을 읽어옵니다.
+    """
+
+    def __init__(self, session, id_allocator=None):
+        self.session = session
+        self.id_allocator = id_allocator
+        self.parent_entities = [] # 자식보다 먼저 INSERT 할 부모 엔티티
+        self.entities_to_add = []
+        self.row_counts = {}
+        self.pending_rows = 0     # 아직 커밋하지 않은 row 수 (배치 크기 판단용)
+
+    def add(self, model, **values):
+        """row 하나를 추가하고, 부모 테이블이면 할당된 PK를 반환합니다."""
+        table_name = model.__tablename__
+        self.row_counts[table_name] = self.row_counts.get(table_name, 0) + 1
+        self.pending_rows += 1
+        entity = model(**decimal_values(values, money_columns(model.__table__)))
+
+        pk_column = PK_COLUMNS.get(table_name)
+        if pk_column is None:
+            self.entities_to_add.append(entity)
+            return None
+
+        if self.id_allocator:
+            setattr(entity, pk_column, self.id_allocator.next_id(table_name))
+            self.parent_entities.append(entity)
+        else:
+            self.session.add(entity)
+            self.session.flush()
+        return getattr(entity, pk_column)
+
+    def has_pending_rows(self):
+        return bool(self.parent_entities or self.entities_to_add)
+
+    def flush_batch(self):
+        """버퍼에 쌓인 엔티티를 부모 → 자식 순서로 전송합니다 (커밋은 하지 않음)."""
+        if self.parent_entities:
+            self.session.add_all(self.parent_entities)
+            self.session.flush()
+            self.parent_entities = []
+        self.session.add_all(self.entities_to_add)
+        self.session.flush()
+        self.entities_to_add = []
+        self.pending_rows = 0
+
+    def commit_batch(self):
+        """버퍼에 쌓인 엔티티를 전송하고 커밋합니다."""
+        self.flush_batch()
+        self.session.commit()
+
+    def close(self, sync_auto_increment=True):
+        """남은 row를 커밋하고 AUTO_INCREMENT를 보정합니다."""
+        if self.has_pending_rows():
+            self.commit_batch()
+        if self.id_allocator and sync_auto_increment:
+            self.id_allocator.sync_auto_increment(self.session)
+
+
+class CoreRowWriter:
+    """ORM 객체 없이 테이블별로 튜플을 모아 Core executemany로 전송합니다.
+
+    unit-of-work / identity map을 거치지 않으므로 PK는 반드시 id_allocator로 미리 할당합니다.
+    table_order는 부모 → 자식 INSERT 순서(테이블명 리스트)입니다.
+    """
+
+    def __init__(self, session, id_allocator, table_order):
+        if id_allocator is None:
+            raise ValueError("CoreRowWriter는 id_allocator(PK 사전 할당)가 필요합니다.")
+        self.session = session
+        self.id_allocator = id_allocator
+        self.table_order = list(table_order)
+        self.rows = {}          # {model: [tuple, ...]}
+        self.row_counts = {}
+        self.pending_rows = 0   # 아직 커밋하지 않은 row 수 (배치 크기 판단용)
+        self._columns = {}      # {model: (컬럼명, ...)}
+        self._defaults = {}     # {model: {컬럼명: 기본값}}, 배치마다 다시 계산
+
+    def _layout(self, model):
+        """테이블 컬럼 순서와 이번 배치에서 쓸 컬럼 기본값을 반환합니다."""
+        if model not in self._columns:
+            self._columns[model] = tuple(column.name for column in model.__table__.columns)
+            self.rows[model] = []
+        if model not in self._defaults:
+            defaults = {}
+            for column in model.__table__.columns:
+                default = column.default
+                if default is None:
+                    defaults[column.name] = None
+                elif default.is_callable:
+                    # datetime.now 같은 callable 기본값은 배치당 한 번만 평가
+                    defaults[column.name] = default.arg(None)
+                else:
+                    defaults[column.name] = default.arg
+            self._defaults[model] = defaults
+        return self._columns[model], self._defaults[model]
+
+    def add(self, model, **values):
+        """row 하나를 튜플로 버퍼에 추가하고, 부모 테이블이면 할당된 PK를 반환합니다."""
+        table_name = model.__tablename__
+        pk_column = PK_COLUMNS.get(table_name)
+        pk_value = None
+        if pk_column is not None:
+            pk_value = self.id_allocator.next_id(table_name)
+            values[pk_column] = pk_value
+
+        columns, defaults = self._layout(model)
+        self.rows[model].append(tuple(values[c] if c in values else defaults[c] for c in columns))
+        self.row_counts[table_name] = self.row_counts.get(table_name, 0) + 1
+        self.pending_rows += 1
+        return pk_value
+
+    def has_pending_rows(self):
+        return any(self.rows.values())
+
+    def take_batch(self):
+        """버퍼의 row를 부모 → 자식 순서의 [(model, 컬럼명, rows), ...]로 꺼내고 버퍼를 비웁니다."""
+        batch = []
+        for model in sorted(self.rows, key=lambda m: self.table_order.index(m.__tablename__)):
+            rows = self.rows[model]
+            if rows:
+                batch.append((model, self._columns[model], rows))
+                self.rows[model] = []
+        self._defaults = {}
+        self.pending_rows = 0
+        return batch
+
+    def write_batch(self, session, batch):
+        """take_batch()로 꺼낸 배치를 테이블마다 한 번씩 executemany 합니다 (커밋은 하지 않음)."""
+        for model, columns, rows in batch:
+            session.execute(insert(model.__table__), decimal_rows(columns, rows, money_columns(model.__table__)))
+
+    def flush_batch(self):
+        """버퍼에 쌓인 row를 부모 → 자식 순서로 전송합니다 (커밋은 하지 않음)."""
+        self.write_batch(self.session, self.take_batch())
+
+    def commit_batch(self):
+        """배치를 전송하고 커밋합니다."""
+        self.flush_batch()
+        self.session.commit()
+
+    def close(self, sync_auto_increment=True):
+        """남은 row를 커밋하고 AUTO_INCREMENT를 보정합니다."""
+        if self.has_pending_rows():
+            self.commit_batch()
+        if sync_auto_increment:
+            self.id_allocator.sync_auto_increment(self.session)
+
+
+def _tsv_money(cents):
+    """정수 센트 금액을 LOAD DATA 값으로 변환합니다 (Decimal을 거치지 않고 바로 문자열)."""
+    return '\\N' if cents is None else format_cents(cents)
+
+
+def _tsv_value(value):
+    """LOAD DATA 기본 형식(탭 구분, NULL은 \\N)으로 값을 변환합니다."""
+    if value is None:
+        return '\\N'
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    if isinstance(value, bool):
+        return '1' if value else '0'
+    if isinstance(value, str):
+        return value.translate(TSV_ESCAPES)
+    return str(value)
+
+
+class LoadDataRowWriter(CoreRowWriter):
+    """테이블별 row를 TSV로 흘려 LOAD DATA LOCAL INFILE로 적재합니다.
+
+    전체 데이터셋을 디스크에 먼저 쓰지 않도록 배치마다 테이블별 임시 TSV 청크 파일을 만들어
+    바로 적재하고 삭제합니다. 서버의 local_infile=ON 과
+    클라이언트 연결의 local_infile=True (pymysql connect_args)가 필요합니다.
+    """
+
+    def __init__(self, session, id_allocator, table_order, tmp_dir=None):
+        super().__init__(session, id_allocator, table_order)
+        if session.get_bind().dialect.name != 'mysql':
+            raise ValueError("load_data 모드는 MySQL/MariaDB에서만 사용할 수 있습니다.")
+        self.tmp_dir = tmp_dir
+
+    def _load_table(self, session, model, columns, rows):
+        """한 테이블의 row 청크를 TSV 파일로 쓰고 LOAD DATA로 적재합니다."""
+        with tempfile.NamedTemporaryFile('w', suffix='.tsv', dir=self.tmp_dir, delete=False,
+                                         encoding='utf-8', newline='\n') as chunk_file:
+            money = money_columns(model.__table__)
+            formatters = [_tsv_money if c in money else _tsv_value for c in columns]
+            for row in rows:
+                chunk_file.write('\t'.join(format_value(value) for format_value, value in zip(formatters, row)))
+                chunk_file.write('\n')
+            chunk_path = chunk_file.name
+        try:
+            path = chunk_path.replace('\\', '/').replace("'", "\\'")
+            session.execute(text(
+                f"LOAD DATA LOCAL INFILE '{path}' INTO TABLE {qualified_table_name(session, model.__tablename__)} "
+                f"CHARACTER SET utf8mb4 FIELDS TERMINATED BY '\\t' LINES TERMINATED BY '\\n' "
+                f"({', '.join(f'`{c}`' for c in columns)})"
+            ))
+        finally:
+            os.remove(chunk_path)
+
+    def write_batch(self, session, batch):
+        """take_batch()로 꺼낸 배치를 테이블마다 TSV 청크 하나씩 적재합니다 (커밋은 하지 않음)."""
+        for model, columns, rows in batch:
+            self._load_table(session, model, columns, rows)
+
+
+def create_row_writer(session, write_mode, id_allocator, table_order, metrics=None, writer_threads=0,
+                      async_writer=None):
+    """write_mode에 맞는 writer를 생성합니다.
+
+    table_order(부모 → 자식 INSERT 순서)는 테이블별로 버퍼를 모으는 Core 계열 writer만 사용합니다.
+    async_writer(seeder_async.AsyncTableWriter)를 주면 Core 방식으로 모은 배치를 async 커넥션들로 씁니다.
+    writer_threads > 0 이면 생성과 DB 쓰기를 겹치는 파이프라인 writer로,
+    metrics(SeederMetrics)가 있으면 그 바깥을 계측 writer로 감쌉니다.
+    """
+    if async_writer is not None:
+        if writer_threads:
+            raise ValueError("async writer와 writer 스레드 파이프라인은 함께 사용할 수 없습니다.")
+        writer = async_writer.row_writer(session, id_allocator, table_order)
+    elif write_mode == WRITE_MODE_ORM:
+        writer = OrmRowWriter(session, id_allocator)
+    elif write_mode == WRITE_MODE_CORE:
+        writer = CoreRowWriter(session, id_allocator, table_order)
+    elif write_mode == WRITE_MODE_LOAD_DATA:
+        writer = LoadDataRowWriter(session, id_allocator, table_order)
+    else:
+        raise ValueError(f"지원하지 않는 write_mode 입니다: {write_mode} (사용 가능: {WRITE_MODES})")
+    if writer_threads:
+        writer = PipelinedRowWriter(writer, writer_threads)
+    return metrics.instrument(writer) if metrics else writer
@@ -0,0 +1,7 @@
+# conftest.py
+
+import os
+import sys
+
+# 시더 모듈은 dummy_work/ 에서 바로 import 하는 평면 구조
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,139 @@
+# test_discounts.py
+
+import random
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from seeder_discounts import DiscountPolicyIndex
+from seeder_reference import load_reference
+
+
+def _policy_rows(seed=42, num_partners=20, per_partner=12):
+    r = random.Random(seed)
+    rows = []
+    for partner in range(num_partners):
+        for _ in range(per_partner):
+            fixed = r.random() < 0.5
+            rows.append((len(rows) + 1, f"005{partner:02d}",
+                         r.choice([100000, 200000, 300000]) if fixed else None,
+                         None if fixed else r.choice([0.05, 0.1, 0.15]),
+                         r.choice([0, 1000000, 2000000, 3000000]),
+                         r.choice([None, 500000, 1000000])))
+    r.shuffle(rows)
+    return rows
+
+
+def _linear_scan(rows, partner, amount):
+    """기존 방식: 제휴사 정책 리스트를 돌며 최소 금액 조건 확인."""
+    return {row[0] for row in rows if row[1] == partner and amount >= row[4]}
+
+
+def _linear_discount(row, amount):
+    policy_id, partner, fixed, rate, min_price, cap = row
+    if amount < min_price:
+        return 0
+    discount = fixed if fixed is not None else round(amount * rate)
+    return discount if cap is None else min(discount, cap)
+
+
+def test_eligible_matches_linear_scan():
+    rows = _policy_rows()
+    index = DiscountPolicyIndex(rows)
+    r = random.Random(1)
+    for partner in list(index.groups) + ['없는 제휴사']:
+        for amount in [0, 999999, 1000000, 2999999, 3000000, r.randint(0, 6000000)]:
+            eligible = {index.policy_ids[position] for position in index.eligible(partner, amount)}
+            assert eligible == _linear_scan(rows, partner, amount)
+
+
+def test_discount_matches_linear_rule():
+    rows = _policy_rows()
+    index = DiscountPolicyIndex(rows)
+    for row in rows:
+        for amount in (0, 1500000, 2500000, 5000000):
+            assert index.discount(row[0], amount) == _linear_discount(row, amount)
+    assert index.discount(-1, 5000000) == 0
+
+
+def test_pick_uses_one_draw_like_random_choice():
+    rows = _policy_rows()
+    index = DiscountPolicyIndex(rows)
+    partner = next(iter(index.groups))
+    picked = [index.pick(partner, random.Random(seed)) for seed in range(50)]
+    assert all(index.policy_ids[position] in {row[0] for row in rows if row[1] == partner} for position in picked)
+    first, second = random.Random(3), random.Random(3)
+    index.pick(partner, first)
+    second.randrange(len([row for row in rows if row[1] == partner]))
+    assert first.random() == second.random()
+    assert index.pick('없는 제휴사') is None
+
+
+def test_discounts_draw_only_eligible_policies():
+    rows = _policy_rows()
+    index = DiscountPolicyIndex(rows)
+    by_id = {row[0]: row for row in rows}
+    r = random.Random(2)
+    groups = [r.choice(list(index.groups)) for _ in range(500)]
+    amounts = [r.randint(0, 4000000) for _ in range(500)]
+    positions, discounts = index.discounts(groups, amounts, random.Random(5))
+    for group, amount, position, discount in zip(groups, amounts, positions, discounts):
+        if position is None:
+            assert not _linear_scan(rows, group, amount) and discount == 0
+        else:
+            policy_id = index.policy_ids[position]
+            assert policy_id in _linear_scan(rows, group, amount)
+            assert discount == _linear_discount(by_id[policy_id], amount)
+    assert index.discounts(groups, amounts, random.Random(5)) == (positions, discounts)
+    assert index.discounts(['없는 제휴사'], [5000000]) == ([None], [0])
+
+
+def test_from_discount_policies_without_partner_groups():
+    rows = [(1, 'A', 1000, None, 0, None), (2, 'B', None, 10, 20000, None)]   # 원 단위
+    index = DiscountPolicyIndex.from_discount_policies(rows, group_by_partner=False)
+    assert list(index.groups) == [None]
+    assert [index.policy_ids[position] for position in index.eligible(None, 1000000)] == [1]
+    assert len(index.eligible(None, 2000000)) == 2
+
+
+def test_groups_keep_first_seen_order():
+    rows = _policy_rows()
+    assert list(DiscountPolicyIndex(rows).groups) == list(dict.fromkeys(row[1] for row in rows))
+    assert len(DiscountPolicyIndex(rows)) == len(rows)
+
+
+def _same_index(a, b):
+    assert a.policy_ids == b.policy_ids and list(a.groups) == list(b.groups)
+    for amount in (0, 500000, 1500000, 5000000):
+        assert [a.discount_at(k, amount) for k in range(len(a))] == [b.discount_at(k, amount) for k in range(len(b))]
+
+
+def test_column_indexes_match_row_indexes():
+    policies = [(1, '00501', 1000, None, 10000, None), (2, '00502', None, 10, 0, 5000),
+                (3, '00501', 0, 15, 20000, 0), (4, '00503', None, None, None, None)]
+    coupons = [(1, 0, 2000, None, 10000), (2, 1, 12.5, 3000, 0), (3, 1, 10, None, None), (4, 0, None, None, 0)]
+    engine = create_engine('sqlite://')
+    with Session(engine) as session:
+        session.execute(text("CREATE TABLE discount_policy (policy_id INTEGER PRIMARY KEY, partner_id TEXT, discount_amount NUMERIC, "
+                             "discount_percent NUMERIC, min_price NUMERIC, max_benefit_amount NUMERIC)"))
+        session.execute(text("CREATE TABLE coupon (coupon_id INTEGER PRIMARY KEY, discount_type INTEGER, discount_value NUMERIC, "
+                             "max_discount_amount NUMERIC, min_price NUMERIC)"))
+        session.execute(text("INSERT INTO discount_policy VALUES (:a, :b, :c, :d, :e, :f)"),
+                        [dict(zip('abcdef', row)) for row in policies])
+        session.execute(text("INSERT INTO coupon VALUES (:a, :b, :c, :d, :e)"), [dict(zip('abcde', row)) for row in coupons])
+
+        for percent_rate, group_by_partner in ((0.01, True), (1.0, False)):
+            _same_index(DiscountPolicyIndex.from_policy_columns(load_reference(session, 'discount_policy', cache_dir=''),
+                                                                percent_rate, group_by_partner),
+                        DiscountPolicyIndex.from_discount_policies(policies, percent_rate, group_by_partner))
+        _same_index(DiscountPolicyIndex.from_coupon_columns(load_reference(session, 'coupon', cache_dir='')),
+                    DiscountPolicyIndex.from_coupons(coupons))
+
+
+@pytest.mark.parametrize('amount, percent, max_benefit, expected', [
+    (0, 10, None, 100000),       # 할인 금액 0 → 비율 할인
+    (None, 10, 0, 100000),       # 한도 0 → 한도 없음
+    (5000, None, None, 500000),
+])
+def test_from_discount_policies_zero_means_unset(amount, percent, max_benefit, expected):
+    index = DiscountPolicyIndex.from_discount_policies([(1, 'P', amount, percent, 0, max_benefit)])
+    assert index.discount(1, 1000000) == expected
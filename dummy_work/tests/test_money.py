@@ -0,0 +1,49 @@
+# test_money.py
+
+from decimal import Decimal
+import pytest
+from seeder_money import ceil_percent_to_won, cents_to_decimal, format_cents, percent_of, to_cents
+
+
+@pytest.mark.parametrize('value, cents', [
+    (Decimal('123.45'), 12345),
+    (Decimal('0.01'), 1),
+    (Decimal('-5.50'), -550),
+    (19.99, 1999),     # float 1999.0000000000002도 반올림
+    (0.29, 29),        # 0.29 * 100 = 28.999999999999996
+    (1000, 100000),
+    (None, None),
+])
+def test_to_cents(value, cents):
+    assert to_cents(value) == cents
+
+
+def test_cents_round_trip():
+    for cents in (0, 1, 99, 12345, -5, 3000000):
+        assert to_cents(cents_to_decimal(cents)) == cents
+    assert cents_to_decimal(12345) == Decimal('123.45')
+    assert format_cents(-5) == '-0.05'
+
+
+@pytest.mark.parametrize('cents, percent, expected', [
+    (10000, 10, 1000),
+    (12345, 10, 1234),      # 1234.5 → 짝수 반올림
+    (12355, 10, 1236),      # 1235.5 → 짝수 반올림
+    (999, 12.5, 125),       # 124.875
+    (1, 5, 0),
+    (0, 15, 0),
+])
+def test_percent_of(cents, percent, expected):
+    assert percent_of(cents, percent) == expected
+
+
+def test_amount_plus_discount_equals_origin():
+    for cents in range(0, 200000, 37):
+        discount = percent_of(cents, 10)
+        assert (cents - discount) + discount == cents
+        assert cents_to_decimal(cents - discount) + cents_to_decimal(discount) == cents_to_decimal(cents)
+
+
+def test_ceil_percent_to_won():
+    assert ceil_percent_to_won(1234500, 5) == 61800   # 617.25원 → 618원
+    assert ceil_percent_to_won(1000000, 5) == 50000
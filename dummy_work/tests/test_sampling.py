@@ -0,0 +1,66 @@
+# test_sampling.py
+
+from array import array
+import random
+import numpy as np
+import pytest
+from seeder_sampling import AliasSampler, WeightedSampler, hotspot_sampler, zipf_weights
+
+METHODS = ['CARD', 'BANK', 'MOBILE']
+WEIGHTS = [70, 10, 20]
+
+
+def test_weighted_sampler_matches_random_choices():
+    random.seed(42)
+    expected = [random.choices(METHODS, weights=WEIGHTS, k=1)[0] for _ in range(1000)]
+    random.seed(42)
+    sampler = WeightedSampler(METHODS, WEIGHTS)
+    assert [sampler.draw() for _ in range(1000)] == expected
+    random.seed(42)
+    assert sampler.draws(1000) == expected
+
+
+def test_weighted_sampler_batch_matches_numpy_choice():
+    expected = np.random.default_rng(7).choice(3, 1000, p=np.asarray(WEIGHTS) / sum(WEIGHTS))
+    actual = WeightedSampler(range(3), WEIGHTS).draw_indexes(np.random.default_rng(7), 1000)
+    assert (actual == expected).all()
+
+
+@pytest.mark.parametrize('sampler_class', [WeightedSampler, AliasSampler])
+def test_distribution(sampler_class):
+    sampler = sampler_class(range(3), WEIGHTS)
+    counts = np.bincount(sampler.draw_indexes(np.random.default_rng(1), 200000), minlength=3) / 200000
+    assert counts == pytest.approx([0.7, 0.1, 0.2], abs=0.01)
+
+
+@pytest.mark.parametrize('sampler_class', [WeightedSampler, AliasSampler])
+def test_same_seed_same_values(sampler_class):
+    first = sampler_class(METHODS, WEIGHTS, random.Random(3))
+    second = sampler_class(METHODS, WEIGHTS, random.Random(3))
+    assert first.draws(500) == second.draws(500)
+    assert (first.draw_batch(np.random.default_rng(5), 500) == second.draw_batch(np.random.default_rng(5), 500)).all()
+
+
+def test_alias_sampler_scalar_distribution():
+    sampler = AliasSampler(METHODS, WEIGHTS, random.Random(11))
+    draws = sampler.draws(100000)
+    assert [draws.count(method) / 100000 for method in METHODS] == pytest.approx([0.7, 0.1, 0.2], abs=0.01)
+
+
+def test_hotspot_sampler_follows_zipf():
+    ids = array('q', range(1, 10001))
+    assert hotspot_sampler(ids, 0) is None
+    sampler = hotspot_sampler(ids, 1.0)
+    picks = sampler.draw_batch(np.random.default_rng(2), 200000)
+    weights = zipf_weights(len(ids), 1.0)
+    hottest = int(np.argmax(weights))
+    assert (picks == ids[hottest]).mean() == pytest.approx(weights[hottest] / weights.sum(), rel=0.05)
+    # 순위는 HOTSPOT_SEED로 정하므로 실행마다 같은 id가 인기
+    assert (zipf_weights(len(ids), 1.0) == weights).all()
+
+
+def test_rejects_mismatched_weights():
+    with pytest.raises(ValueError):
+        WeightedSampler(METHODS, [1, 2])
+    with pytest.raises(ValueError):
+        AliasSampler([], [])
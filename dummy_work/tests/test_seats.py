@@ -0,0 +1,102 @@
+# test_seats.py
+
+import random
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from seeder_seats import SeatOccupancy, occupy_existing_seats
+
+SEAT_IDS = list(range(101, 301))   # 좌석 200개, 판매가 늘면 배열로 바뀌는 구간까지 확인
+
+
+def _sell_out(index, schedule_id, k=3):
+    sold = []
+    while index.remaining(schedule_id) >= k:
+        sold += index.draw(schedule_id, k)
+    return sold + index.draw(schedule_id, index.remaining(schedule_id))
+
+
+def test_draw_never_repeats_a_seat():
+    index = SeatOccupancy(SEAT_IDS, random.Random(42))
+    for schedule_id in (1, 2):
+        sold = _sell_out(index, schedule_id)
+        assert sorted(sold) == SEAT_IDS
+    with pytest.raises(RuntimeError):
+        index.draw(1, 1)
+
+
+def test_draw_with_ratios_never_repeats_a_seat():
+    index = SeatOccupancy(SEAT_IDS)
+    rng = random.Random(7)
+    sold = []
+    while index.remaining(1):
+        k = min(4, index.remaining(1))
+        sold += index.draw(1, k, ratios=[rng.random() for _ in range(k)])
+    assert sorted(sold) == SEAT_IDS
+
+
+def test_occupy_skips_sold_and_foreign_seats():
+    index = SeatOccupancy(SEAT_IDS, random.Random(1))
+    drawn = index.draw(1, 50)
+    assert index.occupy(1, drawn[:10] + [101, 102, 999]) == len({101, 102} - set(drawn))
+    remaining = _sell_out(index, 1)
+    assert not set(remaining) & (set(drawn) | {101, 102})
+    assert sorted(remaining + drawn + [seat for seat in (101, 102) if seat not in drawn]) == SEAT_IDS
+
+
+def test_occupy_with_unsorted_seat_ids():
+    seat_ids = SEAT_IDS[::-1]
+    index = SeatOccupancy(seat_ids, random.Random(4))
+    assert index.occupy(1, [300, 101, 101, 5]) == 2
+    assert not {101, 300} & set(_sell_out(index, 1))
+
+
+def test_occupy_bitmap_matches_occupy():
+    seats = [101, 150, 150, 299, 999]
+    by_list = SeatOccupancy(SEAT_IDS)
+    by_bitmap = SeatOccupancy(SEAT_IDS)
+    bitmap = by_bitmap.new_bitmap()
+    for seat_id in seats:
+        by_bitmap.mark(bitmap, seat_id)
+    assert len(bitmap) == 25
+    assert by_bitmap.occupy_bitmap(1, bitmap) == by_list.occupy(1, sorted(set(seats))) == 3
+    assert by_bitmap.remaining(1) == by_list.remaining(1) == len(SEAT_IDS) - 3
+
+
+def test_occupy_existing_seats_streams_by_schedule():
+    engine = create_engine('sqlite://')
+    with Session(engine) as session:
+        session.execute(text("CREATE TABLE reservation_seat (reservation_seat_id INTEGER PRIMARY KEY, schedule_id INTEGER, seat_id INTEGER)"))
+        index = SeatOccupancy(SEAT_IDS, random.Random(3))
+        assert occupy_existing_seats(session, index) == 0   # 빈 테이블
+
+        rows = [(1, 2, 101), (2, 1, 105), (3, 2, 102), (4, 1, 106), (5, 3, 107)]
+        for row in rows:
+            session.execute(text("INSERT INTO reservation_seat VALUES (:id, :schedule_id, :seat_id)"),
+                            dict(zip(('id', 'schedule_id', 'seat_id'), row)))
+        assert occupy_existing_seats(session, index, up_to_id=4, chunk_rows=2) == 4
+        assert [index.remaining(schedule_id) for schedule_id in (1, 2, 3)] == [198, 198, 200]
+        sold = _sell_out(index, 1) + index.draw(2, 198)
+        assert not {105, 106} & set(sold[:198]) and not {101, 102} & set(sold[198:])
+
+        fresh = SeatOccupancy(SEAT_IDS)
+        assert occupy_existing_seats(session, fresh) == 5
+        assert fresh.remaining(3) == 199
+
+
+def test_replay_restores_state():
+    journal = []
+    original = SeatOccupancy(SEAT_IDS, random.Random(5), journal=journal)
+    for schedule_id in (1, 2, 1, 3):
+        original.draw(schedule_id, 40)
+
+    restored = SeatOccupancy(SEAT_IDS, random.Random(99))
+    restored.replay(original.take_journal())
+    assert original.journal == []
+    for schedule_id in (1, 2, 3):
+        assert restored.remaining(schedule_id) == original.remaining(schedule_id)
+
+    # 같은 난수로 이어서 뽑으면 같은 좌석
+    original._random, restored._random = random.Random(8), random.Random(8)
+    for schedule_id in (1, 2, 3):
+        assert restored.draw(schedule_id, 30) == original.draw(schedule_id, 30)